@@ -0,0 +1,78 @@
+# Compares the multi-resolution STFT against separate segmenters and spectrograms,
+# for the torch backend including the backward pass of a spectral loss.
+#
+#   python benchmarks/multi_resolution_stft.py
+
+import timeit
+import numpy as np
+from typing import Any, Callable, List, Tuple
+
+from libsegmenter.Segmenter import Segmenter
+from libsegmenter.TransformSelector import TransformSelector
+from libsegmenter.Window import Window
+from libsegmenter.WindowSelector import WindowSelector
+from libsegmenter.transforms.MultiResolutionSTFT import MultiResolutionSTFT
+
+
+def bench(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """Returns the best wall time of `fn` in seconds, after a warm-up call."""
+    fn()
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def cases(
+    backend: str, windows: List[Window], x: Any
+) -> Tuple[Callable[[], Any], Callable[[], Any]]:
+    """Returns the separate and the shared computation for a backend."""
+    segmenters = [Segmenter(window, backend=backend) for window in windows]
+    spectrogram = TransformSelector("spectrogram", backend=backend)
+    stft = MultiResolutionSTFT(backend, windows)
+
+    def convert(x: Any) -> Any:
+        if backend == "torch":
+            import torch
+
+            return torch.tensor(x).requires_grad_(True)
+        return x
+
+    def loss(ys: List[Any]) -> Any:
+        if backend == "torch":
+            sum(y.abs().mean() for y in ys).backward()
+        return ys
+
+    def separate() -> Any:
+        xA = convert(x)
+        return loss([spectrogram.forward(seg.segment(xA)) for seg in segmenters])
+
+    def shared() -> Any:
+        return loss(stft.forward(convert(x)))
+
+    return separate, shared
+
+
+def main() -> None:
+    """Prints the timings of both approaches for a batch of 10 s signals."""
+    windows = [WindowSelector("hann75", "wola", n) for n in [512, 1024, 2048]]
+    x = np.random.randn(16, 16000 * 10).astype(np.float32)
+
+    backends = ["numpy"]
+    try:
+        import torch  # noqa: F401
+
+        backends.append("torch")
+    except ImportError:
+        pass
+
+    print(f"{'backend':<12} {'separate [ms]':>14} {'shared [ms]':>12} {'speedup':>8}")
+    for backend in backends:
+        separate, shared = cases(backend, windows, x)
+        t_separate = bench(separate) * 1e3
+        t_shared = bench(shared) * 1e3
+        print(
+            f"{backend:<12} {t_separate:>14.2f} {t_shared:>12.2f} "
+            + f"{t_separate / t_shared:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
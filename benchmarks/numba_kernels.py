@@ -0,0 +1,64 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Compares the numba kernels of the NumPy backend against the pure NumPy path.
+#
+#   python benchmarks/numba_kernels.py
+
+import timeit
+import numpy as np
+from typing import Any, Callable
+
+from libsegmenter.WindowSelector import WindowSelector
+from libsegmenter.backends.SegmenterNumpy import SegmenterNumpy
+
+
+def bench(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """Returns the best wall time of `fn` in seconds, after a warm-up call."""
+    fn()  # warm up, includes jit compilation
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main() -> None:
+    """Prints the timings of both paths for a batch of 10 s signals."""
+    window = WindowSelector("hann75", "wola", 512)
+    x = np.random.randn(16, 16000 * 10).astype(np.float32)
+
+    print(f"{'method':<12} {'numpy [ms]':>12} {'numba [ms]':>12} {'speedup':>8}")
+    segmenters = {
+        use_numba: SegmenterNumpy(window, use_numba=use_numba)
+        for use_numba in [False, True]
+    }
+    frames = segmenters[False].segment(x)
+    cases = {
+        "segment": lambda seg: lambda: seg.segment(x),
+        "unsegment": lambda seg: lambda: seg.unsegment(frames),
+        "roundtrip": lambda seg: lambda: seg.unsegment(seg.segment(x)),
+        "process": lambda seg: lambda: seg.process(x, lambda f: f),
+    }
+    for name, case in cases.items():
+        t_numpy = bench(case(segmenters[False])) * 1e3
+        t_numba = bench(case(segmenters[True])) * 1e3
+        print(
+            f"{name:<12} {t_numpy:>12.2f} {t_numba:>12.2f} {t_numpy / t_numba:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# Compares the partial spectrum against the full spectrogram for a few bins and a
+# contiguous band, and the methods for a zoomed band of fractional bins.
+#
+#   python benchmarks/partial_spectrum.py
+
+import timeit
+import numpy as np
+from typing import Any, Callable, Dict, List, Tuple
+
+from libsegmenter.Segmenter import Segmenter
+from libsegmenter.TransformSelector import TransformSelector
+from libsegmenter.WindowSelector import WindowSelector
+
+
+def bench(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """Returns the best wall time of `fn` in seconds, after a warm-up call."""
+    fn()
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main() -> None:
+    """Prints the timings for a batch of 10 s signals segmented with 1024 samples."""
+    window = WindowSelector("hann75", "wola", 1024)
+    x = np.random.randn(16, 16000 * 10).astype(np.float32)
+    s = Segmenter(window).segment(x)
+
+    spectrogram = TransformSelector("spectrogram")
+    t_full = bench(lambda: spectrogram.forward(s)) * 1e3
+    print(f"{'case':<24} {'method':>8} {'time [ms]':>10} {'speedup':>8}")
+    print(f"{'full spectrogram':<24} {'rfft':>8} {t_full:>10.2f} {1.0:>7.1f}x")
+
+    zoom = {"band": (100.0, 132.0), "num_bins": 256}
+    cases: List[Tuple[str, Dict[str, Any]]] = [
+        ("4 bins", {"bins": [64, 128, 200, 301]}),
+        ("32 bin band", {"band": (100.0, 131.0)}),
+        ("256 fractional bins", zoom),
+        ("256 fractional bins", {**zoom, "method": "dft"}),
+    ]
+    for name, kwargs in cases:
+        partial = TransformSelector("partial_spectrum", window=window, **kwargs)
+        t = bench(lambda p=partial: p.forward(s)) * 1e3
+        print(f"{name:<24} {partial.method:>8} {t:>10.2f} {t_full / t:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
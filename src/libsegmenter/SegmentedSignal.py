@@ -0,0 +1,189 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import numpy as np
+from typing import Any, Iterator, Tuple, cast
+
+from libsegmenter.backends.common import compute_num_segments
+
+
+class SegmentedSignal:
+    """
+    A lazily segmented view of a signal.
+
+    Behaves like the (batch_size, num_segments, segment_size) output of `segment`,
+    but frames are only windowed when they are indexed, iterated over or exported
+    in full through `__array__` or DLPack.
+
+    Attributes:
+        segmenter (Any): The segmenter used to materialize frames.
+        signal (Any): The signal being segmented, either 1D (sequence) or 2D (batch).
+        shape (Tuple[int, ...]): The shape of the segmented signal.
+
+    """
+
+    def __init__(self, segmenter: Any, signal: Any) -> None:
+        """
+        Initializes the SegmentedSignal instance.
+
+        Args:
+            segmenter (Any): A segmenter instance of any backend.
+            signal (Any): Input signal of the segmenter's backend, either 1D
+                (sequence) or 2D (batch).
+
+        """
+        if len(signal.shape) not in {1, 2}:
+            raise ValueError(
+                f"Only supports 1D or 2D inputs, provided {len(signal.shape)}D."
+            )
+
+        window = segmenter.window
+        segment_size = window.analysis_window.shape[-1]
+        num_segments = compute_num_segments(
+            signal.shape[-1], window.hop_size, segment_size
+        )
+
+        if num_segments <= 0:
+            raise ValueError(
+                "Input signal is too short for segmentation with the given num_samples "
+                + f"({signal.shape[-1]}), hop size "
+                + f"({window.hop_size}) and segment size "
+                + f"({segment_size})."
+            )
+
+        self.segmenter = segmenter
+        self.signal = signal
+        self.shape: Tuple[int, ...] = (
+            (signal.shape[0], num_segments, segment_size)
+            if len(signal.shape) == 2
+            else (num_segments, segment_size)
+        )
+
+    @property
+    def ndim(self) -> int:
+        """The number of dimensions of the segmented signal."""
+        return len(self.shape)
+
+    @property
+    def dtype(self) -> Any:
+        """The datatype of the segmented signal."""
+        return self.signal.dtype
+
+    @property
+    def num_segments(self) -> int:
+        """The number of segments."""
+        return self.shape[-2]
+
+    def __len__(self) -> int:
+        """Returns the size of the first dimension."""
+        return self.shape[0]
+
+    def __getitem__(self, key: Any) -> Any:
+        """
+        Materializes the indexed frames.
+
+        The batch and frame dimensions support integers, slices and integer or
+        boolean arrays, the segment dimension supports any index of the backend.
+
+        Args:
+            key (Any): The index.
+
+        Returns:
+            The selected (windowed) frames.
+
+        """
+        key = cast(Tuple[Any, ...], key if isinstance(key, tuple) else (key,))
+        if any(k is Ellipsis or k is None for k in key):
+            raise IndexError("Ellipsis and newaxis are not supported.")
+        if len(key) > self.ndim:
+            raise IndexError(f"Too many indices, the segmented signal is {self.ndim}D.")
+
+        signal = self.signal
+        if self.ndim == 3:
+            batch_key = key[0] if len(key) > 0 else slice(None)
+            key = key[1:]
+            if not (isinstance(batch_key, slice) and batch_key == slice(None)):
+                signal = signal[batch_key]
+
+        frame_key = key[0] if len(key) > 0 else slice(None)
+        if isinstance(frame_key, (int, np.integer)):
+            frame = int(cast(int | np.integer[Any], frame_key))
+            y = self.segmenter.segment(signal, frames=[frame])[..., 0, :]
+        elif isinstance(frame_key, slice):
+            y = self.segmenter.segment(signal, frames=frame_key)
+        else:
+            frames = np.asarray(frame_key)
+            if frames.dtype == np.bool_:
+                frames = np.flatnonzero(frames)
+            y = self.segmenter.segment(signal, frames=frames)
+
+        return y[..., key[1]] if len(key) > 1 else y
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the first dimension, materializing one entry at a time."""
+        for k in range(len(self)):
+            yield self[k]
+
+    def blocks(self, block_size: int) -> Iterator[Any]:
+        """
+        Iterates over the frames in blocks.
+
+        Args:
+            block_size (int): The number of frames per block.
+
+        Returns:
+            An iterator over the materialized blocks, each of shape (batch_size,
+            block_size, segment_size). The last block may be shorter.
+
+        """
+        if block_size <= 0:
+            raise ValueError(f"The block size must be positive, received {block_size}.")
+
+        for start in range(0, self.num_segments, block_size):
+            stop = min(start + block_size, self.num_segments)
+            yield self.segmenter.segment(self.signal, frames=slice(start, stop))
+
+    def materialize(self) -> Any:
+        """
+        Materializes all frames.
+
+        Returns:
+            Segmented data of shape (batch_size, num_segments, segment_size).
+
+        """
+        return self.segmenter.segment(self.signal)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> Any:
+        """Materializes all frames as a numpy array."""
+        _ = copy
+        return np.asarray(self.materialize(), dtype=dtype)
+
+    def __dlpack__(self, *args: Any, **kwargs: Any) -> Any:
+        """Materializes all frames and exports them through DLPack."""
+        return self.materialize().__dlpack__(*args, **kwargs)
+
+    def __dlpack_device__(self) -> Any:
+        """Returns the DLPack device of the materialized frames."""
+        if hasattr(self.signal, "__dlpack_device__"):
+            return self.signal.__dlpack_device__()
+        return self.materialize().__dlpack_device__()
+
+    def __repr__(self) -> str:
+        """Returns a description of the segmented signal."""
+        return f"SegmentedSignal(shape={self.shape}, dtype={self.dtype})"
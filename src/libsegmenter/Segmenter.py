@@ -19,7 +19,7 @@
 
 from typing import Any
 
-BACKENDS = ["torch", "tensorflow", "numpy", "octave"]
+BACKENDS = ["torch", "tensorflow", "numpy", "jax", "octave", "auto"]
 
 
 def Segmenter(*args: Any, backend: str = "numpy", **kwargs: Any) -> Any:
@@ -28,7 +28,8 @@ def Segmenter(*args: Any, backend: str = "numpy", **kwargs: Any) -> Any:
 
     Args:
         backend (str, optional): The backend to use. Supported options:
-            ["numpy", "torch", "tensorflow"]. Defaults to "numpy".
+            ["numpy", "torch", "tensorflow", "jax", "auto"]. The "auto" backend
+            dispatches every call on the type of its input. Defaults to "numpy".
         *args (Any): Additional positional arguments to pass to the segmenter.
         **kwargs (Any): Additional keyword arguments to pass to the segmenter.
 
@@ -58,4 +59,14 @@ def Segmenter(*args: Any, backend: str = "numpy", **kwargs: Any) -> Any:
 
         return SegmenterTensorFlow(*args, **kwargs)
 
+    if backend == "jax":
+        from libsegmenter.backends.SegmenterJax import SegmenterJax
+
+        return SegmenterJax(*args, **kwargs)
+
+    if backend == "auto":
+        from libsegmenter.backends.SegmenterDispatch import SegmenterDispatch
+
+        return SegmenterDispatch(*args, **kwargs)
+
     raise NotImplementedError(f"The '{backend}' backend is not implemented yet.")
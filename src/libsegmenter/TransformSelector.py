@@ -31,9 +31,12 @@ def TransformSelector(
 
     Args:
         transform (str): The transform to use. Supported options:
-            ["bpd", "magnitude_phase", "spectrogram"].
+            ["bpd", "magnitude_phase", "mdct", "mel", "partial_spectrum", "polyphase",
+            "spectrogram"].
         backend (str, optional): The backend to use. Supported options:
-            ["numpy", "torch", "tensorflow"]. Defaults to "numpy".
+            ["numpy", "torch", "tensorflow", "jax"]. Defaults to "numpy". The "bpd",
+            "mdct", "mel" and "polyphase" transforms are not availible for "jax", the
+            "partial_spectrum" transform is only availible for "numpy" and "torch".
         *args (Any): Additional positional arguments to pass to the segmenter.
         **kwargs (Any): Additional keyword arguments to pass to the segmenter.
 
@@ -55,6 +58,26 @@ def TransformSelector(
 
         return MagnitudePhase(*args, **kwargs, backend=backend)
 
+    if transform == "mdct":
+        from libsegmenter.transforms.MDCT import MDCT
+
+        return MDCT(*args, **kwargs, backend=backend)
+
+    if transform == "mel":
+        from libsegmenter.transforms.Mel import Mel
+
+        return Mel(*args, **kwargs, backend=backend)
+
+    if transform == "partial_spectrum":
+        from libsegmenter.transforms.PartialSpectrum import PartialSpectrum
+
+        return PartialSpectrum(*args, **kwargs, backend=backend)
+
+    if transform == "polyphase":
+        from libsegmenter.transforms.Polyphase import Polyphase
+
+        return Polyphase(*args, **kwargs, backend=backend)
+
     if transform == "bpd":
         from libsegmenter.transforms.BPD import BPD
 
@@ -21,10 +21,12 @@ from libsegmenter.Segmenter import Segmenter
 from libsegmenter.WindowSelector import WindowSelector
 from libsegmenter.AsymmetricWindowSelector import AsymmetricWindowSelector
 from libsegmenter.TransformSelector import TransformSelector
+from libsegmenter.pipelines.tf_frames import tf_frames
 
 __all__ = [
     "Segmenter",
     "WindowSelector",
     "TransformSelector",
     "AsymmetricWindowSelector",
+    "tf_frames",
 ]
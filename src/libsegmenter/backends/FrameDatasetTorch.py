@@ -0,0 +1,215 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import torch
+import numpy as np
+from typing import Any, Iterator, List, Sequence, Tuple, cast
+
+from libsegmenter.backends.common import compute_num_segments
+from libsegmenter.backends.SegmenterTorch import SegmenterTorch
+from libsegmenter.TransformSelector import TransformSelector
+from libsegmenter.Window import Window
+from libsegmenter.util.read_wav import read_wav, pcm_to_float
+
+
+class FrameDatasetTorch(torch.utils.data.IterableDataset):  # pyright: ignore
+    """
+    A PyTorch iterable dataset streaming windowed frames from WAV files.
+
+    Files are memory-mapped and read in hop-aligned blocks of frames, so no file is
+    ever decoded into memory as a whole. Every channel of a file is treated as an
+    independent signal. When iterated from a `DataLoader` with multiple workers, the
+    files are sharded across the workers.
+
+    By default every frame of every file is yielded, either as a windowed segment or
+    as the output of a transform. With `crop_frames`, random crops of consecutive
+    frames are sampled from every file instead.
+
+    Attributes:
+        paths (List[str]): The WAV files to stream from.
+        window (Window): The window used for segmentation.
+
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[str],
+        window: Window,
+        transform: str | None = None,
+        block_frames: int = 256,
+        crop_frames: int | None = None,
+        crops_per_file: int = 1,
+        shuffle_buffer: int = 0,
+        shuffle_files: bool = False,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Initializes the FrameDatasetTorch instance.
+
+        Args:
+            paths (Sequence[str]): The WAV files to stream from.
+            window (Window): A window object containing segmentation parameters.
+            transform (str | None): The transform to apply to the frames, as accepted
+                by `TransformSelector`. Defaults to None (windowed segments).
+            block_frames (int): The number of frames read from a file at once, bounds
+                the memory used per worker. Defaults to 256.
+            crop_frames (int | None): When set, random crops of this many consecutive
+                frames are yielded instead of single frames. Defaults to None.
+            crops_per_file (int): The number of crops sampled per file and channel.
+                Defaults to 1.
+            shuffle_buffer (int): The size of the shuffle buffer, 0 disables
+                shuffling of the yielded items. Defaults to 0.
+            shuffle_files (bool): Whether to shuffle the order of the files every
+                epoch. Defaults to False.
+            seed (int | None): Seed of the random cropping and shuffling. Defaults to
+                None.
+
+        """
+        super().__init__()  # pyright: ignore
+        if block_frames < 1:
+            raise ValueError(
+                f"Expected a positive block size, received {block_frames}."
+            )
+        if crop_frames is not None and crop_frames < 1:
+            raise ValueError(f"Expected a positive crop size, received {crop_frames}.")
+
+        self.paths: List[str] = list(paths)
+        self.window = window
+        self.block_frames = block_frames
+        self.crop_frames = crop_frames
+        self.crops_per_file = crops_per_file
+        self.shuffle_buffer = shuffle_buffer
+        self.shuffle_files = shuffle_files
+        self.seed = seed
+        # the file order is shared by all workers, so it is seeded once here
+        self._file_seed = (
+            seed
+            if seed is not None
+            else int(np.random.SeedSequence().generate_state(1)[0])
+        )
+
+        self._segmenter = SegmenterTorch(window)
+        self._transform = (
+            TransformSelector(transform, "torch") if transform is not None else None
+        )
+        self._epoch = 0
+
+    def set_epoch(self, epoch: int) -> None:
+        """
+        Sets the epoch, which reseeds the random cropping and shuffling.
+
+        Args:
+            epoch (int): The epoch number.
+
+        """
+        self._epoch = epoch
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterates over the frames (or crops) of the files of this worker.
+
+        Yields:
+            A tensor of shape (segment_size,), or (crop_frames, segment_size) when
+            cropping, or the transform output of that frame / crop.
+
+        """
+        worker = torch.utils.data.get_worker_info()
+        worker_id = worker.id if worker is not None else 0
+        num_workers = worker.num_workers if worker is not None else 1
+
+        rng = np.random.default_rng(
+            None if self.seed is None else (self.seed, self._epoch, worker_id)
+        )
+        paths = self.paths
+        if self.shuffle_files:
+            # shuffle before sharding so workers see a different split every epoch
+            order = np.random.default_rng((self._file_seed, self._epoch)).permutation(
+                len(paths)
+            )
+            paths = [paths[int(k)] for k in order]
+
+        items = (
+            item
+            for path in paths[worker_id::num_workers]
+            for item in self._read(path, rng)
+        )
+        if self.shuffle_buffer <= 0:
+            yield from items
+            return
+
+        buffer: List[Any] = []
+        for item in items:
+            if len(buffer) < self.shuffle_buffer:
+                buffer.append(item)
+                continue
+            k = int(rng.integers(len(buffer)))
+            yield buffer[k]
+            buffer[k] = item
+
+        for k in rng.permutation(len(buffer)):
+            yield buffer[k]
+
+    def _read(self, path: str, rng: np.random.Generator) -> Iterator[Any]:
+        _, data = read_wav(path)
+        hop_size = self.window.hop_size
+        segment_size = self.window.analysis_window.shape[-1]
+        num_segments = compute_num_segments(data.shape[-1], hop_size, segment_size)
+
+        if self.crop_frames is None:
+            for start in range(0, max(num_segments, 0), self.block_frames):
+                block = self._frames(data, start, self.block_frames)
+                for channel in range(data.shape[0]):
+                    for frame in range(_length(block)):
+                        yield _index(block, channel, frame)
+            return
+
+        if num_segments < self.crop_frames:
+            return
+        for _ in range(self.crops_per_file):
+            start = int(rng.integers(num_segments - self.crop_frames + 1))
+            block = self._frames(data, start, self.crop_frames)
+            for channel in range(data.shape[0]):
+                yield _index(block, channel)
+
+    def _frames(self, data: Any, start: int, num_frames: int) -> Any:
+        # smallest hop-aligned span yielding num_frames segments, see
+        # compute_num_segments for why it depends on the window overlap
+        hop_size = self.window.hop_size
+        segment_size = self.window.analysis_window.shape[-1]
+        offset = 0 if segment_size % hop_size > 0 else 1
+        num_samples = (num_frames + segment_size // hop_size - offset) * hop_size
+
+        # copies the block out of the read-only memory map
+        begin = start * hop_size
+        x = torch.tensor(pcm_to_float(data[:, begin : begin + num_samples]))
+        frames = self._segmenter.segment(x)
+        if self._transform is None:
+            return frames
+        return self._transform.forward(frames)
+
+
+def _length(block: Any) -> int:
+    frames = cast(torch.Tensor, block[0] if isinstance(block, tuple) else block)
+    return frames.shape[1]
+
+
+def _index(block: Any, *key: int) -> Any:
+    if isinstance(block, tuple):
+        return tuple(b[key] for b in cast(Tuple[torch.Tensor, ...], block))
+    return block[key]
@@ -0,0 +1,114 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import Any, Dict
+
+from libsegmenter.Window import Window
+from libsegmenter.util.to_backend import backend_of
+
+
+class SegmenterDispatch:
+    """
+    A segmenter routing every call to the backend matching the type of its input.
+
+    The backend segmenters are created on first use and cached, so NumPy arrays,
+    PyTorch tensors, TensorFlow tensors and JAX arrays can be mixed freely with a
+    single segmenter.
+
+    Attributes:
+        window (Window): A class containing hop size, and windows.
+
+    """
+
+    def __init__(self, window: Window) -> None:
+        """
+        Initializes the SegmenterDispatch instance.
+
+        Args:
+            window (Window): A window object containing segmentation parameters.
+
+        """
+        self.window = window
+        self._segmenters: Dict[str, Any] = {}
+
+    def backend(self, name: str) -> Any:
+        """
+        Returns the cached segmenter of a backend.
+
+        Args:
+            name (str): The backend. Supported options:
+                ["numpy", "torch", "tensorflow", "jax"].
+
+        Returns:
+            The segmenter of the backend.
+
+        """
+        if name not in self._segmenters:
+            from libsegmenter.Segmenter import Segmenter
+
+            self._segmenters[name] = Segmenter(self.window, backend=name)
+        return self._segmenters[name]
+
+    def dispatch(self, x: Any) -> Any:
+        """
+        Returns the segmenter matching the type of an input.
+
+        Args:
+            x (Any): A NumPy array, PyTorch tensor, TensorFlow tensor or JAX array,
+                or a list of them (as accepted by the ragged methods).
+
+        Returns:
+            The segmenter of the backend of the input.
+
+        """
+        if isinstance(x, (list, tuple)) and len(x) > 0:  # pyright: ignore
+            x = x[0]  # pyright: ignore
+        return self.backend(backend_of(x))
+
+    def segment(self, x: Any, *args: Any, **kwargs: Any) -> Any:
+        """Segments the input, see `SegmenterNumpy.segment`."""
+        return self.dispatch(x).segment(x, *args, **kwargs)
+
+    def unsegment(self, y: Any, *args: Any, **kwargs: Any) -> Any:
+        """Unsegments the input, see `SegmenterNumpy.unsegment`."""
+        return self.dispatch(y).unsegment(y, *args, **kwargs)
+
+    def segment_lazy(self, x: Any) -> Any:
+        """Creates a lazily segmented view, see `SegmenterNumpy.segment_lazy`."""
+        return self.dispatch(x).segment_lazy(x)
+
+    def frame_statistics(self, x: Any) -> Any:
+        """Computes per-frame statistics, see `SegmenterNumpy.frame_statistics`."""
+        return self.dispatch(x).frame_statistics(x)
+
+    def segment_packed(self, x: Any, *args: Any, **kwargs: Any) -> Any:
+        """Segments a ragged batch, see `SegmenterNumpy.segment_packed`."""
+        return self.dispatch(x).segment_packed(x, *args, **kwargs)
+
+    def segment_padded(self, x: Any, *args: Any, **kwargs: Any) -> Any:
+        """Segments a ragged batch, see `SegmenterNumpy.segment_padded`."""
+        return self.dispatch(x).segment_padded(x, *args, **kwargs)
+
+    def unsegment_packed(self, y: Any, *args: Any, **kwargs: Any) -> Any:
+        """Unsegments a ragged batch, see `SegmenterNumpy.unsegment_packed`."""
+        return self.dispatch(y).unsegment_packed(y, *args, **kwargs)
+
+    def unsegment_padded(self, y: Any, *args: Any, **kwargs: Any) -> Any:
+        """Unsegments a ragged batch, see `SegmenterNumpy.unsegment_padded`."""
+        return self.dispatch(y).unsegment_padded(y, *args, **kwargs)
@@ -0,0 +1,189 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+from numpy.typing import NDArray
+from typing import Sequence, Any, cast
+
+from libsegmenter.backends.common import (
+    compute_num_segments,
+    compute_num_samples,
+    compute_frame_indices,
+)
+from libsegmenter.Window import Window
+from libsegmenter.SegmentedSignal import SegmentedSignal
+
+
+class SegmenterJax:
+    """
+    A JAX-based segmenter for input data using windowing techniques.
+
+    Supports Weighted Overlap-Add (WOLA) and Overlap-Add (OLA) methods. The frame
+    geometry only depends on the (static) input shape, so `segment` and `unsegment`
+    are pure functions that can be used under `jax.jit`, `jax.vmap` and `jax.grad`.
+    Frame selections passed as `frames` must be static (i.e. not traced) as well.
+
+    Attributes:
+        window (Window): A class containing hop size, segment size, and windows.
+
+    """
+
+    def __init__(self, window: Window) -> None:
+        """
+        Initializes the SegmenterJax instance.
+
+        Args:
+            window (Window): A window object containing segmentation parameters.
+
+        """
+        self.window = window
+
+    def _sample_indices(self, frame_idxs: NDArray[np.int64]) -> NDArray[np.int64]:
+        # static (num_frames, segment_size) indices of the samples of every frame
+        segment_size = self.window.analysis_window.shape[-1]
+        return cast(
+            NDArray[np.int64],
+            frame_idxs[:, np.newaxis] * self.window.hop_size
+            + np.arange(segment_size)[np.newaxis, :],
+        )
+
+    def segment(
+        self,
+        x: jax.Array,
+        frames: slice | Sequence[int] | NDArray[Any] | None = None,
+    ) -> jax.Array:
+        """
+        Segments the input array into overlapping windows.
+
+        Args:
+            x (jax.Array): Input array, either 1D (sequence) or 2D (batch).
+            frames (slice | Sequence[int] | NDArray[Any] | None): Optional static
+                selection of frames to compute. Only the selected frames are
+                windowed, in the order given. Defaults to all frames.
+
+        Returns:
+            Segmented array of shape (batch_size, num_segments, segment_size), where
+            num_segments is the number of selected frames.
+
+        Raises:
+            ValueError: If input dimensions are invalid.
+
+        """
+        if x.ndim not in {1, 2}:
+            raise ValueError(f"Only supports 1D or 2D inputs, provided {x.ndim}D.")
+
+        num_segments = compute_num_segments(
+            x.shape[-1], self.window.hop_size, self.window.analysis_window.shape[-1]
+        )
+
+        if num_segments <= 0:
+            raise ValueError(
+                "Input signal is too short for segmentation with the given parameters."
+            )
+
+        frame_idxs = (
+            compute_frame_indices(frames, num_segments)
+            if frames is not None
+            else np.arange(num_segments)
+        )
+
+        # Windowing as a single gather
+        analysis_window = jnp.asarray(  # pyright: ignore
+            self.window.analysis_window, dtype=x.dtype
+        )
+        return x[..., self._sample_indices(frame_idxs)] * analysis_window
+
+    def segment_lazy(self, x: jax.Array) -> SegmentedSignal:
+        """
+        Creates a lazily segmented view of the input signal.
+
+        Frames are only windowed when they are indexed, see `SegmentedSignal`.
+
+        Args:
+            x (jax.Array): Input array, either 1D (sequence) or 2D (batch).
+
+        Returns:
+            A `SegmentedSignal` of shape (batch_size, num_segments, segment_size).
+
+        """
+        return SegmentedSignal(self, x)
+
+    def unsegment(
+        self,
+        y: jax.Array,
+        frames: slice | Sequence[int] | NDArray[Any] | None = None,
+    ) -> jax.Array:
+        """
+        Reconstructs the original signal from segmented data using synthesis windowing.
+
+        Args:
+            y (jax.Array): Segmented data with shape (batch_size, num_segments,
+                segment_size) or (num_segments, segment_size) for a single sequence.
+            frames (slice | Sequence[int] | NDArray[Any] | None): Optional static
+                frame indices of the segments in `y`, as passed to `segment`. The
+                frames are overlap-added into the time span they cover, i.e. the
+                output starts at sample `min(frames) * hop_size`. Defaults to
+                consecutive frames starting at zero.
+
+        Returns:
+            Reconstructed signal.
+
+        """
+        if self.window.synthesis_window is None:
+            raise ValueError("Given windowing scheme does not support unsegmenting.")
+
+        if y.ndim not in {2, 3}:
+            raise ValueError(f"Only supports 2D or 3D inputs, provided {y.ndim}D.")
+
+        num_segments = y.shape[-2]
+        segment_size = y.shape[-1]
+
+        # frames span, relative to the first frame
+        frame_idxs = np.arange(num_segments)
+        num_frames = num_segments
+        if frames is not None:
+            frame_idxs = compute_frame_indices(frames, None)
+            if frame_idxs.shape[0] != num_segments:
+                raise ValueError(
+                    f"Received ({frame_idxs.shape[0]}) frame indices for "
+                    + f"({num_segments}) segments."
+                )
+            frame_idxs = frame_idxs - frame_idxs.min()
+            num_frames = int(frame_idxs.max()) + 1
+
+        num_samples = compute_num_samples(
+            num_frames, self.window.hop_size, segment_size
+        )
+
+        if num_samples <= 0:
+            raise ValueError(
+                "Invalid segment structure, possibly due to incorrect windowing "
+                + "parameters."
+            )
+
+        # Overlap-add as a single scatter-add (segment sum) over the sample indices
+        synthesis_window = jnp.asarray(  # pyright: ignore
+            self.window.synthesis_window, dtype=y.dtype
+        )
+        x = jnp.zeros((*y.shape[:-2], num_samples), dtype=y.dtype)  # pyright: ignore
+        return x.at[..., self._sample_indices(frame_idxs).reshape(-1)].add(
+            (y * synthesis_window).reshape(*y.shape[:-2], -1)
+        )
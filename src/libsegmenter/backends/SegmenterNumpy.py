@@ -17,10 +17,19 @@
 # IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 import numpy as np
+import scipy.ndimage
+import scipy.signal
 from numpy.typing import NDArray
-from typing import TypeVar
-from libsegmenter.backends.common import compute_num_segments, compute_num_samples
+from typing import TypeVar, Sequence, Any, Callable, Dict, List, Tuple, cast
+from libsegmenter.backends.common import (
+    compute_num_segments,
+    compute_num_samples,
+    compute_frame_indices,
+    compute_packed_offsets,
+)
 from libsegmenter.Window import Window
+from libsegmenter.SegmentedSignal import SegmentedSignal
+from libsegmenter.backends._kernels import select_kernels
 
 T = TypeVar("T", bound=np.generic)
 
@@ -29,32 +38,45 @@ class SegmenterNumpy:
     """
     A class for segmenting and reconstructing input data using windowing techniques.
 
-    Supports Weighted Overlap-Add (WOLA) and Overlap-Add (OLA) methods.
+    Supports Weighted Overlap-Add (WOLA) and Overlap-Add (OLA) methods. Consecutive
+    frames of float32 and float64 signals are framed and overlap-added by compiled
+    numba kernels when numba is installed. Numba is imported on first use.
 
     Attributes:
         window (Window): A class containing hop size, segment size, and windows.
 
     """
 
-    def __init__(self, window: Window) -> None:
+    def __init__(self, window: Window, use_numba: bool | None = None) -> None:
         """
         Initializes the SegmenterNumpy instance.
 
         Args:
             window (Window): A window object containing segmentation parameters.
+            use_numba (bool | None): Whether to use the numba kernels. Defaults to
+                None, which uses them when numba is installed.
 
         """
         self.window = window
+        self._frame, self._overlap_add = select_kernels(use_numba)
 
-    def segment(self, x: NDArray[T]) -> NDArray[T]:
+    def segment(
+        self,
+        x: NDArray[T],
+        frames: slice | Sequence[int] | NDArray[Any] | None = None,
+    ) -> NDArray[T]:
         """
         Segments the input signal into overlapping windows using the window parameters.
 
         Args:
             x (np.ndarray): Input array, either 1D (sequence) or 2D (batch).
+            frames (slice | Sequence[int] | NDArray[Any] | None): Optional selection
+                of frames to compute. Only the selected frames are windowed, in the
+                order given. Defaults to all frames.
 
         Returns:
-            Segmented data of shape (batch_size, num_segments, segment_size).
+            Segmented data of shape (batch_size, num_segments, segment_size), where
+            num_segments is the number of selected frames.
 
         Raises:
             ValueError: If types are incorrect.
@@ -82,19 +104,34 @@ class SegmenterNumpy:
                 + f"({self.window.analysis_window.shape[-1]})."
             )
 
-        # Pre-allocation
-        y = np.zeros(
-            (
-                batch_size if batch_size is not None else 1,
-                num_segments,
-                self.window.analysis_window.shape[-1],
-            ),
-            dtype=x.dtype,
+        frame_idxs = (
+            compute_frame_indices(frames, num_segments)
+            if frames is not None
+            else np.arange(num_segments)
         )
 
+        shape = (
+            batch_size if batch_size is not None else 1,
+            frame_idxs.shape[0],
+            self.window.analysis_window.shape[-1],
+        )
+        if _is_consecutive(frame_idxs) and np.issubdtype(x.dtype, np.floating):
+            y = np.empty(shape, dtype=x.dtype)
+            self._frame(
+                x,
+                self.window.analysis_window.astype(x.dtype),
+                self.window.hop_size,
+                int(frame_idxs[0]),
+                y,
+            )
+            return y.squeeze(0) if batch_size is None else y
+
+        # Pre-allocation
+        y = np.zeros(shape, dtype=x.dtype)
+
         # Windowing
-        for k in range(num_segments):
-            start_idx = k * self.window.hop_size
+        for k, frame_idx in enumerate(frame_idxs):
+            start_idx = frame_idx * self.window.hop_size
             y[:, k, :] = np.multiply(
                 x[:, start_idx : start_idx + self.window.analysis_window.shape[-1]],
                 self.window.analysis_window,
@@ -102,7 +139,26 @@ class SegmenterNumpy:
 
         return y.squeeze(0) if batch_size is None else y
 
-    def unsegment(self, y: NDArray[T]) -> NDArray[T]:
+    def segment_lazy(self, x: NDArray[T]) -> SegmentedSignal:
+        """
+        Creates a lazily segmented view of the input signal.
+
+        Frames are only windowed when they are indexed, see `SegmentedSignal`.
+
+        Args:
+            x (np.ndarray): Input array, either 1D (sequence) or 2D (batch).
+
+        Returns:
+            A `SegmentedSignal` of shape (batch_size, num_segments, segment_size).
+
+        """
+        return SegmentedSignal(self, x)
+
+    def unsegment(
+        self,
+        y: NDArray[T],
+        frames: slice | Sequence[int] | NDArray[Any] | None = None,
+    ) -> NDArray[T]:
         """
         Reconstructs the original signal from segmented data using synthesis windowing.
 
@@ -110,6 +166,11 @@ class SegmenterNumpy:
             y (np.ndarray): Segmented data with shape (batch_size, num_segments,
                             segment_size) or (num_segments, segment_size) for a single
                             sequence.
+            frames (slice | Sequence[int] | NDArray[Any] | None): Optional frame
+                indices of the segments in `y`, as passed to `segment`. The frames
+                are overlap-added into the time span they cover, i.e. the output
+                starts at sample `min(frames) * hop_size`. Defaults to consecutive
+                frames starting at zero.
 
         Returns:
             Reconstructed signal.
@@ -128,8 +189,21 @@ class SegmenterNumpy:
         if batch_size is None:
             y = y.reshape(1, num_segments, -1)  # Convert to batch format
 
+        # frames span, relative to the first frame
+        frame_idxs: NDArray[np.int64] = np.arange(num_segments, dtype=np.int64)
+        num_frames = num_segments
+        if frames is not None:
+            frame_idxs = compute_frame_indices(frames, None)
+            if frame_idxs.shape[0] != num_segments:
+                raise ValueError(
+                    f"Received ({frame_idxs.shape[0]}) frame indices for "
+                    + f"({num_segments}) segments."
+                )
+            frame_idxs = frame_idxs - frame_idxs.min()
+            num_frames = int(frame_idxs.max()) + 1
+
         num_samples = compute_num_samples(
-            num_segments, self.window.hop_size, segment_size
+            num_frames, self.window.hop_size, segment_size
         )
 
         if num_samples <= 0:
@@ -143,11 +217,357 @@ class SegmenterNumpy:
             (batch_size if batch_size is not None else 1, num_samples), dtype=y.dtype
         )
 
+        if _is_consecutive(frame_idxs) and np.issubdtype(y.dtype, np.floating):
+            self._overlap_add(
+                y,
+                self.window.synthesis_window.astype(y.dtype),
+                self.window.hop_size,
+                0,
+                x,
+            )
+            return x.squeeze(0) if batch_size is None else x
+
         # Vectorized accumulation
-        for k in range(num_segments):
-            start_idx = k * self.window.hop_size
+        for k, frame_idx in enumerate(frame_idxs):
+            start_idx = frame_idx * self.window.hop_size
             x[:, start_idx : start_idx + segment_size] += np.multiply(
                 y[:, k, :], self.window.synthesis_window
             )
 
         return x.squeeze(0) if batch_size is None else x
+
+    def process(
+        self,
+        x: NDArray[T],
+        callback: Callable[[NDArray[T]], NDArray[T]],
+        block_frames: int = 256,
+    ) -> NDArray[T]:
+        """
+        Segments, processes and unsegments the input signal in one pass over blocks.
+
+        Equivalent to `unsegment(callback(segment(x)))`, but only one block of frames
+        is materialized at a time: every block is framed into a reused buffer, passed
+        to the callback and overlap-added into the output right away.
+
+        Args:
+            x (np.ndarray): Input array, either 1D (sequence) or 2D (batch).
+            callback (Callable[[np.ndarray], np.ndarray]): Called with every block of
+                frames of shape (batch_size, num_frames, segment_size), must return
+                frames of the same shape. The block buffer is reused, so the callback
+                must not keep a reference to it.
+            block_frames (int): The number of frames per block. Defaults to 256.
+
+        Returns:
+            Reconstructed signal, as returned by `unsegment`.
+
+        """
+        if self.window.synthesis_window is None:
+            raise ValueError("Given windowing scheme does not support unsegmenting.")
+
+        if x.ndim not in {1, 2}:
+            raise ValueError(f"Only supports 1D or 2D inputs, provided {x.ndim}D.")
+
+        if block_frames <= 0:
+            raise ValueError(
+                f"The block size must be positive, received {block_frames}."
+            )
+
+        batch_size = x.shape[0] if x.ndim == 2 else None
+        if batch_size is None:
+            x = x.reshape(1, -1)
+        if not np.issubdtype(x.dtype, np.floating):
+            x = cast(NDArray[T], x.astype(np.float64))
+
+        segment_size = self.window.analysis_window.shape[-1]
+        num_segments = compute_num_segments(
+            x.shape[-1], self.window.hop_size, segment_size
+        )
+        if num_segments <= 0:
+            raise ValueError(
+                "Input signal is too short for segmentation with the given parameters."
+            )
+
+        analysis_window = self.window.analysis_window.astype(x.dtype)
+        synthesis_window = self.window.synthesis_window.astype(x.dtype)
+        out = np.zeros(
+            (
+                x.shape[0],
+                compute_num_samples(num_segments, self.window.hop_size, segment_size),
+            ),
+            dtype=x.dtype,
+        )
+        buffer = np.empty(
+            (x.shape[0], min(block_frames, num_segments), segment_size), dtype=x.dtype
+        )
+
+        for start in range(0, num_segments, block_frames):
+            frames = buffer[:, : min(block_frames, num_segments - start)]
+            self._frame(x, analysis_window, self.window.hop_size, start, frames)
+            y = np.asarray(callback(frames), dtype=x.dtype)
+            if y.shape != frames.shape:
+                raise ValueError(
+                    f"The callback returned shape {y.shape} for frames of shape "
+                    + f"{frames.shape}."
+                )
+            self._overlap_add(y, synthesis_window, self.window.hop_size, start, out)
+
+        return out.squeeze(0) if batch_size is None else out
+
+    def frame_statistics(self, x: NDArray[T]) -> Dict[str, NDArray[T]]:
+        """
+        Computes per-frame statistics without materializing the frames.
+
+        The statistics follow the frame geometry of `segment`. For a constant
+        analysis window they are computed from prefix sums in O(num_samples),
+        otherwise through an FFT-based correlation with the (squared) window.
+        Integer inputs are reduced in, and return, float64.
+
+        Args:
+            x (np.ndarray): Input array, either 1D (sequence) or 2D (batch).
+
+        Returns:
+            A dictionary with arrays of shape (batch_size, num_segments):
+                `energy`: the energy of the windowed frames.
+                `rms`: the root-mean-square value of the windowed frames.
+                `mean`: the mean value of the windowed frames.
+                `max_abs`: the peak absolute value of the (unwindowed) samples
+                    covered by each frame.
+
+        Raises:
+            ValueError: If input dimensions are invalid.
+
+        """
+        if x.ndim not in {1, 2}:
+            raise ValueError(f"Only supports 1D or 2D inputs, provided {x.ndim}D.")
+
+        batch_size = x.shape[0] if x.ndim == 2 else None
+        num_samples = x.shape[-1]
+        segment_size = self.window.analysis_window.shape[-1]
+        hop_size = self.window.hop_size
+
+        if batch_size is None:
+            x = x.reshape(1, -1)  # Convert to batch format for consistency
+
+        num_segments = compute_num_segments(num_samples, hop_size, segment_size)
+
+        if num_segments <= 0:
+            raise ValueError(
+                "Input signal is too short for segmentation with the given num_samples "
+                + f"({num_samples}), hop size "
+                + f"({hop_size}) and segment size "
+                + f"({segment_size})."
+            )
+
+        # integer samples would overflow when squared (or negated)
+        dtype = x.dtype if np.issubdtype(x.dtype, np.floating) else np.float64
+
+        # only the samples covered by a frame contribute
+        signal: NDArray[Any] = x[
+            :, : compute_num_samples(num_segments, hop_size, segment_size)
+        ].astype(dtype)
+        starts = np.arange(num_segments) * hop_size
+        window: NDArray[Any] = self.window.analysis_window
+
+        if np.all(window == window[0]):
+            # constant window, prefix sums of the (squared) samples
+            c1 = np.zeros((signal.shape[0], signal.shape[1] + 1))
+            c2 = np.zeros((signal.shape[0], signal.shape[1] + 1))
+            np.cumsum(signal, axis=-1, out=c1[:, 1:])
+            np.cumsum(np.square(signal, dtype=np.float64), axis=-1, out=c2[:, 1:])
+            mean = window[0] * (c1[:, starts + segment_size] - c1[:, starts])
+            energy = np.square(window[0]) * (
+                c2[:, starts + segment_size] - c2[:, starts]
+            )
+        else:
+            # correlate with the (squared) window, evaluated at the frame starts
+            mean = scipy.signal.fftconvolve(  # pyright: ignore
+                signal, window[np.newaxis, ::-1], mode="valid", axes=-1
+            )[:, starts]
+            energy = scipy.signal.fftconvolve(  # pyright: ignore
+                np.square(signal),
+                np.square(window)[np.newaxis, ::-1],
+                mode="valid",
+                axes=-1,
+            )[:, starts]
+
+        energy = np.maximum(energy, 0.0).astype(dtype)
+        stats: Dict[str, NDArray[Any]] = {
+            "energy": energy,
+            "rms": np.sqrt(energy / segment_size),
+            "mean": (mean / segment_size).astype(dtype),
+            "max_abs": scipy.ndimage.maximum_filter1d(  # pyright: ignore
+                np.abs(signal), segment_size, axis=-1, origin=-(segment_size // 2)
+            )[:, starts],
+        }
+
+        return (
+            {k: v.squeeze(0) for k, v in stats.items()} if batch_size is None else stats
+        )
+
+    def _ragged_items(
+        self, x: NDArray[T] | Sequence[NDArray[T]], lengths: Sequence[int] | None
+    ) -> List[NDArray[T]]:
+        if isinstance(x, np.ndarray) and x.ndim == 2:
+            if lengths is None:
+                return list(x)
+            if len(lengths) != x.shape[0]:
+                raise ValueError(
+                    f"Received ({len(lengths)}) lengths for a batch of ({x.shape[0]})."
+                )
+            return [x[k, : int(n)] for k, n in enumerate(lengths)]
+
+        if isinstance(x, np.ndarray) or lengths is not None:
+            raise ValueError(
+                "Ragged inputs are either a list of 1D arrays or a padded 2D array "
+                + "with optional lengths."
+            )
+        return list(x)
+
+    def segment_packed(
+        self,
+        x: NDArray[T] | Sequence[NDArray[T]],
+        lengths: Sequence[int] | None = None,
+    ) -> Tuple[NDArray[T], NDArray[np.int64]]:
+        """
+        Segments a batch of variable-length signals into a packed frame array.
+
+        Padding is never segmented, the frames of all signals are concatenated.
+
+        Args:
+            x (np.ndarray | Sequence[np.ndarray]): A list of 1D arrays, or a padded 2D
+                array of shape (batch_size, max_num_samples).
+            lengths (Sequence[int] | None): The number of valid samples of every row
+                of a padded input. Defaults to the full rows.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]:
+                A 2-tuple containing:
+                (frames, offsets), where frames has shape (total_segments,
+                segment_size) and the frames of signal `k` are stored in rows
+                `offsets[k]` up to `offsets[k + 1]`.
+
+        """
+        items = self._ragged_items(x, lengths)
+        offsets = compute_packed_offsets(
+            [item.shape[-1] for item in items],
+            self.window.hop_size,
+            self.window.analysis_window.shape[-1],
+        )
+
+        frames = [
+            self.segment(item)
+            for k, item in enumerate(items)
+            if offsets[k + 1] > offsets[k]
+        ]
+        if not frames:
+            dtype = items[0].dtype if items else self.window.analysis_window.dtype
+            empty = np.zeros((0, self.window.analysis_window.shape[-1]), dtype)
+            return cast(NDArray[T], empty), offsets
+
+        return np.concatenate(frames, axis=0), offsets
+
+    def segment_padded(
+        self,
+        x: NDArray[T] | Sequence[NDArray[T]],
+        lengths: Sequence[int] | None = None,
+    ) -> Tuple[NDArray[T], NDArray[np.bool_]]:
+        """
+        Segments a batch of variable-length signals into a padded frame array.
+
+        Padding is never segmented, frames beyond the end of a signal are zero.
+
+        Args:
+            x (np.ndarray | Sequence[np.ndarray]): A list of 1D arrays, or a padded 2D
+                array of shape (batch_size, max_num_samples).
+            lengths (Sequence[int] | None): The number of valid samples of every row
+                of a padded input. Defaults to the full rows.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]:
+                A 2-tuple containing:
+                (frames, mask), where frames has shape (batch_size, max_num_segments,
+                segment_size) and the boolean mask of shape (batch_size,
+                max_num_segments) marks the valid frames.
+
+        """
+        frames, offsets = self.segment_packed(x, lengths)
+        counts = np.diff(offsets)
+        max_segments = int(counts.max(initial=0))
+
+        y = np.zeros((counts.shape[0], max_segments, frames.shape[-1]), frames.dtype)
+        mask = np.arange(max_segments) < counts[:, np.newaxis]
+        y[mask] = frames
+
+        return y, mask
+
+    def unsegment_packed(
+        self,
+        y: NDArray[T],
+        offsets: Sequence[int] | NDArray[np.int64],
+        lengths: Sequence[int] | None = None,
+    ) -> List[NDArray[T]]:
+        """
+        Reconstructs variable-length signals from a packed frame array.
+
+        Args:
+            y (np.ndarray): Packed frames of shape (total_segments, segment_size).
+            offsets (Sequence[int] | np.ndarray): The offsets returned by
+                `segment_packed`.
+            lengths (Sequence[int] | None): The number of samples of every signal, the
+                reconstructions are zero-padded or cropped to match. Defaults to the
+                length covered by the frames.
+
+        Returns:
+            A list with the reconstructed 1D signals.
+
+        """
+        if y.ndim != 2:
+            raise ValueError(f"Only supports 2D inputs, provided {y.ndim}D.")
+
+        x: List[NDArray[T]] = []
+        for k in range(len(offsets) - 1):
+            frames = y[int(offsets[k]) : int(offsets[k + 1])]
+            signal = (
+                self.unsegment(frames)
+                if frames.shape[0] > 0
+                else np.zeros(0, dtype=y.dtype)
+            )
+            if lengths is not None:
+                signal = signal[: int(lengths[k])]
+                signal = np.pad(signal, (0, int(lengths[k]) - signal.shape[0]))
+            x.append(signal)
+
+        return x
+
+    def unsegment_padded(
+        self,
+        y: NDArray[T],
+        mask: NDArray[np.bool_],
+        lengths: Sequence[int] | None = None,
+    ) -> List[NDArray[T]]:
+        """
+        Reconstructs variable-length signals from a padded frame array.
+
+        Args:
+            y (np.ndarray): Padded frames of shape (batch_size, max_num_segments,
+                segment_size).
+            mask (np.ndarray): The mask returned by `segment_padded`.
+            lengths (Sequence[int] | None): The number of samples of every signal, the
+                reconstructions are zero-padded or cropped to match. Defaults to the
+                length covered by the frames.
+
+        Returns:
+            A list with the reconstructed 1D signals.
+
+        """
+        if y.ndim != 3:
+            raise ValueError(f"Only supports 3D inputs, provided {y.ndim}D.")
+
+        counts = np.count_nonzero(np.asarray(mask), axis=-1)
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        return self.unsegment_packed(y[np.asarray(mask)], offsets, lengths)
+
+
+def _is_consecutive(frame_idxs: NDArray[np.int64]) -> bool:
+    return bool(np.all(np.diff(frame_idxs) == 1))
@@ -18,9 +18,18 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import tensorflow as tf
-
-from libsegmenter.backends.common import compute_num_segments, compute_num_samples
+import numpy as np
+from numpy.typing import NDArray
+from typing import Sequence, Any, Dict, List, Tuple
+
+from libsegmenter.backends.common import (
+    compute_num_segments,
+    compute_num_samples,
+    compute_frame_indices,
+    compute_packed_offsets,
+)
 from libsegmenter.Window import Window
+from libsegmenter.SegmentedSignal import SegmentedSignal
 
 
 class SegmenterTensorFlow(tf.keras.layers.Layer):
@@ -29,32 +38,57 @@ class SegmenterTensorFlow(tf.keras.layers.Layer):
 
     Supports Weighted Overlap-Add (WOLA) and Overlap-Add (OLA) methods.
 
+    In export mode, all frames are segmented with a strided convolution and
+    overlap-added with a strided transposed convolution of a windowed identity
+    kernel. These map onto TFLite builtin operators, so a graph with fixed input
+    shapes converts without select TensorFlow operators, see `export_tflite`.
+
     Attributes:
         window (Window): A class containing hop size, and windows.
+        export_mode (bool): Whether the export-friendly formulation is used.
 
     """
 
-    def __init__(self, window: Window) -> None:
+    def __init__(self, window: Window, export_mode: bool = False) -> None:
         """
         Initializes the SegmenterTensorFlow instance.
 
         Args:
             window (Window): A window object containing segmentation parameters.
+            export_mode (bool): Whether to use the export-friendly formulation.
+                Defaults to False.
 
         """
         super(SegmenterTensorFlow, self).__init__()  # type: ignore
 
         self.window = window
+        self.export_mode = export_mode
+
+        if export_mode:
+            self._analysis_kernel = _windowed_identity(window.analysis_window)
+            self._synthesis_kernel = (
+                _windowed_identity(window.synthesis_window)
+                if window.synthesis_window is not None
+                else None
+            )
 
-    def segment(self, x: tf.Tensor) -> tf.Tensor:
+    def segment(
+        self,
+        x: tf.Tensor,
+        frames: slice | Sequence[int] | NDArray[Any] | None = None,
+    ) -> tf.Tensor:
         """
         Segments the input tensor into overlapping windows.
 
         Args:
             x (tf.Tensor): Input tensor (1D or 2D).
+            frames (slice | Sequence[int] | NDArray[Any] | None): Optional selection
+                of frames to compute. Only the selected frames are windowed, in the
+                order given. Defaults to all frames.
 
         Returns:
-            Segmented tensor of shape (batch_size, num_segments, segment_size).
+            Segmented tensor of shape (batch_size, num_segments, segment_size), where
+            num_segments is the number of selected frames.
 
         """
         if len(x.shape) not in {1, 2}:
@@ -77,11 +111,30 @@ class SegmenterTensorFlow(tf.keras.layers.Layer):
                 "Input signal is too short for segmentation with the given parameters."
             )
 
+        if self.export_mode and frames is None:
+            # output channel m of the windowed identity kernel holds sample m of the
+            # frame, (batch_size, num_samples, 1) -> (batch_size, num_segments, ...)
+            X = tf.nn.conv1d(
+                tf.expand_dims(x, axis=-1),
+                tf.cast(self._analysis_kernel, x.dtype),
+                self.window.hop_size,
+                padding="VALID",
+            )
+            if self.window.analysis_window.shape[-1] % self.window.hop_size > 0:
+                X = X[:, :num_segments]
+            return tf.squeeze(X, axis=0) if batch_size is None else X
+
+        frame_idxs = (
+            compute_frame_indices(frames, num_segments)
+            if frames is not None
+            else np.arange(num_segments)
+        )
+
         # Pre-allocation
         X = tf.zeros(
             (
                 batch_size if batch_size is not None else 1,
-                num_segments,
+                frame_idxs.shape[0],
                 self.window.analysis_window.shape[-1],
             ),
             dtype=x.dtype,
@@ -91,8 +144,8 @@ class SegmenterTensorFlow(tf.keras.layers.Layer):
         analysis_window = tf.convert_to_tensor(
             self.window.analysis_window, dtype=x.dtype
         )
-        for k in range(num_segments):
-            start_idx = k * self.window.hop_size
+        for k, frame_idx in enumerate(frame_idxs):
+            start_idx = int(frame_idx) * self.window.hop_size
             X = tf.tensor_scatter_nd_update(
                 X,
                 [
@@ -109,12 +162,36 @@ class SegmenterTensorFlow(tf.keras.layers.Layer):
 
         return tf.squeeze(X, axis=0) if batch_size is None else X
 
-    def unsegment(self, X: tf.Tensor) -> tf.Tensor:
+    def segment_lazy(self, x: tf.Tensor) -> SegmentedSignal:
+        """
+        Creates a lazily segmented view of the input signal.
+
+        Frames are only windowed when they are indexed, see `SegmentedSignal`.
+
+        Args:
+            x (tf.Tensor): Input tensor, either 1D (sequence) or 2D (batch).
+
+        Returns:
+            A `SegmentedSignal` of shape (batch_size, num_segments, segment_size).
+
+        """
+        return SegmentedSignal(self, x)
+
+    def unsegment(
+        self,
+        X: tf.Tensor,
+        frames: slice | Sequence[int] | NDArray[Any] | None = None,
+    ) -> tf.Tensor:
         """
         Reconstructs the original signal from segmented data.
 
         Args:
             X (tf.Tensor): Segmented tensor (2D or 3D).
+            frames (slice | Sequence[int] | NDArray[Any] | None): Optional frame
+                indices of the segments in `X`, as passed to `segment`. The frames
+                are overlap-added into the time span they cover, i.e. the output
+                starts at sample `min(frames) * hop_size`. Defaults to consecutive
+                frames starting at zero.
 
         Returns:
             Reconstructed 1D or 2D signal.
@@ -135,8 +212,21 @@ class SegmenterTensorFlow(tf.keras.layers.Layer):
         if batch_size is None:
             X = tf.reshape(X, (1, num_segments, -1))  # Convert to batch format
 
+        # frames span, relative to the first frame
+        frame_idxs = np.arange(num_segments)
+        num_frames = num_segments
+        if frames is not None:
+            frame_idxs = compute_frame_indices(frames, None)
+            if frame_idxs.shape[0] != num_segments:
+                raise ValueError(
+                    f"Received ({frame_idxs.shape[0]}) frame indices for "
+                    + f"({num_segments}) segments."
+                )
+            frame_idxs = frame_idxs - frame_idxs.min()
+            num_frames = int(frame_idxs.max()) + 1
+
         num_samples = compute_num_samples(
-            num_segments, self.window.hop_size, segment_size
+            num_frames, self.window.hop_size, segment_size
         )
 
         if num_samples <= 0:
@@ -145,6 +235,16 @@ class SegmenterTensorFlow(tf.keras.layers.Layer):
                 + "parameters."
             )
 
+        if self.export_mode and frames is None:
+            x = tf.nn.conv1d_transpose(
+                X,
+                tf.cast(self._synthesis_kernel, X.dtype),
+                tf.stack([tf.shape(X)[0], num_samples, 1]),
+                self.window.hop_size,
+                padding="VALID",
+            )[..., 0]
+            return tf.squeeze(x, axis=0) if batch_size is None else x
+
         # Allocate memory for the reconstructed signal
         x = tf.zeros(
             (batch_size if batch_size is not None else 1, num_samples), dtype=X.dtype
@@ -153,11 +253,10 @@ class SegmenterTensorFlow(tf.keras.layers.Layer):
         # Overlap-add method for reconstructing the original signal
         tf.convert_to_tensor(self.window.synthesis_window, dtype=X.dtype)
 
-        for k in range(num_segments):
+        for k, frame_idx in enumerate(frame_idxs):
+            start_idx = int(frame_idx) * self.window.hop_size
             tmpIdx = tf.reshape(
-                tf.range(
-                    k * self.window.hop_size, k * self.window.hop_size + segment_size
-                ),
+                tf.range(start_idx, start_idx + segment_size),
                 shape=(segment_size, 1),
             )
 
@@ -168,3 +267,252 @@ class SegmenterTensorFlow(tf.keras.layers.Layer):
                 )
 
         return tf.squeeze(x, axis=0) if batch_size is None else x
+
+    def frame_statistics(self, x: tf.Tensor) -> Dict[str, tf.Tensor]:
+        """
+        Computes per-frame statistics without materializing the frames.
+
+        The statistics follow the frame geometry of `segment` and are computed with
+        strided convolutions of the (squared) signal with the (squared) analysis
+        window and a strided max pool, using O(num_segments) memory.
+
+        Args:
+            x (tf.Tensor): Input tensor (1D or 2D).
+
+        Returns:
+            A dictionary with tensors of shape (batch_size, num_segments):
+                `energy`: the energy of the windowed frames.
+                `rms`: the root-mean-square value of the windowed frames.
+                `mean`: the mean value of the windowed frames.
+                `max_abs`: the peak absolute value of the (unwindowed) samples
+                    covered by each frame.
+
+        """
+        if len(x.shape) not in {1, 2}:
+            raise ValueError(
+                f"Only supports 1D or 2D inputs, provided {len(x.shape)}D."
+            )
+
+        batch_size = x.shape[0] if len(x.shape) == 2 else None
+        num_samples = x.shape[-1]
+        segment_size = self.window.analysis_window.shape[-1]
+        hop_size = self.window.hop_size
+
+        if batch_size is None:
+            x = tf.reshape(x, (1, -1))  # Convert to batch format
+
+        num_segments = compute_num_segments(num_samples, hop_size, segment_size)
+
+        if num_segments <= 0:
+            raise ValueError(
+                "Input signal is too short for segmentation with the given parameters."
+            )
+
+        analysis_window = tf.reshape(
+            tf.convert_to_tensor(self.window.analysis_window, dtype=x.dtype),
+            (-1, 1, 1),
+        )
+
+        x = tf.expand_dims(x, axis=-1)  # (batch_size, num_samples, channels)
+        energy = tf.maximum(
+            tf.nn.conv1d(
+                x * x, analysis_window * analysis_window, hop_size, padding="VALID"
+            )[:, :num_segments, 0],
+            0.0,
+        )
+        mean = (
+            tf.nn.conv1d(x, analysis_window, hop_size, padding="VALID")[
+                :, :num_segments, 0
+            ]
+            / segment_size
+        )
+        max_abs = tf.nn.max_pool1d(tf.abs(x), segment_size, hop_size, padding="VALID")[
+            :, :num_segments, 0
+        ]
+
+        stats = {
+            "energy": energy,
+            "rms": tf.sqrt(energy / segment_size),
+            "mean": mean,
+            "max_abs": max_abs,
+        }
+
+        return (
+            {k: tf.squeeze(v, axis=0) for k, v in stats.items()}
+            if batch_size is None
+            else stats
+        )
+
+    def _ragged_items(
+        self, x: tf.Tensor | Sequence[tf.Tensor], lengths: Sequence[int] | None
+    ) -> List[tf.Tensor]:
+        if isinstance(x, tf.Tensor) and len(x.shape) == 2:
+            if lengths is None:
+                return [x[k] for k in range(x.shape[0])]
+            if len(lengths) != x.shape[0]:
+                raise ValueError(
+                    f"Received ({len(lengths)}) lengths for a batch of ({x.shape[0]})."
+                )
+            return [x[k, : int(n)] for k, n in enumerate(lengths)]
+
+        if isinstance(x, tf.Tensor) or lengths is not None:
+            raise ValueError(
+                "Ragged inputs are either a list of 1D tensors or a padded 2D tensor "
+                + "with optional lengths."
+            )
+        return list(x)
+
+    def segment_packed(
+        self,
+        x: tf.Tensor | Sequence[tf.Tensor],
+        lengths: Sequence[int] | None = None,
+    ) -> Tuple[tf.Tensor, NDArray[np.int64]]:
+        """
+        Segments a batch of variable-length signals into a packed frame tensor.
+
+        Padding is never segmented, the frames of all signals are concatenated.
+
+        Args:
+            x (tf.Tensor | Sequence[tf.Tensor]): A list of 1D tensors, or a padded 2D
+                tensor of shape (batch_size, max_num_samples).
+            lengths (Sequence[int] | None): The number of valid samples of every row
+                of a padded input. Defaults to the full rows.
+
+        Returns:
+            Tuple[tf.Tensor, np.ndarray]:
+                A 2-tuple containing:
+                (frames, offsets), where frames has shape (total_segments,
+                segment_size) and the frames of signal `k` are stored in rows
+                `offsets[k]` up to `offsets[k + 1]`.
+
+        """
+        items = self._ragged_items(x, lengths)
+        offsets = compute_packed_offsets(
+            [item.shape[-1] for item in items],
+            self.window.hop_size,
+            self.window.analysis_window.shape[-1],
+        )
+
+        frames = [
+            self.segment(item)
+            for k, item in enumerate(items)
+            if offsets[k + 1] > offsets[k]
+        ]
+        if not frames:
+            return tf.zeros(
+                (0, self.window.analysis_window.shape[-1]),
+                dtype=items[0].dtype if items else tf.float32,
+            ), offsets
+
+        return tf.concat(frames, axis=0), offsets
+
+    def segment_padded(
+        self,
+        x: tf.Tensor | Sequence[tf.Tensor],
+        lengths: Sequence[int] | None = None,
+    ) -> Tuple[tf.Tensor, tf.Tensor]:
+        """
+        Segments a batch of variable-length signals into a padded frame tensor.
+
+        Padding is never segmented, frames beyond the end of a signal are zero.
+
+        Args:
+            x (tf.Tensor | Sequence[tf.Tensor]): A list of 1D tensors, or a padded 2D
+                tensor of shape (batch_size, max_num_samples).
+            lengths (Sequence[int] | None): The number of valid samples of every row
+                of a padded input. Defaults to the full rows.
+
+        Returns:
+            Tuple[tf.Tensor, tf.Tensor]:
+                A 2-tuple containing:
+                (frames, mask), where frames has shape (batch_size, max_num_segments,
+                segment_size) and the boolean mask of shape (batch_size,
+                max_num_segments) marks the valid frames.
+
+        """
+        frames, offsets = self.segment_packed(x, lengths)
+        counts = np.diff(offsets)
+        max_segments = int(counts.max(initial=0))
+
+        mask = tf.convert_to_tensor(np.arange(max_segments) < counts[:, np.newaxis])
+        y = tf.scatter_nd(
+            tf.where(mask),
+            frames,
+            (counts.shape[0], max_segments, frames.shape[-1]),
+        )
+
+        return y, mask
+
+    def unsegment_packed(
+        self,
+        y: tf.Tensor,
+        offsets: Sequence[int] | NDArray[np.int64],
+        lengths: Sequence[int] | None = None,
+    ) -> List[tf.Tensor]:
+        """
+        Reconstructs variable-length signals from a packed frame tensor.
+
+        Args:
+            y (tf.Tensor): Packed frames of shape (total_segments, segment_size).
+            offsets (Sequence[int] | np.ndarray): The offsets returned by
+                `segment_packed`.
+            lengths (Sequence[int] | None): The number of samples of every signal, the
+                reconstructions are zero-padded or cropped to match. Defaults to the
+                length covered by the frames.
+
+        Returns:
+            A list with the reconstructed 1D signals.
+
+        """
+        if len(y.shape) != 2:
+            raise ValueError(f"Only supports 2D inputs, provided {len(y.shape)}D.")
+
+        x: List[tf.Tensor] = []
+        for k in range(len(offsets) - 1):
+            frames = y[int(offsets[k]) : int(offsets[k + 1])]
+            signal = (
+                self.unsegment(frames)
+                if frames.shape[0] > 0
+                else tf.zeros((0,), dtype=y.dtype)
+            )
+            if lengths is not None:
+                signal = signal[: int(lengths[k])]
+                signal = tf.pad(signal, [[0, int(lengths[k]) - signal.shape[0]]])
+            x.append(signal)
+
+        return x
+
+    def unsegment_padded(
+        self,
+        y: tf.Tensor,
+        mask: tf.Tensor,
+        lengths: Sequence[int] | None = None,
+    ) -> List[tf.Tensor]:
+        """
+        Reconstructs variable-length signals from a padded frame tensor.
+
+        Args:
+            y (tf.Tensor): Padded frames of shape (batch_size, max_num_segments,
+                segment_size).
+            mask (tf.Tensor): The mask returned by `segment_padded`.
+            lengths (Sequence[int] | None): The number of samples of every signal, the
+                reconstructions are zero-padded or cropped to match. Defaults to the
+                length covered by the frames.
+
+        Returns:
+            A list with the reconstructed 1D signals.
+
+        """
+        if len(y.shape) != 3:
+            raise ValueError(f"Only supports 3D inputs, provided {len(y.shape)}D.")
+
+        counts = np.count_nonzero(np.asarray(mask), axis=-1)
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        return self.unsegment_packed(tf.boolean_mask(y, mask), offsets, lengths)
+
+
+def _windowed_identity(window: NDArray[Any]) -> tf.Tensor:
+    # (segment_size, 1, segment_size) convolution kernel, window on the diagonal
+    kernel = np.eye(window.shape[-1])[:, np.newaxis, :] * window[:, None, None]
+    return tf.constant(kernel, dtype=tf.float32)
@@ -18,9 +18,18 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import torch
-
-from libsegmenter.backends.common import compute_num_segments, compute_num_samples
+import numpy as np
+from numpy.typing import NDArray
+from typing import Sequence, Any, Dict, List, Tuple
+
+from libsegmenter.backends.common import (
+    compute_num_segments,
+    compute_num_samples,
+    compute_frame_indices,
+    compute_packed_offsets,
+)
 from libsegmenter.Window import Window
+from libsegmenter.SegmentedSignal import SegmentedSignal
 
 
 class SegmenterTorch(torch.nn.Module):
@@ -29,32 +38,85 @@ class SegmenterTorch(torch.nn.Module):
 
     Supports Weighted Overlap-Add (WOLA) and Overlap-Add (OLA) methods.
 
+    The windows are registered as (non-persistent) buffers and, unless a frame
+    selection is given, framing and overlap-add use `unfold` and `fold`, so both
+    compile into a single graph under `torch.compile` with a dynamic time dimension.
+
+    In export mode, all frames are segmented with a strided convolution and
+    overlap-added with a strided transposed convolution, whose (windowed identity)
+    kernels are registered as buffers. This avoids index tensors and host to device
+    copies, so the computation exports to ONNX as a static graph.
+
     Attributes:
         window (Window): A class containing hop size and windows.
+        export_mode (bool): Whether the export-friendly formulation is used.
 
     """
 
-    def __init__(self, window: Window) -> None:
+    analysis_window: torch.Tensor
+    synthesis_window: torch.Tensor | None
+    analysis_kernel: torch.Tensor
+    synthesis_kernel: torch.Tensor
+
+    def __init__(self, window: Window, export_mode: bool = False) -> None:
         """
         Initializes the SegmenterTorch instance.
 
         Args:
             window (Window): A window object containing segmentation parameters.
+            export_mode (bool): Whether to use the export-friendly formulation.
+                Defaults to False.
 
         """
         super().__init__()  # type: ignore
 
         self.window = window
+        self.export_mode = export_mode
+
+        # buffers keep the native dtype of the window, and are cast per call
+        self.register_buffer(
+            "analysis_window",
+            torch.as_tensor(window.analysis_window),
+            persistent=False,
+        )
+        self.register_buffer(
+            "synthesis_window",
+            torch.as_tensor(window.synthesis_window)
+            if window.synthesis_window is not None
+            else None,
+            persistent=False,
+        )
 
-    def segment(self, x: torch.Tensor) -> torch.Tensor:
+        if export_mode:
+            self.register_buffer(
+                "analysis_kernel",
+                _windowed_identity(window.analysis_window),
+                persistent=False,
+            )
+            if window.synthesis_window is not None:
+                self.register_buffer(
+                    "synthesis_kernel",
+                    _windowed_identity(window.synthesis_window),
+                    persistent=False,
+                )
+
+    def segment(
+        self,
+        x: torch.Tensor,
+        frames: slice | Sequence[int] | NDArray[Any] | None = None,
+    ) -> torch.Tensor:
         """
         Segments the input tensor into overlapping windows.
 
         Args:
             x (torch.Tensor): Input tensor (1D or 2D).
+            frames (slice | Sequence[int] | NDArray[Any] | None): Optional selection
+                of frames to compute. Only the selected frames are windowed, in the
+                order given. Defaults to all frames.
 
         Returns:
-            Segmented tensor of shape (batch_size, num_segments, segment_size).
+            Segmented tensor of shape (batch_size, num_segments, segment_size), where
+            num_segments is the number of selected frames.
 
         Raises:
             ValueError: If types are incorrect.
@@ -79,12 +141,32 @@ class SegmenterTorch(torch.nn.Module):
                 "Input signal is too short for segmentation with the given parameters."
             )
 
+        if self.export_mode and frames is None:
+            # output channel m of the windowed identity kernel holds sample m of the
+            # frame, (batch, segment_size, num_segments) -> (batch, num_segments, ...)
+            y = torch.nn.functional.conv1d(
+                x.unsqueeze(1),
+                self.analysis_kernel.to(x.dtype),  # pyright: ignore
+                stride=self.window.hop_size,
+            ).transpose(1, 2)
+            if self.window.analysis_window.shape[-1] % self.window.hop_size > 0:
+                y = y[:, :num_segments]
+            return y.squeeze(0) if batch_size is None else y
+
         # Windowing
-        analysis_window = torch.tensor(
-            self.window.analysis_window, device=x.device, dtype=x.dtype
-        )
+        analysis_window = self.analysis_window.to(x.dtype)  # pyright: ignore
 
-        idxs = torch.arange(num_segments, device=x.device) * self.window.hop_size
+        if frames is None:
+            y = x.unfold(
+                -1, self.window.analysis_window.shape[-1], self.window.hop_size
+            )
+            if self.window.analysis_window.shape[-1] % self.window.hop_size > 0:
+                y = y[:, :num_segments]
+            y = y * analysis_window
+            return y.squeeze(0) if batch_size is None else y
+
+        idxs = torch.as_tensor(compute_frame_indices(frames, num_segments)).to(x.device)
+        idxs = idxs * self.window.hop_size
         frame_idxs = idxs.unsqueeze(1) + torch.arange(
             self.window.analysis_window.shape[-1], device=x.device
         )
@@ -94,12 +176,36 @@ class SegmenterTorch(torch.nn.Module):
             y.squeeze(0) if batch_size is None else y
         )  # Remove batch dimension if needed
 
-    def unsegment(self, y: torch.Tensor) -> torch.Tensor:
+    def segment_lazy(self, x: torch.Tensor) -> SegmentedSignal:
+        """
+        Creates a lazily segmented view of the input signal.
+
+        Frames are only windowed when they are indexed, see `SegmentedSignal`.
+
+        Args:
+            x (torch.Tensor): Input tensor, either 1D (sequence) or 2D (batch).
+
+        Returns:
+            A `SegmentedSignal` of shape (batch_size, num_segments, segment_size).
+
+        """
+        return SegmentedSignal(self, x)
+
+    def unsegment(
+        self,
+        y: torch.Tensor,
+        frames: slice | Sequence[int] | NDArray[Any] | None = None,
+    ) -> torch.Tensor:
         """
         Reconstructs the original signal from segmented data.
 
         Args:
             y (torch.Tensor): Segmented tensor (2D or 3D).
+            frames (slice | Sequence[int] | NDArray[Any] | None): Optional frame
+                indices of the segments in `y`, as passed to `segment`. The frames
+                are overlap-added into the time span they cover, i.e. the output
+                starts at sample `min(frames) * hop_size`. Defaults to consecutive
+                frames starting at zero.
 
         Returns:
             Reconstructed 1D or 2D signal.
@@ -122,8 +228,21 @@ class SegmenterTorch(torch.nn.Module):
         if batch_size is None:
             y = y.reshape(1, num_segments, -1)  # Convert to batch format
 
+        # frames span, relative to the first frame
+        frame_idxs = None
+        num_frames = num_segments
+        if frames is not None:
+            frame_idxs = compute_frame_indices(frames, None)
+            if frame_idxs.shape[0] != num_segments:
+                raise ValueError(
+                    f"Received ({frame_idxs.shape[0]}) frame indices for "
+                    + f"({num_segments}) segments."
+                )
+            frame_idxs = frame_idxs - frame_idxs.min()
+            num_frames = int(frame_idxs.max()) + 1
+
         num_samples = compute_num_samples(
-            num_segments, self.window.hop_size, segment_size
+            num_frames, self.window.hop_size, segment_size
         )
 
         if num_samples <= 0:
@@ -132,6 +251,27 @@ class SegmenterTorch(torch.nn.Module):
                 + "parameters."
             )
 
+        if self.export_mode and frames is None:
+            x = torch.nn.functional.conv_transpose1d(
+                y.transpose(1, 2),
+                self.synthesis_kernel.to(y.dtype),  # pyright: ignore
+                stride=self.window.hop_size,
+            ).squeeze(1)
+            return x.squeeze(0) if batch_size is None else x
+
+        # overlap-add method for reconstructing the original signal
+        synthesis_window = self.synthesis_window.to(y.dtype)  # pyright: ignore
+
+        if frame_idxs is None:
+            # fold sums the (1, segment_size) blocks at their strided offsets
+            x = torch.nn.functional.fold(
+                (y * synthesis_window).transpose(1, 2),
+                output_size=(1, num_samples),
+                kernel_size=(1, segment_size),
+                stride=(1, self.window.hop_size),
+            ).reshape(y.shape[0], num_samples)
+            return x.squeeze(0) if batch_size is None else x
+
         # allocate memory for the reconstructed signal
         x = torch.zeros(
             (batch_size if batch_size is not None else 1, num_samples),
@@ -139,19 +279,257 @@ class SegmenterTorch(torch.nn.Module):
             dtype=y.dtype,
         )
 
-        # overlap-add method for reconstructing the original signal
-        synthesis_window = torch.tensor(
-            self.window.synthesis_window, device=y.device, dtype=y.dtype
-        )
-
-        frame_idxs = (
-            torch.arange(num_segments, device=y.device) * self.window.hop_size
+        sample_idxs = (
+            torch.as_tensor(frame_idxs).to(y.device) * self.window.hop_size
         ).unsqueeze(1) + torch.arange(segment_size, device=y.device)
-        frame_idxs = frame_idxs.flatten()
+        sample_idxs = sample_idxs.flatten()
         x.scatter_add_(
             1,
-            frame_idxs.unsqueeze(0).expand(x.shape[0], -1),
+            sample_idxs.unsqueeze(0).expand(x.shape[0], -1),
             (y * synthesis_window).reshape(x.shape[0], -1),
         )
 
         return x.squeeze(0) if batch_size is None else x
+
+    def frame_statistics(self, x: torch.Tensor) -> Dict[str, torch.Tensor]:
+        """
+        Computes per-frame statistics without materializing the frames.
+
+        The statistics follow the frame geometry of `segment` and are computed with
+        strided convolutions of the (squared) signal with the (squared) analysis
+        window and a strided max pool, using O(num_segments) memory.
+
+        Args:
+            x (torch.Tensor): Input tensor (1D or 2D).
+
+        Returns:
+            A dictionary with tensors of shape (batch_size, num_segments):
+                `energy`: the energy of the windowed frames.
+                `rms`: the root-mean-square value of the windowed frames.
+                `mean`: the mean value of the windowed frames.
+                `max_abs`: the peak absolute value of the (unwindowed) samples
+                    covered by each frame.
+
+        Raises:
+            ValueError: If input dimensions are invalid.
+
+        """
+        if x.ndim not in {1, 2}:
+            raise ValueError(f"Only supports 1D or 2D inputs, provided {x.ndim}D.")
+
+        batch_size = x.shape[0] if x.ndim == 2 else None
+        num_samples = x.shape[-1]
+        segment_size = self.window.analysis_window.shape[-1]
+        hop_size = self.window.hop_size
+
+        if batch_size is None:
+            x = x.reshape(1, -1)  # Convert to batch format for consistency
+
+        num_segments = compute_num_segments(num_samples, hop_size, segment_size)
+
+        if num_segments <= 0:
+            raise ValueError(
+                "Input signal is too short for segmentation with the given parameters."
+            )
+
+        analysis_window = self.analysis_window.to(x.dtype)  # pyright: ignore
+        analysis_window = analysis_window.reshape(1, 1, -1)
+
+        x = x.unsqueeze(1)  # (batch_size, channels, num_samples)
+        energy = torch.nn.functional.conv1d(
+            x * x, analysis_window * analysis_window, stride=hop_size
+        )[:, 0, :num_segments].clamp(min=0.0)
+        mean = (
+            torch.nn.functional.conv1d(x, analysis_window, stride=hop_size)[
+                :, 0, :num_segments
+            ]
+            / segment_size
+        )
+        max_abs = torch.nn.functional.max_pool1d(
+            x.abs(), segment_size, stride=hop_size
+        )[:, 0, :num_segments]
+
+        stats = {
+            "energy": energy,
+            "rms": torch.sqrt(energy / segment_size),
+            "mean": mean,
+            "max_abs": max_abs,
+        }
+
+        return (
+            {k: v.squeeze(0) for k, v in stats.items()} if batch_size is None else stats
+        )
+
+    def _ragged_items(
+        self, x: torch.Tensor | Sequence[torch.Tensor], lengths: Sequence[int] | None
+    ) -> List[torch.Tensor]:
+        if isinstance(x, torch.Tensor) and x.ndim == 2:
+            if lengths is None:
+                return list(x)
+            if len(lengths) != x.shape[0]:
+                raise ValueError(
+                    f"Received ({len(lengths)}) lengths for a batch of ({x.shape[0]})."
+                )
+            return [x[k, : int(n)] for k, n in enumerate(lengths)]
+
+        if isinstance(x, torch.Tensor) or lengths is not None:
+            raise ValueError(
+                "Ragged inputs are either a list of 1D tensors or a padded 2D tensor "
+                + "with optional lengths."
+            )
+        return list(x)
+
+    def segment_packed(
+        self,
+        x: torch.Tensor | Sequence[torch.Tensor],
+        lengths: Sequence[int] | None = None,
+    ) -> Tuple[torch.Tensor, NDArray[np.int64]]:
+        """
+        Segments a batch of variable-length signals into a packed frame tensor.
+
+        Padding is never segmented, the frames of all signals are concatenated.
+
+        Args:
+            x (torch.Tensor | Sequence[torch.Tensor]): A list of 1D tensors, or a
+                padded 2D tensor of shape (batch_size, max_num_samples).
+            lengths (Sequence[int] | None): The number of valid samples of every row
+                of a padded input. Defaults to the full rows.
+
+        Returns:
+            Tuple[torch.Tensor, np.ndarray]:
+                A 2-tuple containing:
+                (frames, offsets), where frames has shape (total_segments,
+                segment_size) and the frames of signal `k` are stored in rows
+                `offsets[k]` up to `offsets[k + 1]`.
+
+        """
+        items = self._ragged_items(x, lengths)
+        offsets = compute_packed_offsets(
+            [item.shape[-1] for item in items],
+            self.window.hop_size,
+            self.window.analysis_window.shape[-1],
+        )
+
+        frames = [
+            self.segment(item)
+            for k, item in enumerate(items)
+            if offsets[k + 1] > offsets[k]
+        ]
+        if not frames:
+            return torch.zeros(
+                (0, self.window.analysis_window.shape[-1]),
+                dtype=items[0].dtype if items else None,
+                device=items[0].device if items else None,
+            ), offsets
+
+        return torch.cat(frames, dim=0), offsets
+
+    def segment_padded(
+        self,
+        x: torch.Tensor | Sequence[torch.Tensor],
+        lengths: Sequence[int] | None = None,
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Segments a batch of variable-length signals into a padded frame tensor.
+
+        Padding is never segmented, frames beyond the end of a signal are zero.
+
+        Args:
+            x (torch.Tensor | Sequence[torch.Tensor]): A list of 1D tensors, or a
+                padded 2D tensor of shape (batch_size, max_num_samples).
+            lengths (Sequence[int] | None): The number of valid samples of every row
+                of a padded input. Defaults to the full rows.
+
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor]:
+                A 2-tuple containing:
+                (frames, mask), where frames has shape (batch_size, max_num_segments,
+                segment_size) and the boolean mask of shape (batch_size,
+                max_num_segments) marks the valid frames.
+
+        """
+        frames, offsets = self.segment_packed(x, lengths)
+        counts = np.diff(offsets)
+        max_segments = int(counts.max(initial=0))
+
+        y = frames.new_zeros((counts.shape[0], max_segments, frames.shape[-1]))
+        mask = torch.as_tensor(np.arange(max_segments) < counts[:, np.newaxis]).to(
+            frames.device
+        )
+        y[mask] = frames
+
+        return y, mask
+
+    def unsegment_packed(
+        self,
+        y: torch.Tensor,
+        offsets: Sequence[int] | NDArray[np.int64],
+        lengths: Sequence[int] | None = None,
+    ) -> List[torch.Tensor]:
+        """
+        Reconstructs variable-length signals from a packed frame tensor.
+
+        Args:
+            y (torch.Tensor): Packed frames of shape (total_segments, segment_size).
+            offsets (Sequence[int] | np.ndarray): The offsets returned by
+                `segment_packed`.
+            lengths (Sequence[int] | None): The number of samples of every signal, the
+                reconstructions are zero-padded or cropped to match. Defaults to the
+                length covered by the frames.
+
+        Returns:
+            A list with the reconstructed 1D signals.
+
+        """
+        if y.ndim != 2:
+            raise ValueError(f"Only supports 2D inputs, provided {y.ndim}D.")
+
+        x: List[torch.Tensor] = []
+        for k in range(len(offsets) - 1):
+            frames = y[int(offsets[k]) : int(offsets[k + 1])]
+            signal = (
+                self.unsegment(frames) if frames.shape[0] > 0 else y.new_zeros((0,))
+            )
+            if lengths is not None:
+                signal = signal[: int(lengths[k])]
+                signal = torch.nn.functional.pad(
+                    signal, (0, int(lengths[k]) - signal.shape[0])
+                )
+            x.append(signal)
+
+        return x
+
+    def unsegment_padded(
+        self,
+        y: torch.Tensor,
+        mask: torch.Tensor,
+        lengths: Sequence[int] | None = None,
+    ) -> List[torch.Tensor]:
+        """
+        Reconstructs variable-length signals from a padded frame tensor.
+
+        Args:
+            y (torch.Tensor): Padded frames of shape (batch_size, max_num_segments,
+                segment_size).
+            mask (torch.Tensor): The mask returned by `segment_padded`.
+            lengths (Sequence[int] | None): The number of samples of every signal, the
+                reconstructions are zero-padded or cropped to match. Defaults to the
+                length covered by the frames.
+
+        Returns:
+            A list with the reconstructed 1D signals.
+
+        """
+        if y.ndim != 3:
+            raise ValueError(f"Only supports 3D inputs, provided {y.ndim}D.")
+
+        counts = mask.sum(dim=-1).cpu().numpy()
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        return self.unsegment_packed(y[mask], offsets, lengths)
+
+
+def _windowed_identity(window: NDArray[Any]) -> torch.Tensor:
+    # (segment_size, 1, segment_size) convolution kernel, window on the diagonal
+    kernel = np.eye(window.shape[-1])[:, np.newaxis, :] * window[:, None, None]
+    return torch.as_tensor(kernel)
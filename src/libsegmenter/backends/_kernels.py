@@ -0,0 +1,121 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Framing and overlap-add kernels of the NumPy backend, writing into preallocated
+# outputs. The numba kernels live in `_numba_kernels`, which is only imported on the
+# first call of a numba kernel, and only handle float32 and float64 arrays.
+
+import importlib.util
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any, Callable, Tuple
+
+NUMBA_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+def numba_available() -> bool:
+    """Whether numba is installed, without importing it."""
+    return importlib.util.find_spec("numba") is not None
+
+
+def frame_numpy(
+    x: NDArray[Any],
+    window: NDArray[Any],
+    hop_size: int,
+    first_frame: int,
+    out: NDArray[Any],
+) -> None:
+    """Windows frames `first_frame` onwards of `x` (B, N) into `out` (B, F, M)."""
+    segment_size = window.shape[-1]
+    for k in range(out.shape[1]):
+        start = (first_frame + k) * hop_size
+        np.multiply(x[:, start : start + segment_size], window, out=out[:, k, :])
+
+
+def overlap_add_numpy(
+    y: NDArray[Any],
+    window: NDArray[Any],
+    hop_size: int,
+    first_frame: int,
+    out: NDArray[Any],
+) -> None:
+    """Windows and overlap-adds frames `y` (B, F, M) into `out` (B, N) in place."""
+    segment_size = window.shape[-1]
+    for k in range(y.shape[1]):
+        start = (first_frame + k) * hop_size
+        out[:, start : start + segment_size] += y[:, k, :] * window
+
+
+def frame_numba(
+    x: NDArray[Any],
+    window: NDArray[Any],
+    hop_size: int,
+    first_frame: int,
+    out: NDArray[Any],
+) -> None:
+    """Like `frame_numpy`, compiled by numba for float32 and float64 outputs."""
+    if out.dtype not in NUMBA_DTYPES:
+        frame_numpy(x, window, hop_size, first_frame, out)
+        return
+
+    from libsegmenter.backends._numba_kernels import frame
+
+    frame(x, window, hop_size, first_frame, out)
+
+
+def overlap_add_numba(
+    y: NDArray[Any],
+    window: NDArray[Any],
+    hop_size: int,
+    first_frame: int,
+    out: NDArray[Any],
+) -> None:
+    """Like `overlap_add_numpy`, compiled by numba for float32 and float64 outputs."""
+    if out.dtype not in NUMBA_DTYPES:
+        overlap_add_numpy(y, window, hop_size, first_frame, out)
+        return
+
+    from libsegmenter.backends._numba_kernels import overlap_add
+
+    overlap_add(y, window, hop_size, first_frame, out)
+
+
+def select_kernels(
+    use_numba: bool | None,
+) -> Tuple[Callable[..., None], Callable[..., None]]:
+    """
+    Selects the framing and overlap-add kernels.
+
+    Args:
+        use_numba (bool | None): Whether to use the numba kernels, `None` uses them
+            when numba is installed.
+
+    Returns:
+        Tuple[Callable[..., None], Callable[..., None]]: The framing and overlap-add
+            kernels.
+
+    """
+    if use_numba is None:
+        use_numba = numba_available()
+    if use_numba and not numba_available():
+        raise ImportError("The numba kernels require numba to be installed.")
+
+    if use_numba:
+        return frame_numba, overlap_add_numba
+    return frame_numpy, overlap_add_numpy
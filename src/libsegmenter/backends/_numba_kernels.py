@@ -0,0 +1,71 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Numba kernels of the NumPy backend, compiled for float32 and float64. Framing runs
+# in parallel over the batch and frames, and overlap-add over hop-sized blocks of
+# output samples, which is race free as every sample is owned by a single block.
+# This module imports numba, so it is only imported once the kernels are used.
+
+import numba
+from numpy.typing import NDArray
+from typing import Any
+
+
+@numba.njit(parallel=True, cache=True)  # pyright: ignore
+def frame(
+    x: NDArray[Any],
+    window: NDArray[Any],
+    hop_size: int,
+    first_frame: int,
+    out: NDArray[Any],
+) -> None:
+    """Windows frames `first_frame` onwards of `x` (B, N) into `out` (B, F, M)."""
+    batch_size, num_frames, segment_size = out.shape
+    for t in numba.prange(batch_size * num_frames):  # pyright: ignore
+        b = t // num_frames
+        k = t % num_frames
+        start = (first_frame + k) * hop_size
+        for m in range(segment_size):
+            out[b, k, m] = x[b, start + m] * window[m]
+
+
+@numba.njit(parallel=True, cache=True)  # pyright: ignore
+def overlap_add(
+    y: NDArray[Any],
+    window: NDArray[Any],
+    hop_size: int,
+    first_frame: int,
+    out: NDArray[Any],
+) -> None:
+    """Windows and overlap-adds frames `y` (B, F, M) into `out` (B, N) in place."""
+    batch_size, num_frames, segment_size = y.shape
+    start = first_frame * hop_size
+    span = (num_frames - 1) * hop_size + segment_size
+    num_blocks = (span + hop_size - 1) // hop_size
+    for t in numba.prange(batch_size * num_blocks):  # pyright: ignore
+        b = t // num_blocks
+        lo = (t % num_blocks) * hop_size
+        hi = min(lo + hop_size, span)
+        # frames k overlapping [lo, hi) satisfy lo - M < k * hop < hi
+        k_lo = max(0, (lo - segment_size) // hop_size + 1)
+        k_hi = min(num_frames - 1, (hi - 1) // hop_size)
+        for k in range(k_lo, k_hi + 1):
+            offset = k * hop_size
+            for n in range(max(lo, offset), min(hi, offset + segment_size)):
+                out[b, start + n] += y[b, k, n - offset] * window[n - offset]
@@ -17,6 +17,10 @@
 # IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any, List, Sequence, Tuple
+
 
 def compute_num_segments(num_samples: int, hop_size: int, segment_size: int) -> int:
     """
@@ -51,3 +55,114 @@ def compute_num_samples(num_segments: int, hop_size: int, segment_size: int) ->
 
     """
     return (num_segments - 1) * hop_size + segment_size
+
+
+def compute_frame_indices(
+    frames: slice | Sequence[int] | NDArray[Any],
+    num_segments: int | None,
+) -> NDArray[np.int64]:
+    """
+    Resolve a frame selection into an array of frame indices.
+
+    Args:
+        frames (slice | Sequence[int] | NDArray[Any]): A slice or a sequence of
+            frame indices.
+        num_segments (int | None): Total number of segments available. When `None`,
+            the selection is unbounded and must not contain negative indices or a
+            negative step.
+
+    Returns:
+        NDArray[np.int64]: The selected frame indices.
+
+    Raises:
+        ValueError: If the selection is empty or out of bounds.
+
+    """
+    if isinstance(frames, slice):
+        if num_segments is not None:
+            idx = np.arange(*frames.indices(num_segments), dtype=np.int64)
+        else:
+            if frames.stop is None:
+                raise ValueError("An unbounded frame slice requires a stop value.")
+            if (frames.start or 0) < 0 or frames.stop < 0 or (frames.step or 1) < 0:
+                raise ValueError("Negative frame slices are not supported here.")
+            idx = np.arange(
+                frames.start or 0, frames.stop, frames.step or 1, dtype=np.int64
+            )
+    else:
+        idx = np.asarray(frames, dtype=np.int64).reshape(-1)
+        if num_segments is not None:
+            idx = np.where(idx < 0, idx + num_segments, idx)
+
+    if idx.size == 0:
+        raise ValueError("The frame selection is empty.")
+
+    if idx.min() < 0 or (num_segments is not None and idx.max() >= num_segments):
+        raise ValueError(
+            "The frame selection is out of bounds. Received frames between "
+            + f"({idx.min()}) and ({idx.max()}) for ({num_segments}) segments."
+        )
+
+    return idx
+
+
+def compute_packed_offsets(
+    lengths: Sequence[int], hop_size: int, segment_size: int
+) -> NDArray[np.int64]:
+    """
+    Compute the frame offsets of a packed batch of variable-length signals.
+
+    Args:
+        lengths (Sequence[int]): Number of samples of every signal.
+        hop_size (int): The step size for segment shifting.
+        segment_size (int): Number of samples in one segment.
+
+    Returns:
+        NDArray[np.int64]: Array of num_signals + 1 offsets, the frames of signal `k`
+            are stored in rows `offsets[k]` up to `offsets[k + 1]`. Signals too short
+            to hold a single segment have no frames.
+
+    """
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    for k, num_samples in enumerate(lengths):
+        num_segments = compute_num_segments(num_samples, hop_size, segment_size)
+        offsets[k + 1] = offsets[k] + max(num_segments, 0)
+
+    return offsets
+
+
+def compute_framing_groups(
+    hop_sizes: Sequence[int], segment_sizes: Sequence[int]
+) -> List[Tuple[int, int, List[int]]]:
+    """
+    Group frame geometries whose frames can be sliced from a shared strided view.
+
+    A geometry joins a group if the base hop size of the group divides its hop size,
+    such that its frames are every `hop_size // base_hop_size`-th row of a view with
+    the base hop size, truncated to its segment size.
+
+    Args:
+        hop_sizes (Sequence[int]): The hop size of every geometry.
+        segment_sizes (Sequence[int]): The segment size of every geometry.
+
+    Returns:
+        List[Tuple[int, int, List[int]]]: A list of (base_hop_size, view_size,
+            members), where view_size is the largest segment size of the members,
+            which index into the given geometries.
+
+    """
+    groups: List[Tuple[int, int, List[int]]] = []
+    for k in sorted(range(len(hop_sizes)), key=lambda k: hop_sizes[k]):
+        for g, (base_hop_size, view_size, members) in enumerate(groups):
+            if hop_sizes[k] % base_hop_size == 0:
+                members.append(k)
+                groups[g] = (
+                    base_hop_size,
+                    max(view_size, segment_sizes[k]),
+                    members,
+                )
+                break
+        else:
+            groups.append((hop_sizes[k], segment_sizes[k], [k]))
+
+    return groups
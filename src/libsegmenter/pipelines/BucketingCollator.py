@@ -0,0 +1,280 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+from libsegmenter.Window import Window
+from libsegmenter.backends.common import compute_num_segments
+
+BACKENDS = ["numpy", "torch", "tensorflow"]
+
+
+class BucketingCollator:
+    """
+    Groups variable-length signals into hop-aligned length buckets and collates them.
+
+    A bucket is identified by the number of segments its signals are padded to, so all
+    signals of a bucket map to the same `compute_num_segments` result. Signals are
+    only padded up to the (hop-aligned) bucket boundary, never up to the longest
+    signal of the dataset.
+
+    Attributes:
+        window (Window): The window used for segmentation.
+        bucket_edges (List[int] | None): Sorted bucket boundaries in segments, `None`
+            when every segment count is its own bucket.
+        backend (str): The backend of the collated batches.
+
+    """
+
+    def __init__(
+        self,
+        window: Window,
+        bucket_edges: Sequence[int] | None = None,
+        backend: str = "numpy",
+        dtype: Any = np.float32,
+    ) -> None:
+        """
+        Initializes the BucketingCollator instance.
+
+        Args:
+            window (Window): A window object containing segmentation parameters.
+            bucket_edges (Sequence[int] | None): Bucket boundaries in number of
+                segments. A signal is padded up to the first edge holding all of its
+                samples, signals longer than the last edge get their own bucket.
+                Defaults to a bucket per segment count.
+            backend (str): The backend of the collated batches. Supported options:
+                ["numpy", "torch", "tensorflow"]. Defaults to "numpy".
+            dtype (Any): The NumPy data type of the collated batches. Defaults to
+                float32.
+
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unsupported backend {backend}, availible: {BACKENDS}")
+        if bucket_edges is not None and (
+            len(bucket_edges) == 0 or min(bucket_edges) < 1
+        ):
+            raise ValueError("Bucket edges must be a non-empty list of positive ints.")
+
+        self.window = window
+        self.bucket_edges = (
+            sorted({int(e) for e in bucket_edges}) if bucket_edges is not None else None
+        )
+        self.backend = backend
+
+        self._dtype = dtype
+        self._frame_indices: Dict[int, Any] = {}
+        self._statistics: Dict[int, Dict[str, int]] = {}
+
+    @property
+    def segment_size(self) -> int:
+        """The number of samples in one segment."""
+        return self.window.analysis_window.shape[-1]
+
+    def bucket_num_samples(self, num_segments: int) -> int:
+        """
+        Computes the hop-aligned padded length of a bucket.
+
+        Args:
+            num_segments (int): The bucket, in number of segments.
+
+        Returns:
+            int: The smallest multiple of the hop size yielding `num_segments`
+                segments.
+
+        """
+        hop_size = self.window.hop_size
+        offset = 0 if self.segment_size % hop_size > 0 else 1
+        return (num_segments + self.segment_size // hop_size - offset) * hop_size
+
+    def bucket(self, num_samples: int) -> int:
+        """
+        Computes the bucket of a signal.
+
+        Args:
+            num_samples (int): The number of samples of the signal.
+
+        Returns:
+            int: The bucket, in number of segments.
+
+        """
+        hop_size = self.window.hop_size
+        aligned = -(-max(num_samples, self.segment_size) // hop_size) * hop_size
+        num_segments = max(
+            compute_num_segments(aligned, hop_size, self.segment_size), 1
+        )
+        if self.bucket_edges is not None:
+            idx = int(np.searchsorted(self.bucket_edges, num_segments))
+            if idx < len(self.bucket_edges):
+                return self.bucket_edges[idx]
+        return num_segments
+
+    def batches(
+        self,
+        lengths: Sequence[int],
+        batch_size: int,
+        shuffle: bool = False,
+        drop_last: bool = False,
+        seed: int | None = None,
+    ) -> Iterator[List[int]]:
+        """
+        Groups signal indices into batches that share a bucket.
+
+        Can be used as a `batch_sampler` of a `torch.utils.data.DataLoader`.
+
+        Args:
+            lengths (Sequence[int]): The number of samples of every signal.
+            batch_size (int): The maximum number of signals per batch.
+            shuffle (bool): Whether to shuffle the signals within the buckets and the
+                order of the batches. Defaults to False.
+            drop_last (bool): Whether to drop incomplete batches. Defaults to False.
+            seed (int | None): Seed of the shuffling. Defaults to None.
+
+        Yields:
+            List[int]: The indices of the signals in a batch.
+
+        """
+        if batch_size < 1:
+            raise ValueError(f"The batch size must be positive, received {batch_size}.")
+
+        rng = np.random.default_rng(seed)
+        buckets: Dict[int, List[int]] = {}
+        for k, num_samples in enumerate(lengths):
+            buckets.setdefault(self.bucket(int(num_samples)), []).append(k)
+
+        batches: List[List[int]] = []
+        for bucket in sorted(buckets):
+            members = buckets[bucket]
+            if shuffle:
+                members = [members[int(k)] for k in rng.permutation(len(members))]
+            for start in range(0, len(members), batch_size):
+                batch = members[start : start + batch_size]
+                if len(batch) == batch_size or not drop_last:
+                    batches.append(batch)
+
+        if shuffle:
+            batches = [batches[int(k)] for k in rng.permutation(len(batches))]
+        yield from batches
+
+    def __call__(self, items: Sequence[Any]) -> Tuple[Any, Any]:
+        """
+        Collates signals into a batch padded up to their bucket boundary.
+
+        Args:
+            items (Sequence[Any]): The 1D signals of the batch, of any array type.
+
+        Returns:
+            Tuple[Any, Any]:
+                A 2-tuple containing:
+                (x, lengths), where x has shape (batch_size, bucket_num_samples) and
+                lengths holds the number of valid samples of every row, both of the
+                configured backend.
+
+        """
+        signals = [np.asarray(item, dtype=self._dtype).reshape(-1) for item in items]
+        if not signals:
+            raise ValueError("Cannot collate an empty batch.")
+
+        lengths = np.array([s.shape[0] for s in signals], dtype=np.int64)
+        bucket = self.bucket(int(lengths.max()))
+        num_samples = self.bucket_num_samples(bucket)
+
+        x = np.zeros((len(signals), num_samples), dtype=self._dtype)
+        for k, s in enumerate(signals):
+            x[k, : s.shape[0]] = s
+
+        stats = self._statistics.setdefault(
+            bucket, {"batches": 0, "items": 0, "samples": 0, "padding": 0}
+        )
+        stats["batches"] += 1
+        stats["items"] += len(signals)
+        stats["samples"] += int(lengths.sum())
+        stats["padding"] += int(x.size - lengths.sum())
+
+        return self._to_backend(x), self._to_backend(lengths)
+
+    def frame_indices(self, num_segments: int) -> Any:
+        """
+        Returns the cached sample indices of the frames of a bucket.
+
+        Indexing a collated batch of the bucket with these indices yields the
+        unwindowed segments, i.e. `x[:, idx] * analysis_window` equals `segment(x)`.
+
+        Args:
+            num_segments (int): The bucket, in number of segments.
+
+        Returns:
+            Integer array of the backend with shape (num_segments, segment_size).
+
+        """
+        if num_segments not in self._frame_indices:
+            idx = (
+                np.arange(num_segments, dtype=np.int64)[:, np.newaxis]
+                * self.window.hop_size
+                + np.arange(self.segment_size, dtype=np.int64)[np.newaxis, :]
+            )
+            self._frame_indices[num_segments] = self._to_backend(idx)
+        return self._frame_indices[num_segments]
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Reports the padding overhead of the batches collated so far.
+
+        Returns:
+            Dict[str, Any]: The total number of valid and padded samples, the padding
+                ratio (padded samples over all collated samples) and the same
+                numbers per bucket under `buckets`.
+
+        """
+
+        def summarize(stats: Dict[str, int]) -> Dict[str, Any]:
+            total = stats["samples"] + stats["padding"]
+            return {
+                **stats,
+                "padding_ratio": stats["padding"] / total if total else 0.0,
+            }
+
+        totals = {"batches": 0, "items": 0, "samples": 0, "padding": 0}
+        for stats in self._statistics.values():
+            for key in totals:
+                totals[key] += stats[key]
+
+        return {
+            **summarize(totals),
+            "buckets": {
+                bucket: summarize(stats)
+                for bucket, stats in sorted(self._statistics.items())
+            },
+        }
+
+    def reset_statistics(self) -> None:
+        """Resets the padding overhead statistics."""
+        self._statistics.clear()
+
+    def _to_backend(self, x: NDArray[Any]) -> Any:
+        if self.backend == "torch":
+            import torch
+
+            return torch.from_numpy(x)  # pyright: ignore
+        if self.backend == "tensorflow":
+            import tensorflow as tf
+
+            return tf.convert_to_tensor(x)
+        return x
@@ -0,0 +1,247 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any, Callable, List
+
+from libsegmenter.Segmenter import Segmenter
+from libsegmenter.TransformSelector import TransformSelector
+from libsegmenter.Window import Window
+from libsegmenter.backends.common import compute_num_segments, compute_num_samples
+
+INACTIVE_MODES = ["passthrough", "zero"]
+
+
+def _to_numpy(x: Any) -> NDArray[Any]:
+    if hasattr(x, "detach"):  # torch
+        return x.detach().cpu().numpy()
+    return np.asarray(x)
+
+
+class GatedProcessor:
+    """
+    A segment -> transform -> callback -> inverse -> unsegment chain skipping silence.
+
+    A cheap per-frame energy gate decides which frames are active. The active frames
+    of all batch rows are transformed and passed to the callback as one compacted
+    batch, the results are overlap-added back into place. Inactive frames are
+    either passed through unprocessed or zeroed.
+
+    Attributes:
+        window (Window): The window used for segmentation.
+        threshold_db (float): Frames whose windowed mean square level lies below this
+            threshold (in dB relative to full scale) are inactive.
+        inactive (str): What to do with inactive frames, `passthrough` or `zero`.
+        frames_total (int): Number of frames seen so far.
+        frames_skipped (int): Number of inactive frames seen so far.
+
+    """
+
+    def __init__(
+        self,
+        window: Window,
+        transform: str | None = "spectrogram",
+        backend: str = "numpy",
+        threshold_db: float = -60.0,
+        inactive: str = "passthrough",
+    ) -> None:
+        """
+        Initializes the GatedProcessor instance.
+
+        Args:
+            window (Window): A window object containing segmentation parameters, its
+                scheme must support unsegmenting.
+            transform (str | None): The transform to apply to the active frames, as
+                accepted by `TransformSelector`, or `None` to process the frames
+                directly. Defaults to "spectrogram".
+            backend (str): The backend to use. Supported options:
+                ["numpy", "torch", "tensorflow"]. Defaults to "numpy".
+            threshold_db (float): Activity threshold in dB relative to full scale.
+                Defaults to -60.
+            inactive (str): What to do with inactive frames. Supported options:
+                ["passthrough", "zero"]. Defaults to "passthrough".
+
+        """
+        if window.synthesis_window is None:
+            raise ValueError("Given windowing scheme does not support unsegmenting.")
+        if inactive not in INACTIVE_MODES:
+            raise ValueError(
+                f"Unsupported inactive mode {inactive}, availible: {INACTIVE_MODES}"
+            )
+
+        self.window = window
+        self.threshold_db = threshold_db
+        self.inactive = inactive
+        self.frames_total = 0
+        self.frames_skipped = 0
+
+        self._backend = backend
+        self._segmenter = Segmenter(window, backend=backend)
+        self._transform = (
+            TransformSelector(transform, backend) if transform is not None else None
+        )
+        self._window_energy = float(np.sum(np.square(window.analysis_window)))
+
+    @property
+    def skipped_ratio(self) -> float:
+        """The fraction of frames skipped so far."""
+        return self.frames_skipped / self.frames_total if self.frames_total else 0.0
+
+    def activity_mask(self, x: Any) -> NDArray[np.bool_]:
+        """
+        Computes which frames are active.
+
+        Args:
+            x (Any): Input signal of the backend, either 1D (sequence) or 2D (batch).
+
+        Returns:
+            Boolean array of shape (batch_size, num_segments).
+
+        """
+        energy = _to_numpy(self._segmenter.frame_statistics(x)["energy"])
+        level_db = 10.0 * np.log10(energy / self._window_energy + 1e-12)
+        return level_db > self.threshold_db
+
+    def process(
+        self,
+        x: Any,
+        callback: Callable[[Any], Any],
+        mask: NDArray[np.bool_] | None = None,
+    ) -> Any:
+        """
+        Processes the active frames of the input signal.
+
+        Args:
+            x (Any): Input signal of the backend, either 1D (sequence) or 2D (batch).
+            callback (Callable[[Any], Any]): Called once with the transformed active
+                frames of shape (num_active, ...), must return the same structure
+                (e.g. a magnitude / phase tuple for the `magnitude_phase` transform).
+            mask (NDArray[np.bool_] | None): Optional activity mask of shape
+                (batch_size, num_segments). Defaults to `activity_mask(x)`.
+
+        Returns:
+            The reconstructed signal, as returned by `unsegment`.
+
+        """
+        if len(x.shape) not in {1, 2}:
+            raise ValueError(
+                f"Only supports 1D or 2D inputs, provided {len(x.shape)}D."
+            )
+
+        batched = len(x.shape) == 2
+        rows = [x[b] for b in range(x.shape[0])] if batched else [x]
+        mask = self.activity_mask(x) if mask is None else np.asarray(mask, dtype=bool)
+        mask = mask.reshape(len(rows), -1)
+
+        segment_size = self.window.analysis_window.shape[-1]
+        num_segments = compute_num_segments(
+            x.shape[-1], self.window.hop_size, segment_size
+        )
+        if mask.shape[-1] != num_segments:
+            raise ValueError(
+                f"The mask covers ({mask.shape[-1]}) frames while the input has "
+                + f"({num_segments}) frames."
+            )
+        num_samples = compute_num_samples(
+            num_segments, self.window.hop_size, segment_size
+        )
+
+        self.frames_total += mask.size
+        self.frames_skipped += int(mask.size - np.count_nonzero(mask))
+
+        # process the active frames of all rows as one compacted batch
+        active = [np.flatnonzero(m) for m in mask]
+        frames = [
+            self._segmenter.segment(row, frames=idx)
+            for row, idx in zip(rows, active, strict=True)
+            if idx.size > 0
+        ]
+        y: Any = None
+        if frames:
+            y = self._concat(frames)
+            if self._transform is not None:
+                features = callback(self._transform.forward(y))
+                y = (
+                    self._transform.inverse(*features)
+                    if isinstance(features, tuple)
+                    else self._transform.inverse(features)
+                )
+            else:
+                y = callback(y)
+
+        # scatter the results back while overlap-adding
+        outputs: List[Any] = []
+        offset = 0
+        for row, idx, m in zip(rows, active, mask, strict=True):
+            idx_row = idx
+            frames_row = [y[offset : offset + idx.size]] if idx.size > 0 else []
+            offset += idx.size
+
+            if self.inactive == "passthrough" and idx.size < m.size:
+                inactive = np.flatnonzero(~m)
+                idx_row = np.concatenate([idx, inactive])
+                frames_row.append(self._segmenter.segment(row, frames=inactive))
+
+            if not frames_row:
+                outputs.append(row[:num_samples] * 0)
+                continue
+
+            span = self._segmenter.unsegment(self._concat(frames_row), frames=idx_row)
+            start = int(idx_row.min()) * self.window.hop_size
+            outputs.append(self._pad(span, start, num_samples - start - span.shape[-1]))
+
+        return self._stack(outputs) if batched else outputs[0]
+
+    def _concat(self, xs: List[Any]) -> Any:
+        if len(xs) == 1:
+            return xs[0]
+        if self._backend == "torch":
+            import torch
+
+            return torch.cat(xs, dim=0)
+        if self._backend == "tensorflow":
+            import tensorflow as tf
+
+            return tf.concat(xs, axis=0)
+        return np.concatenate(xs, axis=0)
+
+    def _stack(self, xs: List[Any]) -> Any:
+        if self._backend == "torch":
+            import torch
+
+            return torch.stack(xs, dim=0)
+        if self._backend == "tensorflow":
+            import tensorflow as tf
+
+            return tf.stack(xs, axis=0)  # pyright: ignore
+        return np.stack(xs, axis=0)
+
+    def _pad(self, x: Any, before: int, after: int) -> Any:
+        if before == 0 and after == 0:
+            return x
+        if self._backend == "torch":
+            import torch
+
+            return torch.nn.functional.pad(x, (before, after))
+        if self._backend == "tensorflow":
+            import tensorflow as tf
+
+            return tf.pad(x, [[before, after]])
+        return np.pad(x, (before, after))
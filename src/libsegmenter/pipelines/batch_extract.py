@@ -0,0 +1,314 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import json
+import multiprocessing
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from numpy.typing import NDArray
+from typing import Any, Callable, Dict, List, Sequence, Set, Tuple, cast
+
+from libsegmenter.backends.common import compute_num_segments
+from libsegmenter.util.read_wav import read_wav, pcm_to_float
+
+MANIFEST_NAME = "manifest.json"
+
+# output name and datatype of every stored array, per transform
+TRANSFORM_OUTPUTS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "spectrogram": (("spectrogram", "complex64"),),
+    "magnitude_phase": (("magnitude", "float32"), ("phase", "float32")),
+}
+
+# per-process state, populated by `_init_worker`
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _output_path(output_dir: str, name: str) -> str:
+    return os.path.join(output_dir, f"{name}.npy")
+
+
+def _write_manifest(output_dir: str, manifest: Dict[str, Any]) -> None:
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f)
+    os.replace(path + ".tmp", path)
+
+
+def _probe(path: str) -> Tuple[int, int]:
+    _, data = read_wav(path)
+    return data.shape[0], data.shape[1]
+
+
+def _init_worker(config: Dict[str, Any], output_dir: str) -> None:
+    from libsegmenter.WindowSelector import WindowSelector
+    from libsegmenter.TransformSelector import TransformSelector
+    from libsegmenter.backends.SegmenterNumpy import SegmenterNumpy
+
+    window = WindowSelector(config["window"], config["scheme"], config["segment_size"])
+    _WORKER_STATE["segmenter"] = SegmenterNumpy(window)
+    _WORKER_STATE["transform"] = TransformSelector(config["transform"], "numpy")
+    _WORKER_STATE["output_paths"] = [
+        _output_path(output_dir, name)
+        for name, _ in TRANSFORM_OUTPUTS[config["transform"]]
+    ]
+    _WORKER_STATE["outputs"] = None
+
+
+def _extract(index: int, path: str, offset: int) -> Tuple[int, List[int]]:
+    segmenter = _WORKER_STATE["segmenter"]
+    transform = _WORKER_STATE["transform"]
+
+    _, data = read_wav(path)
+    result = transform.forward(segmenter.segment(pcm_to_float(data)))
+    features = cast(
+        Tuple[NDArray[Any], ...], result if isinstance(result, tuple) else (result,)
+    )
+
+    # the outputs only exist once all files have been probed, open them lazily
+    if _WORKER_STATE["outputs"] is None:
+        _WORKER_STATE["outputs"] = [
+            np.load(path, mmap_mode="r+") for path in _WORKER_STATE["output_paths"]
+        ]
+
+    shape: List[int] = list(features[0].shape)
+    for output, feature in zip(_WORKER_STATE["outputs"], features, strict=True):
+        rows = feature.reshape(-1, feature.shape[-1])
+        output[offset : offset + rows.shape[0]] = rows
+        output.flush()
+
+    return index, shape
+
+
+def batch_extract(
+    paths: Sequence[str],
+    output_dir: str,
+    window: str,
+    scheme: str,
+    segment_size: int,
+    transform: str = "magnitude_phase",
+    num_workers: int | None = None,
+    progress: Callable[[int, int], None] | None = None,
+    checkpoint_interval: int = 1000,
+) -> Dict[str, Any]:
+    """
+    Segments and transforms a list of WAV files using a pool of worker processes.
+
+    Only the window / transform configuration is sent to the workers, which build
+    their own `Window` and write their results straight into memory-mapped `.npy`
+    files in `output_dir` (one per transform output, e.g. `magnitude.npy` and
+    `phase.npy`). Frames of all files are stacked along the first axis, the
+    returned manifest records for every file the row `offset` and the `shape`
+    (num_channels, num_segments, num_bins) of its block, see `load_features`.
+
+    The manifest is persisted to `output_dir/manifest.json`, calling the function
+    again with the same arguments resumes an interrupted extraction.
+
+    Args:
+        paths (Sequence[str]): The WAV files to process.
+        output_dir (str): Directory where the outputs and manifest are stored.
+        window (str): The window type, as accepted by `WindowSelector`.
+        scheme (str): The window scheme, as accepted by `WindowSelector`.
+        segment_size (int): The size of the segment / window.
+        transform (str): The transform to apply. Supported options:
+            ["spectrogram", "magnitude_phase"]. Defaults to "magnitude_phase".
+        num_workers (int | None): Number of worker processes. `None` uses the
+            number of CPUs, `0` processes all files in the calling process.
+        progress (Callable[[int, int], None] | None): Called with the number of
+            completed files and the total number of files whenever a file finishes.
+        checkpoint_interval (int): Number of completed files between manifest
+            checkpoints. Defaults to 1000.
+
+    Returns:
+        The manifest describing the extracted features.
+
+    Raises:
+        ValueError: If an unsupported transform is specified.
+        ValueError: If `output_dir` holds a manifest for a different configuration.
+
+    """
+    if transform not in TRANSFORM_OUTPUTS:
+        raise ValueError(
+            f"The '{transform}' transform is not supported, availible: "
+            + f"{list(TRANSFORM_OUTPUTS.keys())}"
+        )
+
+    config: Dict[str, Any] = {
+        "window": window,
+        "scheme": scheme,
+        "segment_size": segment_size,
+        "transform": transform,
+    }
+    os.makedirs(output_dir, exist_ok=True)
+
+    executor = (
+        # spawned rather than forked, the caller may hold threads (e.g. of jax or
+        # tensorflow) that do not survive a fork
+        ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(config, output_dir),
+        )
+        if num_workers != 0
+        else None
+    )
+
+    failed = True
+    try:
+        manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                manifest: Dict[str, Any] = json.load(f)
+            if manifest["config"] != config or [
+                entry["path"] for entry in manifest["entries"]
+            ] != list(paths):
+                raise ValueError(
+                    f"The manifest in '{output_dir}' was created for a different "
+                    + "configuration or list of files."
+                )
+        else:
+            manifest = _create_outputs(paths, output_dir, config, executor)
+
+        entries: List[Dict[str, Any]] = manifest["entries"]
+        completed: Set[int] = set(manifest["completed"])
+        for k, entry in enumerate(entries):
+            # too short to hold a single segment, nothing to compute
+            if entry["shape"][1] == 0:
+                completed.add(k)
+        pending = [k for k in range(len(entries)) if k not in completed]
+
+        def _done(index: int, shape: List[int]) -> None:
+            entries[index]["shape"] = shape
+            completed.add(index)
+            if len(completed) % checkpoint_interval == 0:
+                manifest["completed"] = sorted(completed)
+                _write_manifest(output_dir, manifest)
+            if progress is not None:
+                progress(len(completed), len(entries))
+
+        try:
+            if executor is None:
+                if pending:
+                    _init_worker(config, output_dir)
+                for k in pending:
+                    index, shape = _extract(k, entries[k]["path"], entries[k]["offset"])
+                    _done(index, shape)
+            else:
+                futures = [
+                    executor.submit(
+                        _extract, k, entries[k]["path"], entries[k]["offset"]
+                    )
+                    for k in pending
+                ]
+                for future in as_completed(futures):
+                    index, shape = future.result()
+                    _done(index, shape)
+        finally:
+            # also on error, such that a resumed extraction skips the finished files
+            manifest["completed"] = sorted(completed)
+            _write_manifest(output_dir, manifest)
+        failed = False
+    finally:
+        if executor is not None:
+            # on error, the files that have not started yet are not waited for
+            executor.shutdown(cancel_futures=failed)
+
+    return manifest
+
+
+def _create_outputs(
+    paths: Sequence[str],
+    output_dir: str,
+    config: Dict[str, Any],
+    executor: ProcessPoolExecutor | None,
+) -> Dict[str, Any]:
+    if executor is None:
+        probes = [_probe(path) for path in paths]
+    else:
+        probes = list(executor.map(_probe, paths, chunksize=64))
+
+    from libsegmenter.WindowSelector import WindowSelector
+
+    segment_size = config["segment_size"]
+    hop_size = WindowSelector(config["window"], config["scheme"], segment_size).hop_size
+    num_bins = segment_size // 2 + 1
+
+    entries: List[Dict[str, Any]] = []
+    offset = 0
+    for path, (num_channels, num_samples) in zip(paths, probes, strict=True):
+        num_segments = max(compute_num_segments(num_samples, hop_size, segment_size), 0)
+        entries.append(
+            {
+                "path": path,
+                "offset": offset,
+                "shape": [num_channels, num_segments, num_bins],
+            }
+        )
+        offset += num_channels * num_segments
+
+    for name, dtype in TRANSFORM_OUTPUTS[config["transform"]]:
+        np.lib.format.open_memmap(
+            _output_path(output_dir, name),
+            mode="w+",
+            dtype=np.dtype(dtype),
+            shape=(offset, num_bins),
+        ).flush()
+
+    manifest: Dict[str, Any] = {
+        "config": config,
+        "hop_size": hop_size,
+        "num_rows": offset,
+        "outputs": [name for name, _ in TRANSFORM_OUTPUTS[config["transform"]]],
+        "entries": entries,
+        "completed": [],
+    }
+    _write_manifest(output_dir, manifest)
+
+    return manifest
+
+
+def load_features(output_dir: str, index: int) -> Tuple[NDArray[Any], ...]:
+    """
+    Opens the features of a single file produced by `batch_extract`.
+
+    Args:
+        output_dir (str): The `output_dir` passed to `batch_extract`.
+        index (int): Index of the file in the original list of paths.
+
+    Returns:
+        Read-only memory-mapped views of shape (num_channels, num_segments, num_bins),
+        one per transform output.
+
+    """
+    with open(os.path.join(output_dir, MANIFEST_NAME)) as f:
+        manifest: Dict[str, Any] = json.load(f)
+
+    if index not in set(manifest["completed"]):
+        raise ValueError(f"File {index} has not been extracted yet.")
+
+    entry = manifest["entries"][index]
+    num_rows = entry["shape"][0] * entry["shape"][1]
+
+    return tuple(
+        np.load(_output_path(output_dir, name), mmap_mode="r")[
+            entry["offset"] : entry["offset"] + num_rows
+        ].reshape(entry["shape"])
+        for name in manifest["outputs"]
+    )
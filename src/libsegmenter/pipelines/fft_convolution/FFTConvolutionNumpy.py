@@ -0,0 +1,156 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any, Dict, Tuple
+
+from libsegmenter.backends.SegmenterNumpy import SegmenterNumpy
+from libsegmenter.pipelines.fft_convolution.common import (
+    METHODS,
+    compute_fft_size,
+    compute_num_blocks,
+)
+from libsegmenter.transforms.spectrogram.SpectrogramNumpy import SpectrogramNumpy
+from libsegmenter.Window import Window
+
+
+class FFTConvolutionNumpy:
+    """
+    A class for convolving batches of signals with long FIR filters.
+
+    The signals are convolved block by block in the frequency domain. With
+    overlap-save, the segmenter frames the signal with a rectangular window and the
+    leading `num_taps - 1` (circularly aliased) samples of every block are
+    discarded. With overlap-add, the signal is cut into disjoint blocks that are
+    zero-padded, and the convolved blocks are overlap-added by the segmenter.
+
+    Attributes:
+        filters (NDArray[Any]): The filter of shape (num_taps,), or a filter per
+            batch item of shape (batch_size, num_taps).
+        method (str): The block convolution method.
+        fft_size (int | None): The FFT size, or None to select it per signal length.
+
+    """
+
+    def __init__(
+        self,
+        filters: NDArray[Any],
+        method: str = "overlap_save",
+        fft_size: int | None = None,
+    ) -> None:
+        """
+        Initializes the FFTConvolutionNumpy instance.
+
+        Args:
+            filters (NDArray[Any]): The filter of shape (num_taps,), or a filter per
+                batch item of shape (batch_size, num_taps).
+            method (str): One of ["overlap_save", "overlap_add"]. Defaults to
+                "overlap_save".
+            fft_size (int | None): The FFT size, an even number larger than
+                num_taps. Defaults to None, which selects the size minimizing the
+                FLOPs for every signal length, see `compute_fft_size`.
+
+        """
+        if filters.ndim not in {1, 2}:
+            raise ValueError(
+                f"Only supports 1D or 2D filters, provided {filters.ndim}D."
+            )
+        if method not in METHODS:
+            raise ValueError(
+                f"The '{method}' method is not known, expected one of {METHODS}."
+            )
+        num_taps = filters.shape[-1]
+        if fft_size is not None and (fft_size % 2 != 0 or fft_size <= num_taps):
+            raise ValueError(
+                f"Expected an even FFT size larger than ({num_taps}), provided "
+                + f"({fft_size})."
+            )
+
+        self.filters = filters
+        self.method = method
+        self.fft_size = fft_size
+
+        self._spectrogram = SpectrogramNumpy()
+        self._plans: Dict[int, Tuple[SegmenterNumpy, NDArray[np.complex128]]] = {}
+
+    def _plan(self, fft_size: int) -> Tuple[SegmenterNumpy, NDArray[np.complex128]]:
+        # the segmenter of the blocks and the spectra of the filters
+        if fft_size not in self._plans:
+            num_taps = self.filters.shape[-1]
+            block_size = fft_size - num_taps + 1
+            if self.method == "overlap_save":
+                window = Window(block_size, np.ones(fft_size), None)
+            else:
+                window = Window(block_size, np.ones(fft_size), np.ones(fft_size))
+            spectra = np.fft.rfft(self.filters, n=fft_size, axis=-1)
+            self._plans[fft_size] = (SegmenterNumpy(window), spectra)
+        return self._plans[fft_size]
+
+    def forward(self, x: NDArray[Any]) -> NDArray[Any]:
+        """
+        Convolves signals with the filters.
+
+        Args:
+            x (NDArray[Any]): Input signal, either 1D (sequence) or 2D (batch). With a
+                filter per batch item, the batch sizes must match.
+
+        Returns:
+            NDArray[Any]: The full convolution of shape (batch_size, num_samples +
+                num_taps - 1), or (num_samples + num_taps - 1,) for a sequence.
+
+        """
+        if x.ndim not in {1, 2}:
+            raise ValueError(f"Only supports 1D or 2D inputs, provided {x.ndim}D.")
+        batched = x.ndim == 2
+        x = x.reshape(-1, x.shape[-1])
+        if self.filters.ndim == 2 and self.filters.shape[0] != x.shape[0]:
+            raise ValueError(
+                f"Expected a batch of ({self.filters.shape[0]}) signals, one per "
+                + f"filter, provided ({x.shape[0]})."
+            )
+
+        num_samples = x.shape[-1]
+        num_taps = self.filters.shape[-1]
+        fft_size = self.fft_size or compute_fft_size(num_samples, num_taps)
+        segmenter, spectra = self._plan(fft_size)
+        block_size = fft_size - num_taps + 1
+        num_blocks = compute_num_blocks(num_samples, num_taps, fft_size)
+        spectra = spectra if spectra.ndim == 1 else spectra[:, np.newaxis, :]
+
+        if self.method == "overlap_save":
+            # blocks overlap by num_taps - 1 samples, which are discarded
+            x = np.pad(
+                x, ((0, 0), (num_taps - 1, (num_blocks + 1) * block_size - num_samples))
+            )
+            blocks = segmenter.segment(x)[:, :num_blocks]
+            y = self._spectrogram.inverse(self._spectrogram.forward(blocks) * spectra)
+            y = y[..., num_taps - 1 :].reshape(x.shape[0], -1)
+        else:
+            # disjoint blocks, zero-padded to the FFT size and overlap-added
+            x = np.pad(x, ((0, 0), (0, num_blocks * block_size - num_samples)))
+            blocks = np.pad(
+                x.reshape(x.shape[0], num_blocks, block_size),
+                ((0, 0), (0, 0), (0, num_taps - 1)),
+            )
+            y = segmenter.unsegment(
+                self._spectrogram.inverse(self._spectrogram.forward(blocks) * spectra)
+            )
+
+        y = y[:, : num_samples + num_taps - 1]
+        return y if batched else y[0]
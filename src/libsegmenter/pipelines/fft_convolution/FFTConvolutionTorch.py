@@ -0,0 +1,158 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import numpy as np
+import torch
+from typing import Dict, Tuple
+
+from libsegmenter.backends.SegmenterTorch import SegmenterTorch
+from libsegmenter.pipelines.fft_convolution.common import (
+    METHODS,
+    compute_fft_size,
+    compute_num_blocks,
+)
+from libsegmenter.transforms.spectrogram.SpectrogramTorch import SpectrogramTorch
+from libsegmenter.Window import Window
+
+
+class FFTConvolutionTorch:
+    """
+    A class for convolving batches of signals with long FIR filters using PyTorch.
+
+    The signals are convolved block by block in the frequency domain, with
+    overlap-save or overlap-add, see `FFTConvolutionNumpy`.
+
+    Attributes:
+        filters (torch.Tensor): The filter of shape (num_taps,), or a filter per
+            batch item of shape (batch_size, num_taps).
+        method (str): The block convolution method.
+        fft_size (int | None): The FFT size, or None to select it per signal length.
+
+    """
+
+    def __init__(
+        self,
+        filters: torch.Tensor,
+        method: str = "overlap_save",
+        fft_size: int | None = None,
+    ) -> None:
+        """
+        Initializes the FFTConvolutionTorch instance.
+
+        Args:
+            filters (torch.Tensor): The filter of shape (num_taps,), or a filter per
+                batch item of shape (batch_size, num_taps).
+            method (str): One of ["overlap_save", "overlap_add"]. Defaults to
+                "overlap_save".
+            fft_size (int | None): The FFT size, an even number larger than
+                num_taps. Defaults to None, which selects the size minimizing the
+                FLOPs for every signal length, see `compute_fft_size`.
+
+        """
+        if filters.ndim not in {1, 2}:
+            raise ValueError(
+                f"Only supports 1D or 2D filters, provided {filters.ndim}D."
+            )
+        if method not in METHODS:
+            raise ValueError(
+                f"The '{method}' method is not known, expected one of {METHODS}."
+            )
+        num_taps = filters.shape[-1]
+        if fft_size is not None and (fft_size % 2 != 0 or fft_size <= num_taps):
+            raise ValueError(
+                f"Expected an even FFT size larger than ({num_taps}), provided "
+                + f"({fft_size})."
+            )
+
+        self.filters = filters
+        self.method = method
+        self.fft_size = fft_size
+
+        self._spectrogram = SpectrogramTorch()
+        self._segmenters: Dict[int, SegmenterTorch] = {}
+        self._spectra: Dict[Tuple[int, torch.dtype, torch.device], torch.Tensor] = {}
+
+    def _plan(
+        self, fft_size: int, dtype: torch.dtype, device: torch.device
+    ) -> Tuple[SegmenterTorch, torch.Tensor]:
+        # the segmenter of the blocks and the spectra of the filters
+        if fft_size not in self._segmenters:
+            block_size = fft_size - self.filters.shape[-1] + 1
+            ones = np.ones(fft_size)
+            synthesis_window = None if self.method == "overlap_save" else ones
+            self._segmenters[fft_size] = SegmenterTorch(
+                Window(block_size, ones, synthesis_window)
+            ).to(device)
+        key = (fft_size, dtype, device)
+        if key not in self._spectra:
+            self._spectra[key] = torch.fft.rfft(  # pyright: ignore
+                self.filters.to(dtype=dtype, device=device), n=fft_size, dim=-1
+            )
+        return self._segmenters[fft_size], self._spectra[key]
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """
+        Convolves signals with the filters.
+
+        Args:
+            x (torch.Tensor): Input signal, either 1D (sequence) or 2D (batch). With a
+                filter per batch item, the batch sizes must match.
+
+        Returns:
+            torch.Tensor: The full convolution of shape (batch_size, num_samples +
+                num_taps - 1), or (num_samples + num_taps - 1,) for a sequence.
+
+        """
+        if x.ndim not in {1, 2}:
+            raise ValueError(f"Only supports 1D or 2D inputs, provided {x.ndim}D.")
+        batched = x.ndim == 2
+        x = x.reshape(-1, x.shape[-1])
+        if self.filters.ndim == 2 and self.filters.shape[0] != x.shape[0]:
+            raise ValueError(
+                f"Expected a batch of ({self.filters.shape[0]}) signals, one per "
+                + f"filter, provided ({x.shape[0]})."
+            )
+
+        num_samples = x.shape[-1]
+        num_taps = self.filters.shape[-1]
+        fft_size = self.fft_size or compute_fft_size(num_samples, num_taps)
+        segmenter, spectra = self._plan(fft_size, x.dtype, x.device)
+        block_size = fft_size - num_taps + 1
+        num_blocks = compute_num_blocks(num_samples, num_taps, fft_size)
+        spectra = spectra if spectra.ndim == 1 else spectra[:, None, :]
+
+        if self.method == "overlap_save":
+            # blocks overlap by num_taps - 1 samples, which are discarded
+            x = torch.nn.functional.pad(
+                x, (num_taps - 1, (num_blocks + 1) * block_size - num_samples)
+            )
+            blocks = segmenter.segment(x)[:, :num_blocks]
+            y = self._spectrogram.inverse(self._spectrogram.forward(blocks) * spectra)
+            y = y[..., num_taps - 1 :].reshape(x.shape[0], -1)
+        else:
+            # disjoint blocks, zero-padded to the FFT size and overlap-added
+            x = torch.nn.functional.pad(x, (0, num_blocks * block_size - num_samples))
+            blocks = torch.nn.functional.pad(
+                x.reshape(x.shape[0], num_blocks, block_size), (0, num_taps - 1)
+            )
+            y = segmenter.unsegment(
+                self._spectrogram.inverse(self._spectrogram.forward(blocks) * spectra)
+            )
+
+        y = y[:, : num_samples + num_taps - 1]
+        return y if batched else y[0]
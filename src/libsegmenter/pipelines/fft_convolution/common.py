@@ -0,0 +1,72 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import numpy as np
+
+METHODS = ["overlap_save", "overlap_add"]
+
+
+def compute_num_blocks(num_samples: int, num_taps: int, fft_size: int) -> int:
+    """
+    Compute the number of blocks of a full FFT convolution.
+
+    Args:
+        num_samples (int): The number of samples of the signal.
+        num_taps (int): The number of taps of the filter.
+        fft_size (int): The FFT size, every block yields `fft_size - num_taps + 1`
+            output samples.
+
+    Returns:
+        int: The number of blocks.
+
+    """
+    block_size = fft_size - num_taps + 1
+    return -(-(num_samples + num_taps - 1) // block_size)
+
+
+def compute_fft_size(num_samples: int, num_taps: int) -> int:
+    """
+    Select the FFT size of a block convolution that minimizes the FLOPs.
+
+    Every block costs a forward and an inverse real FFT, of about
+    `fft_size * log2(fft_size)` FLOPs together, and the product of the spectra. The
+    candidates are the powers of two from the filter length up to a single block
+    covering the whole convolution.
+
+    Args:
+        num_samples (int): The number of samples of the signal.
+        num_taps (int): The number of taps of the filter.
+
+    Returns:
+        int: The FFT size.
+
+    """
+    if num_samples < 1 or num_taps < 1:
+        raise ValueError(
+            "Expected a nonempty signal and filter, provided "
+            + f"num_samples=({num_samples}) and num_taps=({num_taps})."
+        )
+    smallest = max(2, 1 << int(np.ceil(np.log2(num_taps + 1))))
+    largest = max(smallest, 1 << int(np.ceil(np.log2(num_samples + num_taps - 1))))
+
+    def cost(fft_size: int) -> float:
+        num_blocks = compute_num_blocks(num_samples, num_taps, fft_size)
+        return num_blocks * fft_size * (np.log2(fft_size) + 1.0)
+
+    candidates = [smallest << k for k in range(int(np.log2(largest // smallest)) + 1)]
+    return min(candidates, key=cost)
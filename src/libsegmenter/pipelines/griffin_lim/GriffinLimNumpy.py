@@ -0,0 +1,229 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import inspect
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any, Dict, Tuple
+
+from libsegmenter.backends._kernels import select_kernels
+from libsegmenter.backends.common import compute_num_samples
+from libsegmenter.Window import Window
+
+# numpy >= 2.0 writes FFTs into preallocated outputs
+FFT_OUT = "out" in inspect.signature(np.fft.rfft).parameters
+
+EPSILON = 1e-16
+
+
+def _rfft(x: NDArray[np.float64], out: NDArray[np.complex128]) -> NDArray[Any]:
+    if FFT_OUT:
+        return np.fft.rfft(x, axis=-1, out=out)  # pyright: ignore
+    return np.fft.rfft(x, axis=-1)
+
+
+def _irfft(y: NDArray[np.complex128], out: NDArray[np.float64]) -> NDArray[Any]:
+    if FFT_OUT:
+        return np.fft.irfft(y, n=out.shape[-1], axis=-1, out=out)  # pyright: ignore
+    return np.fft.irfft(y, n=out.shape[-1], axis=-1)
+
+
+class GriffinLimNumpy:
+    """
+    A class for reconstructing signals from magnitude spectrograms.
+
+    Runs the fast (momentum-accelerated) Griffin-Lim algorithm: every iteration
+    overlap-adds the spectrogram with the current phase estimate into a signal,
+    segments it again and keeps the phase of the resulting spectrogram. Framing and
+    overlap-add write into buffers that are allocated once per input shape and
+    reused across iterations and calls, as are the FFT outputs on numpy >= 2.0.
+
+    Attributes:
+        window (Window): The window the magnitudes were computed with.
+        num_iterations (int): The maximum number of iterations.
+        momentum (float): The momentum of the fast Griffin-Lim algorithm, 0.0 gives
+            the original algorithm.
+        tol (float | None): Early stopping tolerance on the relative decrease of the
+            spectral convergence.
+        spectral_convergence (NDArray[np.float64] | None): The spectral convergence
+            of every batch item after the last call.
+        iterations (int): The number of iterations run in the last call.
+
+    """
+
+    def __init__(
+        self,
+        window: Window,
+        num_iterations: int = 32,
+        momentum: float = 0.99,
+        tol: float | None = None,
+        use_numba: bool | None = None,
+    ) -> None:
+        """
+        Initializes the GriffinLimNumpy instance.
+
+        Args:
+            window (Window): The window the magnitudes were computed with, its scheme
+                must support unsegmenting.
+            num_iterations (int): The maximum number of iterations. Defaults to 32.
+            momentum (float): The momentum, within [0, 1). Defaults to 0.99.
+            tol (float | None): Stops once the spectral convergence of every batch
+                item decreases by less than this fraction in an iteration. Defaults
+                to None, which runs all iterations.
+            use_numba (bool | None): Whether to use the numba framing and overlap-add
+                kernels. Defaults to None, which uses them when numba is installed.
+
+        """
+        if window.synthesis_window is None:
+            raise ValueError("Given windowing scheme does not support unsegmenting.")
+        if num_iterations < 1:
+            raise ValueError(
+                f"Expected at least one iteration, provided ({num_iterations})."
+            )
+        if not 0.0 <= momentum < 1.0:
+            raise ValueError(f"Expected a momentum within [0, 1), provided {momentum}.")
+
+        self.window = window
+        self.num_iterations = num_iterations
+        self.momentum = momentum
+        self.tol = tol
+        self.spectral_convergence: NDArray[np.float64] | None = None
+        self.iterations = 0
+
+        self._frame, self._overlap_add = select_kernels(use_numba)
+        self._analysis_window = window.analysis_window.astype(np.float64)
+        self._synthesis_window = window.synthesis_window.astype(np.float64)
+        self._buffers: Dict[Tuple[int, ...], Dict[str, NDArray[Any]]] = {}
+
+    def _buffer(self, shape: Tuple[int, ...]) -> Dict[str, NDArray[Any]]:
+        # work buffers for a (batch_size, num_segments, num_bins) spectrogram, only
+        # those of the last shape are kept
+        if shape not in self._buffers:
+            batch_size, num_segments, _ = shape
+            segment_size = self.window.analysis_window.shape[-1]
+            num_samples = compute_num_samples(
+                num_segments, self.window.hop_size, segment_size
+            )
+            self._buffers = {}
+            self._buffers[shape] = {
+                "signal": np.zeros((batch_size, num_samples)),
+                "frames": np.zeros((batch_size, num_segments, segment_size)),
+                "angles": np.zeros(shape, dtype=np.complex128),
+                "rebuilt": np.zeros(shape, dtype=np.complex128),
+                "previous": np.zeros(shape, dtype=np.complex128),
+                "scratch": np.zeros(shape),
+            }
+        return self._buffers[shape]
+
+    def _istft(
+        self, spectrum: NDArray[np.complex128], buffers: Dict[str, NDArray[Any]]
+    ) -> NDArray[np.float64]:
+        # overlap-adds the spectrogram into the signal buffer
+        frames = _irfft(spectrum, buffers["frames"])
+        signal = buffers["signal"]
+        signal.fill(0.0)
+        self._overlap_add(
+            frames, self._synthesis_window, self.window.hop_size, 0, signal
+        )
+        return signal
+
+    def forward(
+        self, magnitude: NDArray[Any], phase: NDArray[Any] | None = None
+    ) -> NDArray[Any]:
+        """
+        Reconstructs a signal from a magnitude spectrogram.
+
+        Args:
+            magnitude (NDArray[Any]): Magnitude spectrogram of shape (batch_size,
+                num_segments, segment_size // 2 + 1) or (num_segments, segment_size
+                // 2 + 1), e.g. from `MagnitudePhase` or the inverse of `Mel`.
+            phase (NDArray[Any] | None): The initial phase estimate. Defaults to
+                None, which draws uniformly random phases.
+
+        Returns:
+            NDArray[Any]: The reconstructed signal, as returned by `unsegment`.
+
+        """
+        if magnitude.ndim not in {2, 3}:
+            raise ValueError(
+                f"Only supports 2D or 3D inputs, provided {magnitude.ndim}D."
+            )
+        segment_size = self.window.analysis_window.shape[-1]
+        if magnitude.shape[-1] != segment_size // 2 + 1:
+            raise ValueError(
+                f"Expected ({segment_size // 2 + 1}) bins, provided "
+                + f"({magnitude.shape[-1]})."
+            )
+
+        batched = magnitude.ndim == 3
+        dtype = np.result_type(magnitude.dtype, np.float32)
+        magnitude = np.asarray(magnitude, dtype=np.float64).reshape(
+            -1, *magnitude.shape[-2:]
+        )
+        buffers = self._buffer(magnitude.shape)
+        angles, previous, scratch = (
+            buffers["angles"],
+            buffers["previous"],
+            buffers["scratch"],
+        )
+
+        if phase is None:
+            phase = np.random.uniform(0.0, 2.0 * np.pi, magnitude.shape)
+        np.exp(1j * np.asarray(phase).reshape(magnitude.shape), out=angles)
+        previous.fill(0.0)
+
+        norm = np.sqrt(np.sum(np.square(magnitude), axis=(-2, -1))) + EPSILON
+        convergence = np.full(magnitude.shape[0], np.inf)
+        self.iterations = 0
+        for _ in range(self.num_iterations):
+            # project onto consistent spectrograms
+            np.multiply(angles, magnitude, out=angles)
+            signal = self._istft(angles, buffers)
+            self._frame(
+                signal,
+                self._analysis_window,
+                self.window.hop_size,
+                0,
+                buffers["frames"],
+            )
+            rebuilt = _rfft(buffers["frames"], buffers["rebuilt"])
+
+            np.abs(rebuilt, out=scratch)
+            np.subtract(scratch, magnitude, out=scratch)
+            previous_convergence = convergence
+            convergence = np.sqrt(np.sum(np.square(scratch), axis=(-2, -1))) / norm
+
+            # accelerated phase update, angles = rebuilt - m / (1 + m) * previous
+            np.multiply(previous, -self.momentum / (1.0 + self.momentum), out=angles)
+            np.add(angles, rebuilt, out=angles)
+            np.abs(angles, out=scratch)
+            np.add(scratch, EPSILON, out=scratch)
+            np.divide(angles, scratch, out=angles)
+            np.copyto(previous, rebuilt)
+            self.iterations += 1
+
+            if self.tol is not None and np.all(
+                previous_convergence - convergence < self.tol * previous_convergence
+            ):
+                break
+
+        self.spectral_convergence = convergence
+
+        np.multiply(angles, magnitude, out=angles)
+        x = self._istft(angles, buffers).astype(dtype)
+        return x if batched else x[0]
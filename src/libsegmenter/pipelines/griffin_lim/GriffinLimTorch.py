@@ -0,0 +1,233 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import math
+import torch
+from typing import Dict, Tuple, cast
+
+from libsegmenter.backends.common import compute_num_samples
+from libsegmenter.Window import Window
+
+EPSILON = 1e-16
+
+
+class GriffinLimTorch(torch.nn.Module):
+    """
+    A class for reconstructing signals from magnitude spectrograms using PyTorch.
+
+    Runs the fast (momentum-accelerated) Griffin-Lim algorithm, see
+    `GriffinLimNumpy`. The spectra are written into buffers that are allocated once
+    per input shape and reused across iterations and calls, framing is a strided
+    view through `unfold` and overlap-add a single `fold`.
+
+    Attributes:
+        window (Window): The window the magnitudes were computed with.
+        num_iterations (int): The maximum number of iterations.
+        momentum (float): The momentum of the fast Griffin-Lim algorithm, 0.0 gives
+            the original algorithm.
+        tol (float | None): Early stopping tolerance on the relative decrease of the
+            spectral convergence.
+        spectral_convergence (torch.Tensor | None): The spectral convergence of every
+            batch item after the last call.
+        iterations (int): The number of iterations run in the last call.
+
+    """
+
+    analysis_window: torch.Tensor
+    synthesis_window: torch.Tensor
+
+    def __init__(
+        self,
+        window: Window,
+        num_iterations: int = 32,
+        momentum: float = 0.99,
+        tol: float | None = None,
+    ) -> None:
+        """
+        Initializes the GriffinLimTorch instance.
+
+        Args:
+            window (Window): The window the magnitudes were computed with, its scheme
+                must support unsegmenting.
+            num_iterations (int): The maximum number of iterations. Defaults to 32.
+            momentum (float): The momentum, within [0, 1). Defaults to 0.99.
+            tol (float | None): Stops once the spectral convergence of every batch
+                item decreases by less than this fraction in an iteration. Defaults
+                to None, which runs all iterations.
+
+        """
+        super().__init__()  # type: ignore
+        if window.synthesis_window is None:
+            raise ValueError("Given windowing scheme does not support unsegmenting.")
+        if num_iterations < 1:
+            raise ValueError(
+                f"Expected at least one iteration, provided ({num_iterations})."
+            )
+        if not 0.0 <= momentum < 1.0:
+            raise ValueError(f"Expected a momentum within [0, 1), provided {momentum}.")
+
+        self.window = window
+        self.num_iterations = num_iterations
+        self.momentum = momentum
+        self.tol = tol
+        self.spectral_convergence: torch.Tensor | None = None
+        self.iterations = 0
+
+        # buffers keep the native dtype of the window, and are cast per call
+        self.register_buffer(
+            "analysis_window", torch.as_tensor(window.analysis_window), persistent=False
+        )
+        self.register_buffer(
+            "synthesis_window",
+            torch.as_tensor(window.synthesis_window),
+            persistent=False,
+        )
+        self._buffers_cache: Dict[
+            Tuple[Tuple[int, ...], torch.dtype, torch.device], Dict[str, torch.Tensor]
+        ] = {}
+
+    def _buffer(
+        self, shape: Tuple[int, ...], dtype: torch.dtype, device: torch.device
+    ) -> Dict[str, torch.Tensor]:
+        # work buffers for a (batch_size, num_segments, num_bins) spectrogram, only
+        # those of the last shape are kept
+        key = (shape, dtype, device)
+        if key not in self._buffers_cache:
+            complex_dtype = torch.promote_types(dtype, torch.complex64)
+            segment_size = self.window.analysis_window.shape[-1]
+            self._buffers_cache = {}
+            self._buffers_cache[key] = {
+                "frames": torch.zeros(
+                    (*shape[:-1], segment_size), dtype=dtype, device=device
+                ),
+                "angles": torch.zeros(shape, dtype=complex_dtype, device=device),
+                "rebuilt": torch.zeros(shape, dtype=complex_dtype, device=device),
+                "previous": torch.zeros(shape, dtype=complex_dtype, device=device),
+                "scratch": torch.zeros(shape, dtype=dtype, device=device),
+            }
+        return self._buffers_cache[key]
+
+    def _istft(
+        self, spectrum: torch.Tensor, buffers: Dict[str, torch.Tensor]
+    ) -> torch.Tensor:
+        # overlap-adds the spectrogram into a signal
+        frames = buffers["frames"]
+        batch_size, num_segments, segment_size = frames.shape
+        num_samples = compute_num_samples(
+            num_segments, self.window.hop_size, segment_size
+        )
+        torch.fft.irfft(spectrum, n=segment_size, dim=-1, out=frames)  # pyright: ignore
+        frames.mul_(self.synthesis_window.to(frames.dtype))  # pyright: ignore
+        return torch.nn.functional.fold(
+            frames.transpose(1, 2),
+            output_size=(1, num_samples),
+            kernel_size=(1, segment_size),
+            stride=(1, self.window.hop_size),
+        ).reshape(batch_size, num_samples)
+
+    @torch.no_grad()  # pyright: ignore
+    def forward(
+        self, magnitude: torch.Tensor, phase: torch.Tensor | None = None
+    ) -> torch.Tensor:
+        """
+        Reconstructs a signal from a magnitude spectrogram.
+
+        Args:
+            magnitude (torch.Tensor): Magnitude spectrogram of shape (batch_size,
+                num_segments, segment_size // 2 + 1) or (num_segments, segment_size
+                // 2 + 1), e.g. from `MagnitudePhase` or the inverse of `Mel`.
+            phase (torch.Tensor | None): The initial phase estimate. Defaults to
+                None, which draws uniformly random phases.
+
+        Returns:
+            torch.Tensor: The reconstructed signal, as returned by `unsegment`.
+
+        """
+        if magnitude.ndim not in {2, 3}:
+            raise ValueError(
+                f"Only supports 2D or 3D inputs, provided {magnitude.ndim}D."
+            )
+        segment_size = self.window.analysis_window.shape[-1]
+        if magnitude.shape[-1] != segment_size // 2 + 1:
+            raise ValueError(
+                f"Expected ({segment_size // 2 + 1}) bins, provided "
+                + f"({magnitude.shape[-1]})."
+            )
+
+        batched = magnitude.ndim == 3
+        magnitude = magnitude.reshape(-1, *magnitude.shape[-2:])
+        buffers = self._buffer(
+            tuple(magnitude.shape), magnitude.dtype, magnitude.device
+        )
+        angles, rebuilt, previous, scratch = (
+            buffers["angles"],
+            buffers["rebuilt"],
+            buffers["previous"],
+            buffers["scratch"],
+        )
+
+        if phase is None:
+            phase = 2.0 * math.pi * torch.rand_like(magnitude)
+        angles.copy_(
+            torch.polar(torch.ones_like(magnitude), phase.reshape_as(magnitude))
+        )
+        previous.zero_()
+
+        norm = (
+            cast(
+                torch.Tensor,
+                torch.linalg.vector_norm(magnitude, dim=(-2, -1)),  # pyright: ignore
+            )
+            + EPSILON
+        )
+        convergence = torch.full_like(norm, math.inf)
+        analysis_window = self.analysis_window.to(magnitude.dtype)  # pyright: ignore
+        self.iterations = 0
+        for _ in range(self.num_iterations):
+            # project onto consistent spectrograms
+            signal = self._istft(angles.mul_(magnitude), buffers)
+            frames = signal.unfold(-1, segment_size, self.window.hop_size)
+            torch.fft.rfft(frames * analysis_window, dim=-1, out=rebuilt)  # pyright: ignore
+
+            torch.abs(rebuilt, out=scratch).sub_(magnitude)
+            previous_convergence = convergence
+            convergence = (
+                cast(
+                    torch.Tensor,
+                    torch.linalg.vector_norm(scratch, dim=(-2, -1)),  # pyright: ignore
+                )
+                / norm
+            )
+
+            # accelerated phase update, angles = rebuilt - m / (1 + m) * previous
+            torch.mul(previous, -self.momentum / (1.0 + self.momentum), out=angles)
+            angles.add_(rebuilt)
+            angles.div_(torch.abs(angles, out=scratch).add_(EPSILON))
+            previous.copy_(rebuilt)
+            self.iterations += 1
+
+            if self.tol is not None and bool(
+                torch.all(
+                    previous_convergence - convergence < self.tol * previous_convergence
+                )
+            ):
+                break
+
+        self.spectral_convergence = convergence
+        x = self._istft(angles.mul_(magnitude), buffers)
+        return x if batched else x[0]
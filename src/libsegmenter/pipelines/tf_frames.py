@@ -0,0 +1,118 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import Any, Callable, cast
+
+from libsegmenter.Window import Window
+
+TRANSFORMS = ["spectrogram", "magnitude_phase"]
+
+
+def tf_frames(
+    window: Window,
+    transform: str | None = None,
+    unbatch: bool = False,
+    num_parallel_calls: int | None = None,
+) -> Callable[[Any], Any]:
+    """
+    Creates a `tf.data` transformation segmenting the signals of a dataset.
+
+    Meant to be used as `dataset.apply(tf_frames(window, ...))`. Segmentation and the
+    optional transform are expressed with graph operations only, so the mapping runs
+    inside the input pipeline in parallel. The frames match `SegmenterTensorFlow`.
+
+    The dataset elements are either signals of shape (num_samples,) or
+    (batch_size, num_samples), or tuples whose first component is such a signal. The
+    other components (e.g. labels) are passed through unchanged.
+
+    Args:
+        window (Window): A window object containing segmentation parameters.
+        transform (str | None): The transform to apply to the frames. Supported
+            options: ["spectrogram", "magnitude_phase"]. Defaults to None (windowed
+            segments).
+        unbatch (bool): Whether to unbatch the result into a frame-level dataset. The
+            other components of tuple elements must then have the same leading
+            (batch and) frame dimensions as the frames, e.g. per-frame labels.
+            Defaults to False.
+        num_parallel_calls (int | None): The parallelism of the mapping. Defaults to
+            `tf.data.AUTOTUNE`.
+
+    Returns:
+        A function mapping a `tf.data.Dataset` onto the segmented dataset.
+
+    """
+    import tensorflow as tf
+
+    if transform is not None and transform not in TRANSFORMS:
+        raise ValueError(
+            f"The '{transform}' transform is not supported, availible: {TRANSFORMS}"
+        )
+
+    hop_size = window.hop_size
+    segment_size = window.analysis_window.shape[-1]
+    # mirrors compute_num_segments
+    extra = 0 if segment_size % hop_size > 0 else 1
+
+    def frames(x: Any) -> Any:
+        num_segments = tf.shape(x)[-1] // hop_size - segment_size // hop_size + extra
+        y = cast(
+            Any,
+            tf.signal.frame(x, segment_size, hop_size, axis=-1),  # pyright: ignore
+        )
+        y = y[..., : tf.maximum(num_segments, 0), :]
+        y = y * tf.constant(window.analysis_window, dtype=x.dtype)
+
+        if transform == "spectrogram":
+            return cast(Any, tf.signal.rfft(y))  # pyright: ignore
+        if transform == "magnitude_phase":
+            spectrogram = cast(Any, tf.signal.rfft(y))  # pyright: ignore
+            return tf.abs(spectrogram), tf.math.angle(spectrogram)
+        return y
+
+    def flatten(x: Any, num_dims: Any) -> Any:
+        return tf.reshape(x, tf.concat([[-1], tf.shape(x)[num_dims:]], axis=0))
+
+    def apply(*element: Any) -> Any:
+        signal, rest = element[0], element[1:]
+        features = frames(signal)
+        if unbatch:
+            # flatten the batch and frame dimensions into one
+            num_dims = cast(Any, tf.rank(signal))  # pyright: ignore
+
+            def flatten_features(f: Any) -> Any:
+                return flatten(f, num_dims)
+
+            features = cast(
+                Any,
+                tf.nest.map_structure(flatten_features, features),  # pyright: ignore
+            )
+            rest = tuple(flatten(r, num_dims) for r in rest)
+
+        return (features, *rest) if rest else features
+
+    def transformation(dataset: Any) -> Any:
+        dataset = dataset.map(
+            apply,
+            num_parallel_calls=(
+                tf.data.AUTOTUNE if num_parallel_calls is None else num_parallel_calls
+            ),
+        )
+        return dataset.unbatch() if unbatch else dataset
+
+    return transformation
@@ -0,0 +1,224 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any, Dict, List, Tuple
+
+from libsegmenter.Window import Window
+
+
+def _digest(*chunks: bytes | memoryview) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for chunk in chunks:
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def _describe_window(window: Window) -> Dict[str, Any]:
+    synthesis_window = window.synthesis_window
+    return {
+        "hop_size": window.hop_size,
+        "segment_size": int(window.analysis_window.shape[-1]),
+        "dtype": window.analysis_window.dtype.str,
+        "analysis_window": _digest(np.ascontiguousarray(window.analysis_window).data),
+        "synthesis_window": None
+        if synthesis_window is None
+        else _digest(np.ascontiguousarray(synthesis_window).data),
+    }
+
+
+class FeatureCache:
+    """
+    An on-disk cache in front of a numpy `Segmenter` and transform.
+
+    Results are keyed on a hash of the input samples together with a canonical
+    description of the `Window` (hop size, segment size, datatype and window
+    coefficients) and the transform. Each entry is stored as one `.npy` file per
+    output, a cache hit returns read-only memory-mapped arrays. When the cache
+    grows beyond `max_bytes`, the least recently used entries are evicted.
+
+    Attributes:
+        directory (str): The directory holding the cache entries.
+        window (Window): The window used for segmentation.
+        transform (str | None): The transform applied to the segments.
+        max_bytes (int): The maximum size of the cache on disk.
+        hits (int): Number of cache hits so far.
+        misses (int): Number of cache misses so far.
+
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        window: Window,
+        transform: str | None = "spectrogram",
+        max_bytes: int = 2**30,
+    ) -> None:
+        """
+        Initializes the FeatureCache instance.
+
+        Args:
+            directory (str): The directory holding the cache entries, created if it
+                does not exist.
+            window (Window): A window object containing segmentation parameters.
+            transform (str | None): The transform to apply, as accepted by
+                `TransformSelector`, or `None` to cache the segments. Defaults to
+                "spectrogram".
+            max_bytes (int): The maximum size of the cache on disk. Defaults to 1GiB.
+
+        """
+        from libsegmenter.backends.SegmenterNumpy import SegmenterNumpy
+        from libsegmenter.TransformSelector import TransformSelector
+
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.window = window
+        self.transform = transform
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._segmenter = SegmenterNumpy(window)
+        self._transform = (
+            TransformSelector(transform, "numpy") if transform is not None else None
+        )
+        self._config = json.dumps(
+            {"window": _describe_window(window), "transform": transform},
+            sort_keys=True,
+        ).encode()
+
+    def key(self, x: NDArray[Any]) -> str:
+        """
+        Computes the cache key of an input signal.
+
+        Args:
+            x (NDArray[Any]): Input array, either 1D (sequence) or 2D (batch).
+
+        Returns:
+            The cache key.
+
+        """
+        x = np.ascontiguousarray(x)
+        return _digest(
+            self._config, x.dtype.str.encode(), str(x.shape).encode(), x.data
+        )
+
+    def __call__(self, x: NDArray[Any]) -> NDArray[Any] | Tuple[NDArray[Any], ...]:
+        """
+        Segments and transforms the input, reusing a cached result if possible.
+
+        Args:
+            x (NDArray[Any]): Input array, either 1D (sequence) or 2D (batch).
+
+        Returns:
+            The transformed segments, as read-only memory-mapped arrays on a hit.
+
+        """
+        key = self.key(x)
+        path = os.path.join(self.directory, key)
+
+        if os.path.isdir(path):
+            try:
+                outputs = self._load(path)
+                os.utime(path)  # mark as recently used
+                self.hits += 1
+                return outputs
+            except FileNotFoundError:
+                pass  # evicted concurrently, recompute
+
+        self.misses += 1
+        y: NDArray[Any] | Tuple[NDArray[Any], ...] = self._segmenter.segment(x)
+        if self._transform is not None:
+            y = self._transform.forward(y)
+
+        self._store(path, y if isinstance(y, tuple) else (y,))
+        self._evict(keep=key)
+
+        return y
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        for entry in os.scandir(self.directory):
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+    def size(self) -> int:
+        """
+        Computes the current size of the cache on disk.
+
+        Returns:
+            The size of all cache entries in bytes.
+
+        """
+        return sum(size for _, _, size in self._entries())
+
+    def _load(self, path: str) -> NDArray[Any] | Tuple[NDArray[Any], ...]:
+        with open(os.path.join(path, "outputs")) as f:
+            num_outputs = int(f.read())
+
+        outputs = tuple(
+            np.load(os.path.join(path, f"{k}.npy"), mmap_mode="r")
+            for k in range(num_outputs)
+        )
+        return outputs if num_outputs > 1 else outputs[0]
+
+    def _store(self, path: str, outputs: Tuple[NDArray[Any], ...]) -> None:
+        # write into a temporary directory and rename, so readers never observe a
+        # partially written entry
+        tmp_path = tempfile.mkdtemp(dir=self.directory, prefix=".tmp-")
+        for k, output in enumerate(outputs):
+            np.save(os.path.join(tmp_path, f"{k}.npy"), output)
+        with open(os.path.join(tmp_path, "outputs"), "w") as f:
+            f.write(str(len(outputs)))
+
+        try:
+            os.rename(tmp_path, path)
+        except OSError:
+            # stored concurrently by another process
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def _entries(self) -> List[Tuple[str, float, int]]:
+        entries: List[Tuple[str, float, int]] = []
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith(".tmp-") or not entry.is_dir():
+                continue
+            try:
+                size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                entries.append((entry.name, entry.stat().st_mtime, size))
+            except FileNotFoundError:
+                continue
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        entries = self._entries()
+        total = sum(size for _, _, size in entries)
+
+        for name, _, size in sorted(entries, key=lambda entry: entry[1]):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+            total -= size
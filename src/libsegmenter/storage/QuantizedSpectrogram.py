@@ -0,0 +1,265 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import json
+import struct
+import numpy as np
+from numpy.typing import NDArray, DTypeLike
+from typing import Any, Dict, Tuple
+
+MAGIC = b"LSQSPEC\x01"
+ALIGNMENT = 64
+DTYPES = ["uint8", "uint16", "float16"]
+
+
+def _check_dtype(dtype: str) -> None:
+    if dtype not in DTYPES:
+        raise ValueError(f"Unsupported dtype {dtype}, availible: {DTYPES}")
+
+
+def _quantize_magnitude(
+    log_magnitude: NDArray[Any], dtype: str, chunk_size: int
+) -> Tuple[NDArray[Any], NDArray[np.float64], NDArray[np.float64]]:
+    num_frames = log_magnitude.shape[0]
+    num_chunks = -(-num_frames // chunk_size)
+
+    if dtype == "float16":
+        zeros = np.zeros(num_chunks)
+        return log_magnitude.astype(np.float16), zeros, zeros
+
+    levels = float(np.iinfo(np.dtype(dtype)).max)
+    lo = np.empty(num_chunks)
+    hi = np.empty(num_chunks)
+    q = np.empty(log_magnitude.shape, dtype=dtype)
+    for k in range(num_chunks):
+        chunk = log_magnitude[k * chunk_size : (k + 1) * chunk_size]
+        lo[k], hi[k] = chunk.min(), chunk.max()
+        scale = levels / (hi[k] - lo[k]) if hi[k] > lo[k] else 0.0
+        q[k * chunk_size : (k + 1) * chunk_size] = np.rint((chunk - lo[k]) * scale)
+
+    return q, lo, hi
+
+
+def _quantize_phase(phase: NDArray[Any], dtype: str) -> NDArray[Any]:
+    if dtype == "float16":
+        return phase.astype(np.float16)
+
+    levels = float(np.iinfo(np.dtype(dtype)).max) + 1.0
+    q = np.rint((phase + np.pi) * (levels / (2.0 * np.pi))) % levels
+    return q.astype(dtype)
+
+
+def write_quantized_spectrogram(
+    path: str,
+    magnitude: NDArray[Any],
+    phase: NDArray[Any] | None = None,
+    dtype: str = "uint8",
+    phase_dtype: str | None = None,
+    chunk_size: int = 256,
+    floor: float = 1e-7,
+) -> None:
+    """
+    Writes a magnitude (and phase) spectrogram to a compact quantized file.
+
+    The magnitude is stored as quantized log-magnitude, the phase is quantized
+    uniformly over [-pi, pi). Integer formats are quantized per chunk of
+    `chunk_size` frames, the per-chunk ranges form an index which allows
+    `QuantizedSpectrogramReader` to memory-map and decode any range of frames.
+
+    Batched inputs are stored as the frames of all batch items in order, the
+    original shape is kept in the header.
+
+    Args:
+        path (str): The file to write.
+        magnitude (NDArray[Any]): Magnitude spectrogram of shape
+            (num_segments, num_bins) or (batch_size, num_segments, num_bins), e.g.
+            from `MagnitudePhaseNumpy.forward`.
+        phase (NDArray[Any] | None): Optional phase spectrogram of the same shape.
+        dtype (str): Storage format of the log-magnitude. Supported options:
+            ["uint8", "uint16", "float16"]. Defaults to "uint8".
+        phase_dtype (str | None): Storage format of the phase, same options as
+            `dtype`. Defaults to `dtype`.
+        chunk_size (int): Number of frames per quantization chunk. Defaults to 256.
+        floor (float): Magnitudes are clipped to this value before taking the
+            logarithm. Defaults to 1e-7.
+
+    Raises:
+        ValueError: If the inputs have an unsupported shape or dtype.
+
+    """
+    phase_dtype = dtype if phase_dtype is None else phase_dtype
+    _check_dtype(dtype)
+    _check_dtype(phase_dtype)
+
+    if magnitude.ndim not in {2, 3}:
+        raise ValueError(
+            "Only supports 2D (num_segments, num_bins) or 3D (batch_size, "
+            + f"num_segments, num_bins) inputs, provided {magnitude.ndim}D."
+        )
+    if phase is not None and phase.shape != magnitude.shape:
+        raise ValueError(
+            "The magnitude and phase must be of equal shape. Received magnitude shape "
+            + f"= {magnitude.shape} and phase shape = {phase.shape}."
+        )
+    if chunk_size <= 0:
+        raise ValueError(f"The chunk size must be positive, received {chunk_size}.")
+
+    shape = list(magnitude.shape)
+    magnitude = magnitude.reshape(-1, shape[-1])
+    if phase is not None:
+        phase = phase.reshape(-1, shape[-1])
+
+    log_magnitude = np.log(np.maximum(magnitude, floor))
+    q_magnitude, lo, hi = _quantize_magnitude(log_magnitude, dtype, chunk_size)
+    q_phase = _quantize_phase(phase, phase_dtype) if phase is not None else None
+
+    header: Dict[str, Any] = {
+        "num_frames": magnitude.shape[0],
+        "num_bins": magnitude.shape[1],
+        "shape": shape,
+        "dtype": dtype,
+        "phase_dtype": phase_dtype if phase is not None else None,
+        "chunk_size": chunk_size,
+        "floor": floor,
+        "lo": lo.tolist(),
+        "hi": hi.tolist(),
+    }
+    encoded = json.dumps(header).encode()
+    data_offset = -(-(len(MAGIC) + 8 + len(encoded)) // ALIGNMENT) * ALIGNMENT
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(encoded)))
+        f.write(encoded)
+        f.write(b"\0" * (data_offset - f.tell()))
+        f.write(np.ascontiguousarray(q_magnitude).tobytes())
+        if q_phase is not None:
+            f.write(np.ascontiguousarray(q_phase).tobytes())
+
+
+class QuantizedSpectrogramReader:
+    """
+    A reader for files written by `write_quantized_spectrogram`.
+
+    The file is memory-mapped, reading a range of frames only touches and decodes
+    the bytes of that range. Frames are indexed as stored, i.e. for batched inputs
+    frame `k` of batch item `b` is frame `b * shape[-2] + k`.
+
+    Attributes:
+        num_frames (int): Number of stored frames, over all batch items.
+        num_bins (int): Number of frequency bins per frame.
+        shape (Tuple[int, ...]): The shape of the written spectrogram.
+        has_phase (bool): Whether the file contains a phase spectrogram.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initializes the QuantizedSpectrogramReader instance.
+
+        Args:
+            path (str): The file to read.
+
+        """
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"'{path}' is not a quantized spectrogram file.")
+            (header_size,) = struct.unpack("<Q", f.read(8))
+            header: Dict[str, Any] = json.loads(f.read(header_size))
+        data_offset = -(-(len(MAGIC) + 8 + header_size) // ALIGNMENT) * ALIGNMENT
+
+        self.num_frames: int = header["num_frames"]
+        self.num_bins: int = header["num_bins"]
+        self.shape: Tuple[int, ...] = tuple(
+            header.get("shape", [self.num_frames, self.num_bins])
+        )
+        self.has_phase = header["phase_dtype"] is not None
+
+        self._dtype: str = header["dtype"]
+        self._phase_dtype: str | None = header["phase_dtype"]
+        self._chunk_size: int = header["chunk_size"]
+        self._floor: float = header["floor"]
+        self._lo = np.asarray(header["lo"])
+        self._hi = np.asarray(header["hi"])
+
+        shape = (self.num_frames, self.num_bins)
+        self._magnitude = np.memmap(
+            path, dtype=self._dtype, mode="r", offset=data_offset, shape=shape
+        )
+        self._phase = None
+        if self._phase_dtype is not None:
+            self._phase = np.memmap(
+                path,
+                dtype=self._phase_dtype,
+                mode="r",
+                offset=data_offset + self._magnitude.nbytes,
+                shape=shape,
+            )
+
+    def __len__(self) -> int:
+        """Returns the number of stored frames."""
+        return self.num_frames
+
+    def read(
+        self,
+        start: int = 0,
+        stop: int | None = None,
+        dtype: DTypeLike = np.float32,
+    ) -> Tuple[NDArray[Any], NDArray[Any] | None]:
+        """
+        Decodes a range of frames.
+
+        Args:
+            start (int): The first frame to read. Defaults to 0.
+            stop (int | None): One past the last frame to read. Defaults to the
+                number of frames.
+            dtype (DTypeLike): The datatype of the outputs. Defaults to float32.
+
+        Returns:
+            Tuple[NDArray[Any], NDArray[Any] | None]:
+                A 2-tuple containing:
+                (magnitude, phase), each of shape (stop - start, num_bins) as
+                expected by `MagnitudePhaseNumpy.inverse`. The phase is `None` if
+                the file does not contain one.
+
+        """
+        start, stop, _ = slice(start, stop).indices(self.num_frames)
+        stop = max(start, stop)
+
+        q = self._magnitude[start:stop]
+        if self._dtype == "float16":
+            log_magnitude = q.astype(dtype)
+        else:
+            chunks = np.arange(start, stop) // self._chunk_size
+            lo = self._lo[chunks].reshape(-1, 1)
+            hi = self._hi[chunks].reshape(-1, 1)
+            levels = float(np.iinfo(np.dtype(self._dtype)).max)
+            log_magnitude = (lo + q * ((hi - lo) / levels)).astype(dtype)
+        magnitude = np.exp(log_magnitude)
+
+        phase = None
+        if self._phase is not None and self._phase_dtype is not None:
+            q = self._phase[start:stop]
+            if self._phase_dtype == "float16":
+                phase = q.astype(dtype)
+            else:
+                levels = float(np.iinfo(np.dtype(self._phase_dtype)).max) + 1.0
+                phase = (q * (2.0 * np.pi / levels) - np.pi).astype(dtype)
+
+        return magnitude, phase
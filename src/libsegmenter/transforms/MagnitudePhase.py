@@ -29,7 +29,7 @@ def MagnitudePhase(backend: str = "numpy", *args: Any, **kwargs: Any) -> Any:
 
     Args:
         backend (str, optional): The backend to use. Supported options:
-            ["numpy", "torch", "tensorflow"]. Defaults to "numpy".
+            ["numpy", "torch", "tensorflow", "jax"]. Defaults to "numpy".
         *args (Any): Additional positional arguments to pass to the segmenter.
         **kwargs (Any): Additional keyword arguments to pass to the segmenter.
 
@@ -62,4 +62,11 @@ def MagnitudePhase(backend: str = "numpy", *args: Any, **kwargs: Any) -> Any:
 
         return MagnitudePhaseTorch(*args, **kwargs)
 
+    if backend == "jax":
+        from libsegmenter.transforms.magnitude_phase.MagnitudePhaseJax import (
+            MagnitudePhaseJax,
+        )
+
+        return MagnitudePhaseJax(*args, **kwargs)
+
     raise ValueError(f"The '{backend}' backend is not known.")
@@ -29,7 +29,7 @@ def Spectrogram(backend: str = "numpy", *args: Any, **kwargs: Any) -> Any:
 
     Args:
         backend (str, optional): The backend to use. Supported options:
-            ["numpy", "torch", "tensorflow"]. Defaults to "numpy".
+            ["numpy", "torch", "tensorflow", "jax"]. Defaults to "numpy".
         *args (Any): Additional positional arguments to pass to the segmenter.
         **kwargs (Any): Additional keyword arguments to pass to the segmenter.
 
@@ -62,4 +62,9 @@ def Spectrogram(backend: str = "numpy", *args: Any, **kwargs: Any) -> Any:
 
         return SpectrogramTorch(*args, **kwargs)
 
+    if backend == "jax":
+        from libsegmenter.transforms.spectrogram.SpectrogramJax import SpectrogramJax
+
+        return SpectrogramJax(*args, **kwargs)
+
     raise ValueError(f"The '{backend}' backend is not known.")
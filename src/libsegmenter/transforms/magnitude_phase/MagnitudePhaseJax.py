@@ -0,0 +1,66 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import jax
+import jax.numpy as jnp
+from typing import Tuple, Any
+from libsegmenter.transforms.spectrogram.SpectrogramJax import SpectrogramJax
+
+
+class MagnitudePhaseJax:
+    """A class for computing magnitudes and phases using JAX."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initializes the MagnitudePhaseJax instance."""
+        self._spectrogram = SpectrogramJax(*args, **kwargs)
+
+    def forward(
+        self, x: jax.Array, mask: jax.Array | None = None
+    ) -> Tuple[jax.Array, jax.Array]:
+        """
+        Converts segments into a magnitude and phase spectrogram.
+
+        Args:
+            x (jax.Array): Segments as generated by a Segmenter object.
+            mask (jax.Array | None): Optional boolean mask over the leading
+                dimensions of `x`, as returned by `segment_padded`. Frames outside
+                the mask are zero.
+
+        Returns:
+            Tuple[jax.Array, jax.Array]: The magnitude and phase spectrograms.
+
+        """
+        tensor = self._spectrogram.forward(x, mask)
+        return jnp.abs(tensor), jnp.angle(tensor)
+
+    def inverse(
+        self, magnitude: jax.Array, phase: jax.Array, mask: jax.Array | None = None
+    ) -> jax.Array:
+        """
+        Converts magnitude / phase spectrogram into segments.
+
+        Args:
+            magnitude (jax.Array): Magnitude spectrogram resulting from a `forward`
+                pass.
+            phase (jax.Array): Phase spectrogram resulting from a `forward` pass.
+            mask (jax.Array | None): Optional boolean mask over the leading
+                dimensions of the spectrograms. Frames outside the mask are zero.
+
+        """
+        return self._spectrogram.inverse(magnitude * jnp.exp(1j * phase), mask)
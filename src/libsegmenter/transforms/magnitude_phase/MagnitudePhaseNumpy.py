@@ -38,19 +38,27 @@ class MagnitudePhaseNumpy:
         """Initializes the MagnitudePhaseNumpy instance."""
         self._spectrogram = SpectrogramNumpy(*args, **kwargs)
 
-    def forward(self, x: NDArray[T]) -> Tuple[NDArray[Any], NDArray[Any]]:
+    def forward(
+        self, x: NDArray[T], mask: NDArray[np.bool_] | None = None
+    ) -> Tuple[NDArray[Any], NDArray[Any]]:
         """
         Converts segments into a magnitude and phase spectrogram.
 
         Args:
             x (NDArray[T]): Segments as generated by a Segmenter object.
+            mask (NDArray[np.bool_] | None): Optional boolean mask over the leading
+                dimensions of `x`, as returned by `segment_padded`. Only the valid
+                frames are transformed, the others are zero.
 
         """
-        tensor = self._spectrogram.forward(x)
+        tensor = self._spectrogram.forward(x, mask)
         return np.abs(tensor), np.angle(tensor)
 
     def inverse(
-        self, magnitude: NDArray[np.complex128], phase: NDArray[np.complex128]
+        self,
+        magnitude: NDArray[np.complex128],
+        phase: NDArray[np.complex128],
+        mask: NDArray[np.bool_] | None = None,
     ) -> NDArray[np.float64]:
         """
         Converts magnitude / phase spectrogram into segments.
@@ -60,6 +68,11 @@ class MagnitudePhaseNumpy:
                 from a `forward` pass.
             phase (NDArray[np.complex128]): Phase spectrogram resulting from a
                 `forward` pass.
+            mask (NDArray[np.bool_] | None): Optional boolean mask over the leading
+                dimensions of the spectrograms. Only the valid frames are transformed,
+                the others are zero.
 
         """
-        return self._spectrogram.inverse(np.multiply(magnitude, np.exp(1j * phase)))
+        return self._spectrogram.inverse(
+            np.multiply(magnitude, np.exp(1j * phase)), mask
+        )
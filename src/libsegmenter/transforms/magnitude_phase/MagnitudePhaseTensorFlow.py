@@ -18,34 +18,54 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import tensorflow as tf
-from typing import Any, Tuple
+from typing import Any, Tuple, cast
 from libsegmenter.transforms.spectrogram.SpectrogramTensorFlow import (
     SpectrogramTensorFlow,
 )
 
 
 class MagnitudePhaseTensorFlow:
-    """A class for computing magnitudes using TensorFlow."""
+    """
+    A class for computing magnitudes using TensorFlow.
+
+    Accepts the same arguments as `SpectrogramTensorFlow`. In export mode, magnitude
+    and phase are computed from the real and imaginary parts with real-valued
+    operations.
+    """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initializes the MagnitudePhaseTensorFlow instance."""
         self._spectrogram = SpectrogramTensorFlow(*args, **kwargs)
 
-    def forward(self, x: tf.Tensor) -> Tuple[tf.Tensor, tf.Tensor]:
+    def forward(
+        self, x: tf.Tensor, mask: tf.Tensor | None = None
+    ) -> Tuple[tf.Tensor, tf.Tensor]:
         """
         Converts segments into a magnitude.
 
         Args:
             x (tf.Tensor): Segments as generated by a Segmenter object.
+            mask (tf.Tensor | None): Optional boolean mask over the leading
+                dimensions of `x`, as returned by `segment_padded`. Only the valid
+                frames are transformed, the others are zero.
 
         Returns:
             tf.Tensor: MagnitudePhase representation.
 
         """
-        tensor = self._spectrogram.forward(x)
+        tensor = self._spectrogram.forward(x, mask)
+        if self._spectrogram.export_mode:
+            real, imag = cast(
+                Tuple[tf.Tensor, tf.Tensor],
+                tf.unstack(tensor, axis=-1),  # pyright: ignore
+            )
+            phase = cast(tf.Tensor, tf.math.atan2(imag, real))  # pyright: ignore
+            return tf.sqrt(real * real + imag * imag), phase
         return tf.abs(tensor), tf.math.angle(tensor)  # pyright: ignore
 
-    def inverse(self, magnitude: tf.Tensor, phase: tf.Tensor) -> tf.Tensor:
+    def inverse(
+        self, magnitude: tf.Tensor, phase: tf.Tensor, mask: tf.Tensor | None = None
+    ) -> tf.Tensor:
         """
         Converts magnitude / phase spectrogram into segments.
 
@@ -53,13 +73,25 @@ class MagnitudePhaseTensorFlow:
             magnitude (Tensor): MagnitudePhase spectrogram resulting from a `forward`
                 pass.
             phase (Tensor): Phase spectrogram resulting from a `forward` pass.
+            mask (tf.Tensor | None): Optional boolean mask over the leading
+                dimensions of the spectrograms. Only the valid frames are transformed,
+                the others are zero.
 
         """
+        if self._spectrogram.export_mode:
+            return self._spectrogram.inverse(
+                tf.stack(  # pyright: ignore
+                    [magnitude * tf.cos(phase), magnitude * tf.sin(phase)], axis=-1
+                ),
+                mask,
+            )
+
         magnitude_complex = tf.cast(magnitude, dtype=tf.complex64)  # pyright: ignore
         phase_complex = tf.cast(phase, dtype=tf.complex64)  # pyright: ignore
         j = tf.complex(0.0, 1.0)  # pyright: ignore
         complex_exp = tf.exp(j * phase_complex)  # pyright: ignore
 
         return self._spectrogram.inverse(
-            magnitude_complex * complex_exp  # pyright: ignore
+            magnitude_complex * complex_exp,  # pyright: ignore
+            mask,
         )
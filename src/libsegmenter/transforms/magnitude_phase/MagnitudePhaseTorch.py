@@ -23,27 +23,45 @@ from libsegmenter.transforms.spectrogram.SpectrogramTorch import SpectrogramTorc
 
 
 class MagnitudePhaseTorch:
-    """A class for computing magnitudes using PyTorch."""
+    """
+    A class for computing magnitudes using PyTorch.
+
+    Accepts the same arguments as `SpectrogramTorch`. In export mode, magnitude and
+    phase are computed from the real and imaginary parts with real-valued operations.
+    """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initializes the MagnitudePhaseTorch instance."""
         self._spectrogram = SpectrogramTorch(*args, **kwargs)
 
-    def forward(self, x: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    def forward(
+        self, x: torch.Tensor, mask: torch.Tensor | None = None
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
         """
         Converts segments into a magnitude.
 
         Args:
             x (Tensor): Segments as generated by a Segmenter object.
+            mask (torch.Tensor | None): Optional boolean mask over the leading
+                dimensions of `x`, as returned by `segment_padded`. Only the valid
+                frames are transformed, the others are zero.
 
         Returns:
             Tensor: MagnitudePhase representation.
 
         """
-        tensor = self._spectrogram.forward(x)
+        tensor = self._spectrogram.forward(x, mask)
+        if self._spectrogram.export_mode:
+            real, imag = tensor[..., 0], tensor[..., 1]
+            return torch.sqrt(real * real + imag * imag), torch.atan2(imag, real)
         return torch.abs(tensor), torch.angle(tensor)
 
-    def inverse(self, magnitude: torch.Tensor, phase: torch.Tensor) -> torch.Tensor:
+    def inverse(
+        self,
+        magnitude: torch.Tensor,
+        phase: torch.Tensor,
+        mask: torch.Tensor | None = None,
+    ) -> torch.Tensor:
         """
         Converts magnitude / phase spectrogram into segments.
 
@@ -51,8 +69,16 @@ class MagnitudePhaseTorch:
             magnitude (Tensor): MagnitudePhase spectrogram resulting from a `forward`
                 pass.
             phase (Tensor): Phase spectrogram resulting from a `forward` pass.
+            mask (torch.Tensor | None): Optional boolean mask over the leading
+                dimensions of the spectrograms. Only the valid frames are transformed,
+                the others are zero.
 
         """
-        return self._spectrogram.inverse(
-            torch.multiply(magnitude, torch.exp(1j * phase))
-        )
+        if self._spectrogram.export_mode:
+            return self._spectrogram.inverse(
+                torch.stack(
+                    [magnitude * torch.cos(phase), magnitude * torch.sin(phase)], dim=-1
+                ),
+                mask,
+            )
+        return self._spectrogram.inverse(torch.polar(magnitude, phase), mask)
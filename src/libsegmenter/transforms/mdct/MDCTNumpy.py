@@ -0,0 +1,143 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any
+
+
+class MDCTNumpy:
+    """
+    A class for computing the modified discrete cosine transform (MDCT).
+
+    A segment of size N is mapped onto N / 2 real-valued coefficients,
+
+        X[k] = sum_n x[n] cos(2 pi / N (n + N / 4) (k + 1 / 2)),
+
+    where the phase offset of N / 4 matches the symmetry of the (periodic) windows of
+    this library. Segments are folded onto N / 2 samples, followed by a DCT-III
+    computed with an N / 2-point real FFT, i.e. an N / 4-point complex FFT. For
+    `wola` windows with 50% overlap that vanish at their first sample, i.e. the
+    sine (square-root Hann) window `WindowSelector("hann50", "wola", N)` or
+    `bartlett50`, the time-domain aliasing of the inverse cancels in `unsegment`.
+    This gives perfect reconstruction from a critically sampled representation.
+
+    """
+
+    def __init__(self) -> None:
+        """Initializes the MDCTNumpy instance."""
+        return
+
+    def forward(
+        self, x: NDArray[Any], mask: NDArray[np.bool_] | None = None
+    ) -> NDArray[Any]:
+        """
+        Converts segments into MDCT coefficients.
+
+        Args:
+            x (NDArray[Any]): Segments as generated by a Segmenter object.
+            mask (NDArray[np.bool_] | None): Optional boolean mask over the leading
+                dimensions of `x`, as returned by `segment_padded`. The coefficients
+                of invalid frames are zero.
+
+        Returns:
+            NDArray[Any]: The coefficients of shape (..., segment_size // 2).
+
+        """
+        if x.shape[-1] % 4 != 0:
+            raise ValueError(
+                "Input segment size is expected to be divisible by 4, provided "
+                + f"({x.shape[-1]})."
+            )
+        Q = x.shape[-1] // 4
+        L = 2 * Q
+
+        # fold the segment onto the N / 2 samples of a DCT-III
+        u = np.concatenate(
+            [
+                -x[..., 3 * Q : 3 * Q + 1],
+                -(np.flip(x[..., 2 * Q + 1 : 3 * Q], -1) + x[..., 3 * Q + 1 :]),
+                x[..., :Q] - np.flip(x[..., Q + 1 : 2 * Q + 1], -1),
+            ],
+            axis=-1,
+        )
+
+        # DCT-III as the scaled inverse of a DCT-II, computed with a real FFT
+        k = np.arange(Q + 1, dtype=np.float64)
+        v = np.fft.irfft(
+            np.exp(1j * np.pi * k / (2 * L))
+            * (
+                u[..., : Q + 1]
+                - 1j
+                * np.concatenate(
+                    [np.zeros_like(u[..., :1]), np.flip(u[..., Q:], -1)], axis=-1
+                )
+            ),
+            n=L,
+            axis=-1,
+        )
+        y = np.stack([v[..., :Q], np.flip(v, -1)[..., :Q]], axis=-1).reshape(
+            v.shape[:-1] + (L,)
+        )
+        y = (L * y + u[..., :1]) / 2.0
+
+        return y if mask is None else np.where(mask[..., np.newaxis], y, 0.0)
+
+    def inverse(
+        self, y: NDArray[Any], mask: NDArray[np.bool_] | None = None
+    ) -> NDArray[Any]:
+        """
+        Converts MDCT coefficients into (time-aliased) segments.
+
+        Args:
+            y (NDArray[Any]): Coefficients from a `forward` pass.
+            mask (NDArray[np.bool_] | None): Optional boolean mask over the leading
+                dimensions of `y`. The segments of invalid frames are zero.
+
+        Returns:
+            NDArray[Any]: Segments of shape (..., 2 * num_coefficients), whose
+                aliasing cancels when overlap-added with `unsegment`.
+
+        """
+        if y.shape[-1] % 2 != 0:
+            raise ValueError(
+                "The number of coefficients is expected to be even, provided "
+                + f"({y.shape[-1]})."
+            )
+        L = y.shape[-1]
+        Q = L // 2
+
+        # DCT-II computed with a real FFT of the reordered coefficients
+        k = np.arange(Q + 1, dtype=np.float64)
+        v = np.fft.rfft(
+            np.concatenate([y[..., 0::2], np.flip(y[..., 1::2], -1)], axis=-1), axis=-1
+        ) * np.exp(-1j * np.pi * k / (2 * L))
+        z = np.concatenate([v.real, -np.flip(v.imag[..., 1:Q], -1)], axis=-1)
+
+        # unfold the N / 2 samples onto the segment
+        x = (2.0 / L) * np.concatenate(
+            [
+                z[..., Q:],
+                np.zeros_like(z[..., :1]),
+                -np.flip(z[..., : 2 * Q], -1),
+                -z[..., 1:Q],
+            ],
+            axis=-1,
+        )
+
+        return x if mask is None else np.where(mask[..., np.newaxis], x, 0.0)
@@ -0,0 +1,171 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import tensorflow as tf
+import numpy as np
+from typing import Any, Dict, Tuple, cast
+
+
+class MDCTTensorFlow:
+    """
+    A class for computing the modified discrete cosine transform using TensorFlow.
+
+    A segment of size N is mapped onto N / 2 real-valued coefficients,
+
+        X[k] = sum_n x[n] cos(2 pi / N (n + N / 4) (k + 1 / 2)),
+
+    computed with an N / 4-point complex FFT, see `MDCTNumpy`. With `wola` windows of
+    50% overlap that vanish at their first sample, e.g. `hann50`, `unsegment` of the
+    inverse gives perfect reconstruction.
+
+    """
+
+    def __init__(self) -> None:
+        """Initializes the MDCTTensorFlow instance."""
+        self._twiddles: Dict[Tuple[int, tf.DType], tf.Tensor] = {}
+
+    def _twiddle(self, L: int, dtype: tf.DType) -> tf.Tensor:
+        # exp(1j * pi * k / (2 * L)) for k = 0, ..., L / 2
+        key = (L, dtype)
+        if key not in self._twiddles:
+            angle = np.pi * np.arange(L // 2 + 1) / (2 * L)
+            self._twiddles[key] = tf.complex(  # pyright: ignore
+                tf.constant(np.cos(angle), dtype=dtype),
+                tf.constant(np.sin(angle), dtype=dtype),
+            )
+        return self._twiddles[key]
+
+    def forward(self, x: tf.Tensor, mask: tf.Tensor | None = None) -> tf.Tensor:
+        """
+        Converts segments into MDCT coefficients.
+
+        Args:
+            x (tf.Tensor): Segments as generated by a Segmenter object.
+            mask (tf.Tensor | None): Optional boolean mask over the leading dimensions
+                of `x`, as returned by `segment_padded`. The coefficients of invalid
+                frames are zero.
+
+        Returns:
+            tf.Tensor: The coefficients of shape (..., segment_size // 2).
+
+        """
+        if x.shape[-1] % 4 != 0:  # pyright: ignore
+            raise ValueError(
+                "Input segment size is expected to be divisible by 4, provided "
+                + f"({x.shape[-1]})."
+            )
+        Q = cast(int, x.shape[-1]) // 4
+        L = 2 * Q
+        s = _sliceable(x)
+
+        # fold the segment onto the N / 2 samples of a DCT-III
+        u = _sliceable(
+            tf.concat(
+                [
+                    -s[..., 3 * Q : 3 * Q + 1],
+                    -(_reverse(s[..., 2 * Q + 1 : 3 * Q]) + s[..., 3 * Q + 1 :]),
+                    s[..., :Q] - _reverse(s[..., Q + 1 : 2 * Q + 1]),
+                ],
+                axis=-1,
+            )
+        )
+
+        # DCT-III as the scaled inverse of a DCT-II, computed with a real FFT
+        zero = cast(tf.Tensor, tf.zeros_like(u[..., :1]))
+        imag = tf.concat([zero, _reverse(u[..., Q:])], axis=-1)
+        v = _sliceable(
+            tf.signal.irfft(  # pyright: ignore
+                self._twiddle(L, x.dtype) * _complex(u[..., : Q + 1], -imag),
+                fft_length=[L],
+            )
+        )
+        y = tf.reshape(
+            tf.stack([v[..., :Q], _reverse(v)[..., :Q]], axis=-1),  # pyright: ignore
+            tf.concat([tf.shape(v)[:-1], [L]], axis=0),
+        )
+        y = cast(tf.Tensor, (L * y + u[..., :1]) / 2.0)
+
+        if mask is None:
+            return y
+        return tf.where(tf.expand_dims(mask, axis=-1), y, tf.zeros_like(y))
+
+    def inverse(self, y: tf.Tensor, mask: tf.Tensor | None = None) -> tf.Tensor:
+        """
+        Converts MDCT coefficients into (time-aliased) segments.
+
+        Args:
+            y (tf.Tensor): Coefficients from a `forward` pass.
+            mask (tf.Tensor | None): Optional boolean mask over the leading dimensions
+                of `y`. The segments of invalid frames are zero.
+
+        Returns:
+            tf.Tensor: Segments of shape (..., 2 * num_coefficients), whose aliasing
+                cancels when overlap-added with `unsegment`.
+
+        """
+        if y.shape[-1] % 2 != 0:  # pyright: ignore
+            raise ValueError(
+                "The number of coefficients is expected to be even, provided "
+                + f"({y.shape[-1]})."
+            )
+        L = cast(int, y.shape[-1])
+        Q = L // 2
+        s = _sliceable(y)
+
+        # DCT-II computed with a real FFT of the reordered coefficients
+        twiddle = cast(
+            tf.Tensor,
+            tf.math.conj(self._twiddle(L, y.dtype)),  # pyright: ignore
+        )
+        v = _sliceable(
+            tf.signal.rfft(  # pyright: ignore
+                tf.concat([s[..., 0::2], _reverse(s[..., 1::2])], axis=-1)
+            )
+            * twiddle
+        )
+        real = _sliceable(tf.math.real(v))  # pyright: ignore
+        imag = _sliceable(tf.math.imag(v))  # pyright: ignore
+        z = _sliceable(tf.concat([real, -_reverse(imag[..., 1:Q])], axis=-1))
+
+        # unfold the N / 2 samples onto the segment
+        x = (2.0 / L) * tf.concat(
+            [
+                z[..., Q:],
+                cast(tf.Tensor, tf.zeros_like(z[..., :1])),
+                -_reverse(z[..., : 2 * Q]),
+                -z[..., 1:Q],
+            ],
+            axis=-1,
+        )
+
+        if mask is None:
+            return x
+        return tf.where(tf.expand_dims(mask, axis=-1), x, tf.zeros_like(x))
+
+
+def _sliceable(x: tf.Tensor) -> Any:
+    # the tensorflow stubs reject ellipsis slices, which the tensors do support
+    return x
+
+
+def _reverse(x: tf.Tensor) -> tf.Tensor:
+    return cast(tf.Tensor, tf.reverse(x, [-1]))  # pyright: ignore
+
+
+def _complex(real: tf.Tensor, imag: tf.Tensor) -> tf.Tensor:
+    return cast(tf.Tensor, tf.complex(real, imag))  # pyright: ignore
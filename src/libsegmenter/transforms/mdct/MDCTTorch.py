@@ -0,0 +1,158 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import torch
+import numpy as np
+from typing import Dict, Tuple, cast
+
+
+class MDCTTorch:
+    """
+    A class for computing the modified discrete cosine transform (MDCT) using PyTorch.
+
+    A segment of size N is mapped onto N / 2 real-valued coefficients,
+
+        X[k] = sum_n x[n] cos(2 pi / N (n + N / 4) (k + 1 / 2)),
+
+    computed with an N / 4-point complex FFT, see `MDCTNumpy`. With `wola` windows of
+    50% overlap that vanish at their first sample, e.g. `hann50`, `unsegment` of the
+    inverse gives perfect reconstruction.
+
+    """
+
+    def __init__(self) -> None:
+        """Initializes the MDCTTorch instance."""
+        self._twiddles: Dict[Tuple[int, torch.dtype, torch.device], torch.Tensor] = {}
+
+    def _twiddle(
+        self, L: int, dtype: torch.dtype, device: torch.device
+    ) -> torch.Tensor:
+        # exp(1j * pi * k / (2 * L)) for k = 0, ..., L / 2
+        key = (L, dtype, device)
+        if key not in self._twiddles:
+            angle = np.pi * np.arange(L // 2 + 1) / (2 * L)
+            self._twiddles[key] = torch.complex(
+                torch.tensor(np.cos(angle), dtype=dtype, device=device),
+                torch.tensor(np.sin(angle), dtype=dtype, device=device),
+            )
+        return self._twiddles[key]
+
+    def forward(
+        self, x: torch.Tensor, mask: torch.Tensor | None = None
+    ) -> torch.Tensor:
+        """
+        Converts segments into MDCT coefficients.
+
+        Args:
+            x (torch.Tensor): Segments as generated by a Segmenter object.
+            mask (torch.Tensor | None): Optional boolean mask over the leading
+                dimensions of `x`, as returned by `segment_padded`. The coefficients
+                of invalid frames are zero.
+
+        Returns:
+            torch.Tensor: The coefficients of shape (..., segment_size // 2).
+
+        """
+        if x.shape[-1] % 4 != 0:
+            raise ValueError(
+                "Input segment size is expected to be divisible by 4, provided "
+                + f"({x.shape[-1]})."
+            )
+        Q = x.shape[-1] // 4
+        L = 2 * Q
+
+        # fold the segment onto the N / 2 samples of a DCT-III
+        u = torch.cat(
+            [
+                -x[..., 3 * Q : 3 * Q + 1],
+                -(x[..., 2 * Q + 1 : 3 * Q].flip(-1) + x[..., 3 * Q + 1 :]),
+                x[..., :Q] - x[..., Q + 1 : 2 * Q + 1].flip(-1),
+            ],
+            dim=-1,
+        )
+
+        # DCT-III as the scaled inverse of a DCT-II, computed with a real FFT
+        v = cast(
+            torch.Tensor,
+            torch.fft.irfft(  # pyright: ignore
+                self._twiddle(L, x.dtype, x.device)
+                * torch.complex(
+                    u[..., : Q + 1],
+                    -torch.cat(
+                        [torch.zeros_like(u[..., :1]), u[..., Q:].flip(-1)], dim=-1
+                    ),
+                ),
+                n=L,
+                dim=-1,
+            ),
+        )
+        y = torch.stack([v[..., :Q], v.flip(-1)[..., :Q]], dim=-1).reshape(
+            *v.shape[:-1], L
+        )
+        y = (L * y + u[..., :1]) / 2.0
+
+        return y if mask is None else torch.where(mask[..., None], y, 0.0)
+
+    def inverse(
+        self, y: torch.Tensor, mask: torch.Tensor | None = None
+    ) -> torch.Tensor:
+        """
+        Converts MDCT coefficients into (time-aliased) segments.
+
+        Args:
+            y (torch.Tensor): Coefficients from a `forward` pass.
+            mask (torch.Tensor | None): Optional boolean mask over the leading
+                dimensions of `y`. The segments of invalid frames are zero.
+
+        Returns:
+            torch.Tensor: Segments of shape (..., 2 * num_coefficients), whose
+                aliasing cancels when overlap-added with `unsegment`.
+
+        """
+        if y.shape[-1] % 2 != 0:
+            raise ValueError(
+                "The number of coefficients is expected to be even, provided "
+                + f"({y.shape[-1]})."
+            )
+        L = y.shape[-1]
+        Q = L // 2
+
+        # DCT-II computed with a real FFT of the reordered coefficients
+        v = (
+            cast(
+                torch.Tensor,
+                torch.fft.rfft(  # pyright: ignore
+                    torch.cat([y[..., 0::2], y[..., 1::2].flip(-1)], dim=-1), dim=-1
+                ),
+            )
+            * self._twiddle(L, y.dtype, y.device).conj()
+        )
+        z = torch.cat([v.real, -v.imag[..., 1:Q].flip(-1)], dim=-1)
+
+        # unfold the N / 2 samples onto the segment
+        x = (2.0 / L) * torch.cat(
+            [
+                z[..., Q:],
+                torch.zeros_like(z[..., :1]),
+                -z[..., : 2 * Q].flip(-1),
+                -z[..., 1:Q],
+            ],
+            dim=-1,
+        )
+
+        return x if mask is None else torch.where(mask[..., None], x, 0.0)
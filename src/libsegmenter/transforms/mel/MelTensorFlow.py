@@ -0,0 +1,205 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import tensorflow as tf
+from typing import Dict, List, Tuple, cast
+
+from libsegmenter.transforms.mel.common import (
+    compute_mel_blocks,
+    compute_mel_filterbank,
+    compute_mel_pseudo_inverse,
+)
+from libsegmenter.transforms.spectrogram.SpectrogramTensorFlow import (
+    SpectrogramTensorFlow,
+)
+from libsegmenter.Window import Window
+
+
+class MelTensorFlow:
+    """
+    A class for computing mel spectrograms using TensorFlow.
+
+    The mel spectrogram is the (power) spectrogram weighted by a triangular mel
+    filterbank. The filterbank is applied block by block over its nonzero bands, see
+    `compute_mel_blocks`. The inverse is an approximation through the
+    pseudo-inverse of the filterbank.
+
+    Attributes:
+        window (Window): The window the segments are created with.
+        sample_rate (int): The sample rate in Hz.
+        n_mels (int): The number of mel bands.
+        fmin (float): The lowest frequency in Hz.
+        fmax (float | None): The highest frequency in Hz.
+        power (float): The exponent of the magnitude spectrogram.
+
+    """
+
+    def __init__(
+        self,
+        window: Window,
+        sample_rate: int,
+        n_mels: int = 80,
+        fmin: float = 0.0,
+        fmax: float | None = None,
+        power: float = 2.0,
+    ) -> None:
+        """
+        Initializes the MelTensorFlow instance.
+
+        Args:
+            window (Window): The window the segments are created with, its segment
+                size is the FFT size.
+            sample_rate (int): The sample rate in Hz.
+            n_mels (int): The number of mel bands. Defaults to 80.
+            fmin (float): The lowest frequency in Hz. Defaults to 0.0.
+            fmax (float | None): The highest frequency in Hz. Defaults to the Nyquist
+                frequency.
+            power (float): The exponent of the magnitude spectrogram, 2.0 for power
+                and 1.0 for magnitude. Defaults to 2.0.
+
+        """
+        self.window = window
+        self.sample_rate = sample_rate
+        self.n_mels = n_mels
+        self.fmin = fmin
+        self.fmax = fmax
+        self.power = power
+
+        self._key = (sample_rate, window.analysis_window.shape[-1], n_mels, fmin, fmax)
+        self._filterbank = compute_mel_filterbank(*self._key)
+        self._blocks: Dict[tf.DType, List[Tuple[int, int, int, int, tf.Tensor]]] = {}
+        self._pseudo_inverse: Dict[tf.DType, tf.Tensor] = {}
+        self._spectrogram = SpectrogramTensorFlow()
+
+    def _banded(self, dtype: tf.DType) -> List[Tuple[int, int, int, int, tf.Tensor]]:
+        # transposed filterbank blocks, (bins, mels), in the dtype of the spectrogram
+        if dtype not in self._blocks:
+            self._blocks[dtype] = [
+                (
+                    bin_start,
+                    bin_stop,
+                    mel_start,
+                    mel_stop,
+                    tf.constant(
+                        self._filterbank[mel_start:mel_stop, bin_start:bin_stop].T,
+                        dtype=dtype,
+                    ),
+                )
+                for bin_start, bin_stop, mel_start, mel_stop in compute_mel_blocks(
+                    *self._key
+                )
+            ]
+        return self._blocks[dtype]
+
+    def forward(self, x: tf.Tensor, mask: tf.Tensor | None = None) -> tf.Tensor:
+        """
+        Converts segments into a mel spectrogram.
+
+        Args:
+            x (tf.Tensor): Segments as generated by a Segmenter object.
+            mask (tf.Tensor | None): Optional boolean mask over the leading dimensions
+                of `x`, as returned by `segment_padded`. Only the valid frames are
+                transformed, the others are zero.
+
+        Returns:
+            tf.Tensor: The mel spectrogram of shape (..., n_mels).
+
+        """
+        if x.shape[-1] != self.window.analysis_window.shape[-1]:
+            raise ValueError(
+                f"Expected segments of size ({self.window.analysis_window.shape[-1]}), "
+                + f"provided ({x.shape[-1]})."
+            )
+
+        spectrum = self._spectrogram.forward(x, mask)
+        real = cast(tf.Tensor, tf.math.real(spectrum))  # pyright: ignore
+        imag = cast(tf.Tensor, tf.math.imag(spectrum))  # pyright: ignore
+        power = tf.square(real) + tf.square(imag)
+        if self.power != 2.0:
+            power = power ** (self.power / 2.0)
+
+        # every block covers a contiguous range of bands, padded to all bands
+        paddings = [[0, 0]] * (len(power.shape) - 1)
+        return tf.add_n(
+            [
+                tf.pad(
+                    cast(
+                        tf.Tensor,
+                        tf.tensordot(  # pyright: ignore
+                            power[..., bin_start:bin_stop],  # pyright: ignore
+                            weights,
+                            axes=1,
+                        ),
+                    ),
+                    paddings + [[mel_start, self.n_mels - mel_stop]],
+                )
+                for bin_start, bin_stop, mel_start, mel_stop, weights in self._banded(
+                    power.dtype
+                )
+            ]
+        )
+
+    def inverse(
+        self,
+        y: tf.Tensor,
+        phase: tf.Tensor | None = None,
+        mask: tf.Tensor | None = None,
+    ) -> tf.Tensor:
+        """
+        Converts a mel spectrogram into a magnitude spectrogram or segments.
+
+        The magnitude spectrogram is estimated with the pseudo-inverse of the
+        filterbank, clipped to nonnegative values.
+
+        Args:
+            y (tf.Tensor): Mel spectrogram resulting from a `forward` pass.
+            phase (tf.Tensor | None): Optional phase spectrogram. If given, the
+                segments are reconstructed from the estimated magnitude and the phase.
+            mask (tf.Tensor | None): Optional boolean mask over the leading dimensions
+                of `y`. Only the valid frames are transformed, the others are zero.
+
+        Returns:
+            tf.Tensor: The estimated magnitude spectrogram of shape (...,
+                segment_size // 2 + 1), or the reconstructed segments if a phase is
+                given.
+
+        """
+        if y.dtype not in self._pseudo_inverse:
+            self._pseudo_inverse[y.dtype] = tf.constant(
+                compute_mel_pseudo_inverse(*self._key).T, dtype=y.dtype
+            )
+
+        estimate = cast(
+            tf.Tensor,
+            tf.tensordot(y, self._pseudo_inverse[y.dtype], axes=1),  # pyright: ignore
+        )
+        magnitude = tf.maximum(estimate, 0.0) ** (1.0 / self.power)
+        if mask is not None:
+            magnitude = tf.where(
+                tf.expand_dims(mask, axis=-1), magnitude, tf.zeros_like(magnitude)
+            )
+        if phase is None:
+            return magnitude
+
+        spectrogram = cast(
+            tf.Tensor,
+            tf.complex(  # pyright: ignore
+                magnitude * tf.cos(phase), magnitude * tf.sin(phase)
+            ),
+        )
+        return self._spectrogram.inverse(spectrogram, mask)
@@ -0,0 +1,188 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import torch
+from typing import Dict, List, Tuple
+
+from libsegmenter.transforms.mel.common import (
+    compute_mel_blocks,
+    compute_mel_filterbank,
+    compute_mel_pseudo_inverse,
+)
+from libsegmenter.transforms.spectrogram.SpectrogramTorch import SpectrogramTorch
+from libsegmenter.Window import Window
+
+
+class MelTorch:
+    """
+    A class for computing mel spectrograms using PyTorch.
+
+    The mel spectrogram is the (power) spectrogram weighted by a triangular mel
+    filterbank. The filterbank is applied block by block over its nonzero bands, see
+    `compute_mel_blocks`. The inverse is an approximation through the
+    pseudo-inverse of the filterbank.
+
+    Attributes:
+        window (Window): The window the segments are created with.
+        sample_rate (int): The sample rate in Hz.
+        n_mels (int): The number of mel bands.
+        fmin (float): The lowest frequency in Hz.
+        fmax (float | None): The highest frequency in Hz.
+        power (float): The exponent of the magnitude spectrogram.
+
+    """
+
+    def __init__(
+        self,
+        window: Window,
+        sample_rate: int,
+        n_mels: int = 80,
+        fmin: float = 0.0,
+        fmax: float | None = None,
+        power: float = 2.0,
+    ) -> None:
+        """
+        Initializes the MelTorch instance.
+
+        Args:
+            window (Window): The window the segments are created with, its segment
+                size is the FFT size.
+            sample_rate (int): The sample rate in Hz.
+            n_mels (int): The number of mel bands. Defaults to 80.
+            fmin (float): The lowest frequency in Hz. Defaults to 0.0.
+            fmax (float | None): The highest frequency in Hz. Defaults to the Nyquist
+                frequency.
+            power (float): The exponent of the magnitude spectrogram, 2.0 for power
+                and 1.0 for magnitude. Defaults to 2.0.
+
+        """
+        self.window = window
+        self.sample_rate = sample_rate
+        self.n_mels = n_mels
+        self.fmin = fmin
+        self.fmax = fmax
+        self.power = power
+
+        self._key = (sample_rate, window.analysis_window.shape[-1], n_mels, fmin, fmax)
+        self._filterbank = compute_mel_filterbank(*self._key)
+        self._blocks: Dict[
+            Tuple[torch.dtype, torch.device],
+            List[Tuple[int, int, int, int, torch.Tensor]],
+        ] = {}
+        self._pseudo_inverse: Dict[Tuple[torch.dtype, torch.device], torch.Tensor] = {}
+        self._spectrogram = SpectrogramTorch()
+
+    def _banded(
+        self, dtype: torch.dtype, device: torch.device
+    ) -> List[Tuple[int, int, int, int, torch.Tensor]]:
+        # transposed filterbank blocks, (bins, mels), in the dtype of the spectrogram
+        key = (dtype, device)
+        if key not in self._blocks:
+            self._blocks[key] = [
+                (
+                    bin_start,
+                    bin_stop,
+                    mel_start,
+                    mel_stop,
+                    torch.tensor(
+                        self._filterbank[mel_start:mel_stop, bin_start:bin_stop].T,
+                        dtype=dtype,
+                        device=device,
+                    ),
+                )
+                for bin_start, bin_stop, mel_start, mel_stop in compute_mel_blocks(
+                    *self._key
+                )
+            ]
+        return self._blocks[key]
+
+    def forward(
+        self, x: torch.Tensor, mask: torch.Tensor | None = None
+    ) -> torch.Tensor:
+        """
+        Converts segments into a mel spectrogram.
+
+        Args:
+            x (torch.Tensor): Segments as generated by a Segmenter object.
+            mask (torch.Tensor | None): Optional boolean mask over the leading
+                dimensions of `x`, as returned by `segment_padded`. Only the valid
+                frames are transformed, the others are zero.
+
+        Returns:
+            torch.Tensor: The mel spectrogram of shape (..., n_mels).
+
+        """
+        if x.shape[-1] != self.window.analysis_window.shape[-1]:
+            raise ValueError(
+                f"Expected segments of size ({self.window.analysis_window.shape[-1]}), "
+                + f"provided ({x.shape[-1]})."
+            )
+
+        spectrum = self._spectrogram.forward(x, mask)
+        power = spectrum.real.square() + spectrum.imag.square()
+        if self.power != 2.0:
+            power = power ** (self.power / 2.0)
+
+        y = power.new_zeros((*power.shape[:-1], self.n_mels))
+        for bin_start, bin_stop, mel_start, mel_stop, weights in self._banded(
+            power.dtype, power.device
+        ):
+            y[..., mel_start:mel_stop] += power[..., bin_start:bin_stop] @ weights
+        return y
+
+    def inverse(
+        self,
+        y: torch.Tensor,
+        phase: torch.Tensor | None = None,
+        mask: torch.Tensor | None = None,
+    ) -> torch.Tensor:
+        """
+        Converts a mel spectrogram into a magnitude spectrogram or segments.
+
+        The magnitude spectrogram is estimated with the pseudo-inverse of the
+        filterbank, clipped to nonnegative values.
+
+        Args:
+            y (torch.Tensor): Mel spectrogram resulting from a `forward` pass.
+            phase (torch.Tensor | None): Optional phase spectrogram. If given, the
+                segments are reconstructed from the estimated magnitude and the phase.
+            mask (torch.Tensor | None): Optional boolean mask over the leading
+                dimensions of `y`. Only the valid frames are transformed, the others
+                are zero.
+
+        Returns:
+            torch.Tensor: The estimated magnitude spectrogram of shape (...,
+                segment_size // 2 + 1), or the reconstructed segments if a phase is
+                given.
+
+        """
+        key = (y.dtype, y.device)
+        if key not in self._pseudo_inverse:
+            self._pseudo_inverse[key] = torch.tensor(
+                compute_mel_pseudo_inverse(*self._key).T, dtype=y.dtype, device=y.device
+            )
+
+        magnitude = torch.clamp(y @ self._pseudo_inverse[key], min=0.0) ** (
+            1.0 / self.power
+        )
+        if mask is not None:
+            magnitude = torch.where(mask[..., None], magnitude, 0.0)
+        if phase is None:
+            return magnitude
+
+        return self._spectrogram.inverse(torch.polar(magnitude, phase), mask)
@@ -0,0 +1,149 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import functools
+import numpy as np
+from numpy.typing import NDArray
+from typing import List, Tuple, cast
+
+MEL_BLOCK_SIZE = 32
+
+
+def hz_to_mel(f: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Converts frequencies in Hz to the (HTK) mel scale."""
+    return 2595.0 * np.log10(1.0 + f / 700.0)
+
+
+def mel_to_hz(m: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Converts the (HTK) mel scale to frequencies in Hz."""
+    return 700.0 * (10.0 ** (m / 2595.0) - 1.0)
+
+
+@functools.lru_cache(maxsize=None)
+def compute_mel_filterbank(
+    sample_rate: int,
+    n_fft: int,
+    n_mels: int,
+    fmin: float,
+    fmax: float | None,
+) -> NDArray[np.float64]:
+    """
+    Compute a triangular mel filterbank.
+
+    The filters are spaced uniformly on the (HTK) mel scale and area normalized
+    (Slaney). Filterbanks are cached, the returned array is read-only.
+
+    Args:
+        sample_rate (int): The sample rate in Hz.
+        n_fft (int): The FFT size, i.e. the segment size of the window.
+        n_mels (int): The number of mel bands.
+        fmin (float): The lowest frequency in Hz.
+        fmax (float | None): The highest frequency in Hz. Defaults to the Nyquist
+            frequency.
+
+    Returns:
+        NDArray[np.float64]: The filterbank of shape (n_mels, n_fft // 2 + 1).
+
+    """
+    fmax = sample_rate / 2.0 if fmax is None else fmax
+    if not 0.0 <= fmin < fmax <= sample_rate / 2.0:
+        raise ValueError(
+            f"Expected 0 <= fmin < fmax <= {sample_rate / 2.0}, provided fmin={fmin} "
+            + f"and fmax={fmax}."
+        )
+
+    frequencies = np.linspace(0.0, sample_rate / 2.0, n_fft // 2 + 1)
+    mels = hz_to_mel(np.array([fmin, fmax]))
+    edges = mel_to_hz(np.linspace(float(mels[0]), float(mels[1]), n_mels + 2))
+
+    rising = (frequencies - edges[:-2, np.newaxis]) / np.diff(edges)[:-1, np.newaxis]
+    falling = (edges[2:, np.newaxis] - frequencies) / np.diff(edges)[1:, np.newaxis]
+    filterbank = np.maximum(0.0, np.minimum(rising, falling))
+    filterbank *= (2.0 / (edges[2:] - edges[:-2]))[:, np.newaxis]
+
+    filterbank.setflags(write=False)
+    return filterbank
+
+
+@functools.lru_cache(maxsize=None)
+def compute_mel_blocks(
+    sample_rate: int,
+    n_fft: int,
+    n_mels: int,
+    fmin: float,
+    fmax: float | None,
+) -> List[Tuple[int, int, int, int]]:
+    """
+    Compute the banded block structure of a mel filterbank.
+
+    The frequency bins are split into blocks of `MEL_BLOCK_SIZE` bins, and every
+    block only overlaps a narrow range of mel bands. Applying the filterbank block by
+    block skips the (mostly zero) remainder of the dense matrix product.
+
+    Args:
+        sample_rate (int): The sample rate in Hz.
+        n_fft (int): The FFT size, i.e. the segment size of the window.
+        n_mels (int): The number of mel bands.
+        fmin (float): The lowest frequency in Hz.
+        fmax (float | None): The highest frequency in Hz.
+
+    Returns:
+        List[Tuple[int, int, int, int]]: A list of (bin_start, bin_stop, mel_start,
+            mel_stop), the nonzero blocks of the filterbank.
+
+    """
+    filterbank = compute_mel_filterbank(sample_rate, n_fft, n_mels, fmin, fmax)
+
+    blocks: List[Tuple[int, int, int, int]] = []
+    for bin_start in range(0, filterbank.shape[-1], MEL_BLOCK_SIZE):
+        bin_stop = min(bin_start + MEL_BLOCK_SIZE, filterbank.shape[-1])
+        mels = np.flatnonzero(filterbank[:, bin_start:bin_stop].any(axis=-1))
+        if mels.shape[0] > 0:
+            blocks.append((bin_start, bin_stop, int(mels[0]), int(mels[-1]) + 1))
+
+    return blocks
+
+
+@functools.lru_cache(maxsize=None)
+def compute_mel_pseudo_inverse(
+    sample_rate: int,
+    n_fft: int,
+    n_mels: int,
+    fmin: float,
+    fmax: float | None,
+) -> NDArray[np.float64]:
+    """
+    Compute the pseudo-inverse of a mel filterbank.
+
+    Args:
+        sample_rate (int): The sample rate in Hz.
+        n_fft (int): The FFT size, i.e. the segment size of the window.
+        n_mels (int): The number of mel bands.
+        fmin (float): The lowest frequency in Hz.
+        fmax (float | None): The highest frequency in Hz.
+
+    Returns:
+        NDArray[np.float64]: The pseudo-inverse of shape (n_fft // 2 + 1, n_mels).
+
+    """
+    pseudo_inverse = cast(
+        NDArray[np.float64],
+        np.linalg.pinv(compute_mel_filterbank(sample_rate, n_fft, n_mels, fmin, fmax)),
+    )
+    pseudo_inverse.setflags(write=False)
+    return pseudo_inverse
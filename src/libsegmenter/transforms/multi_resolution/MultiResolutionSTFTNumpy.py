@@ -0,0 +1,135 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import numpy as np
+from numpy.typing import NDArray
+from typing import Dict, List, Sequence, Tuple
+
+from libsegmenter.backends.common import compute_framing_groups, compute_num_segments
+from libsegmenter.Window import Window
+
+
+class MultiResolutionSTFTNumpy:
+    """
+    A class for computing spectrograms at several resolutions in a single pass.
+
+    The result for every window equals segmenting the signal with that window and
+    computing its spectrogram. Windows whose hop sizes are multiples of each other
+    slice their frames from a single strided view of the signal, and the FFTs of all
+    windows with the same segment size are computed in a single batched call.
+
+    Attributes:
+        windows (List[Window]): The windows of the resolutions.
+
+    """
+
+    def __init__(self, windows: Sequence[Window]) -> None:
+        """
+        Initializes the MultiResolutionSTFTNumpy instance.
+
+        Args:
+            windows (Sequence[Window]): A window object for every resolution.
+
+        """
+        self.windows = list(windows)
+        for window in self.windows:
+            if window.analysis_window.shape[-1] % 2 != 0:
+                raise ValueError(
+                    "Input segment size is expected to be even for a consistent "
+                    + "definition of the inverse real-valued FFT."
+                )
+
+        self._groups = compute_framing_groups(
+            [window.hop_size for window in self.windows],
+            [window.analysis_window.shape[-1] for window in self.windows],
+        )
+
+    def _frames(self, x: NDArray[np.float64]) -> Dict[int, NDArray[np.float64]]:
+        # unwindowed frames of every window, views into the shared strided views
+        num_samples = x.shape[-1]
+        frames: Dict[int, NDArray[np.float64]] = {}
+        for base_hop_size, view_size, members in self._groups:
+            min_size = min(self.windows[k].analysis_window.shape[-1] for k in members)
+            # pad such that the last frame of the shortest window has a full row
+            x_pad = np.pad(x, ((0, 0), (0, view_size - min_size)))
+            view = np.lib.stride_tricks.sliding_window_view(x_pad, view_size, axis=-1)
+            view = view[:, ::base_hop_size]
+
+            for k in members:
+                hop_size = self.windows[k].hop_size
+                segment_size = self.windows[k].analysis_window.shape[-1]
+                num_segments = compute_num_segments(num_samples, hop_size, segment_size)
+                if num_segments <= 0:
+                    raise ValueError(
+                        "Input signal is too short for segmentation with the given "
+                        + "parameters."
+                    )
+                frames[k] = view[:, :: hop_size // base_hop_size, :segment_size][
+                    :, :num_segments
+                ]
+
+        return frames
+
+    def forward(self, x: NDArray[np.float64]) -> List[NDArray[np.complex128]]:
+        """
+        Converts a signal into a spectrogram for every resolution.
+
+        Args:
+            x (NDArray[np.float64]): Input signal, either 1D (sequence) or 2D (batch).
+
+        Returns:
+            List[NDArray[np.complex128]]: The spectrogram of every window, of shape
+                (batch_size, num_segments, segment_size // 2 + 1).
+
+        """
+        if x.ndim not in {1, 2}:
+            raise ValueError(f"Only supports 1D or 2D inputs, provided {x.ndim}D.")
+
+        batch_size = x.shape[0] if x.ndim == 2 else None
+        if batch_size is None:
+            x = x.reshape(1, -1)  # Convert to batch format for consistency
+
+        frames = self._frames(x)
+        dtype = x.dtype if np.issubdtype(x.dtype, np.floating) else np.float64
+
+        # window all frames of the same segment size into one buffer, one FFT each
+        sizes: Dict[int, List[int]] = {}
+        for k, window in enumerate(self.windows):
+            sizes.setdefault(window.analysis_window.shape[-1], []).append(k)
+
+        y: Dict[int, NDArray[np.complex128]] = {}
+        for segment_size, members in sizes.items():
+            bounds: List[Tuple[int, int]] = []
+            for k in members:
+                start = bounds[-1][1] if bounds else 0
+                bounds.append((start, start + frames[k].shape[1]))
+            buffer = np.empty((x.shape[0], bounds[-1][1], segment_size), dtype)
+            for k, (start, stop) in zip(members, bounds, strict=True):
+                np.multiply(
+                    frames[k],
+                    self.windows[k].analysis_window.astype(dtype),
+                    out=buffer[:, start:stop],
+                )
+
+            spectra = np.fft.rfft(buffer, axis=-1, norm="backward")
+            for k, (start, stop) in zip(members, bounds, strict=True):
+                y[k] = spectra[:, start:stop]
+
+        return [
+            y[k][0] if batch_size is None else y[k] for k in range(len(self.windows))
+        ]
@@ -0,0 +1,145 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import torch
+from typing import Dict, List, Sequence, Tuple, cast
+
+from libsegmenter.backends.common import compute_framing_groups, compute_num_segments
+from libsegmenter.Window import Window
+
+
+class MultiResolutionSTFTTorch:
+    """
+    A class for computing spectrograms at several resolutions in a single pass.
+
+    The result for every window equals segmenting the signal with that window and
+    computing its spectrogram. Windows whose hop sizes are multiples of each other
+    slice their frames from a single `unfold` view of the signal, and the FFTs of all
+    windows with the same segment size are computed in a single batched call. In the
+    backward pass, the gradients of all resolutions accumulate into the shared view
+    before a single fold back onto the signal.
+
+    Attributes:
+        windows (List[Window]): The windows of the resolutions.
+
+    """
+
+    def __init__(self, windows: Sequence[Window]) -> None:
+        """
+        Initializes the MultiResolutionSTFTTorch instance.
+
+        Args:
+            windows (Sequence[Window]): A window object for every resolution.
+
+        """
+        self.windows = list(windows)
+        for window in self.windows:
+            if window.analysis_window.shape[-1] % 2 != 0:
+                raise ValueError(
+                    "Input segment size is expected to be even for a consistent "
+                    + "definition of the inverse real-valued FFT."
+                )
+
+        self._groups = compute_framing_groups(
+            [window.hop_size for window in self.windows],
+            [window.analysis_window.shape[-1] for window in self.windows],
+        )
+        self._analysis_windows: Dict[
+            Tuple[int, torch.dtype, torch.device], torch.Tensor
+        ] = {}
+
+    def _analysis_window(
+        self, k: int, dtype: torch.dtype, device: torch.device
+    ) -> torch.Tensor:
+        key = (k, dtype, device)
+        if key not in self._analysis_windows:
+            self._analysis_windows[key] = torch.tensor(
+                self.windows[k].analysis_window, dtype=dtype, device=device
+            )
+        return self._analysis_windows[key]
+
+    def forward(self, x: torch.Tensor) -> List[torch.Tensor]:
+        """
+        Converts a signal into a spectrogram for every resolution.
+
+        Args:
+            x (torch.Tensor): Input signal, either 1D (sequence) or 2D (batch).
+
+        Returns:
+            List[torch.Tensor]: The spectrogram of every window, of shape
+                (batch_size, num_segments, segment_size // 2 + 1).
+
+        """
+        if x.ndim not in {1, 2}:
+            raise ValueError(f"Only supports 1D or 2D inputs, provided {x.ndim}D.")
+
+        batch_size = x.shape[0] if x.ndim == 2 else None
+        num_samples = x.shape[-1]
+        if batch_size is None:
+            x = x.reshape(1, -1)  # Convert to batch format for consistency
+
+        # windowed frames of every window, sliced from the shared views
+        frames: Dict[int, torch.Tensor] = {}
+        for base_hop_size, view_size, members in self._groups:
+            min_size = min(self.windows[k].analysis_window.shape[-1] for k in members)
+            # pad such that the last frame of the shortest window has a full row
+            view = torch.nn.functional.pad(x, (0, view_size - min_size)).unfold(
+                -1, view_size, base_hop_size
+            )
+
+            for k in members:
+                hop_size = self.windows[k].hop_size
+                segment_size = self.windows[k].analysis_window.shape[-1]
+                num_segments = compute_num_segments(num_samples, hop_size, segment_size)
+                if num_segments <= 0:
+                    raise ValueError(
+                        "Input signal is too short for segmentation with the given "
+                        + "parameters."
+                    )
+                frames[k] = view[:, :: hop_size // base_hop_size, :segment_size][
+                    :, :num_segments
+                ] * self._analysis_window(k, x.dtype, x.device)
+
+        # one FFT for all frames of the same segment size
+        sizes: Dict[int, List[int]] = {}
+        for k, window in enumerate(self.windows):
+            sizes.setdefault(window.analysis_window.shape[-1], []).append(k)
+
+        y: Dict[int, torch.Tensor] = {}
+        for members in sizes.values():
+            spectra = cast(
+                torch.Tensor,
+                torch.fft.rfft(  # pyright: ignore
+                    torch.cat([frames[k] for k in members], dim=1)
+                    if len(members) > 1
+                    else frames[members[0]],
+                    dim=-1,
+                    norm="backward",
+                ),
+            )
+            for k, spectrum in zip(
+                members,
+                torch.split(spectra, [frames[k].shape[1] for k in members], dim=1),
+                strict=True,
+            ):
+                y[k] = spectrum
+
+        return [
+            y[k].squeeze(0) if batch_size is None else y[k]
+            for k in range(len(self.windows))
+        ]
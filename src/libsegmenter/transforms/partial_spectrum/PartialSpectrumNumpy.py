@@ -0,0 +1,189 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any, Sequence, Tuple
+
+from libsegmenter.transforms.partial_spectrum.common import (
+    compute_czt_kernels,
+    compute_dft_matrix,
+    compute_uniform_spacing,
+    select_partial_spectrum_method,
+)
+from libsegmenter.Window import Window
+
+METHODS = ["auto", "dft", "czt", "rfft"]
+
+
+def compute_bins(
+    segment_size: int,
+    bins: Sequence[float] | None,
+    band: Tuple[float, float] | None,
+    num_bins: int | None,
+) -> Tuple[float, ...]:
+    """
+    Resolves the bins of a partial spectrum from a bin list or a band.
+
+    Args:
+        segment_size (int): The segment size.
+        bins (Sequence[float] | None): The (possibly fractional) bins.
+        band (Tuple[float, float] | None): The first and last (possibly fractional)
+            bin of a band.
+        num_bins (int | None): The number of uniformly spaced bins in the band.
+            Defaults to the number of integer bins in the band.
+
+    Returns:
+        Tuple[float, ...]: The bins.
+
+    """
+    if (bins is None) == (band is None):
+        raise ValueError("Expected exactly one of 'bins' and 'band' to be provided.")
+
+    if band is not None:
+        start, stop = band
+        if stop < start:
+            raise ValueError(f"Expected an increasing band, provided {band}.")
+        if num_bins is None:
+            num_bins = int(np.floor(stop - start)) + 1
+        if num_bins < 1:
+            raise ValueError(f"Expected at least one bin, provided ({num_bins}).")
+        bins = np.linspace(start, stop, num_bins).tolist()
+
+    assert bins is not None
+    if len(bins) == 0:
+        raise ValueError("Expected at least one bin.")
+    if min(bins) < 0.0 or max(bins) > segment_size // 2:
+        raise ValueError(
+            f"Expected bins within [0, {segment_size // 2}], provided bins range "
+            + f"from {min(bins)} to {max(bins)}."
+        )
+    return tuple(float(b) for b in bins)
+
+
+class PartialSpectrumNumpy:
+    """
+    A class for computing a subset of the bins of a spectrogram.
+
+    The bins are computed with the fastest of three methods, see
+    `select_partial_spectrum_method`: a DFT as a matrix product for a few bins, a
+    chirp-Z transform for a uniformly spaced (zoomed) band and a full real FFT
+    otherwise. The bins match those of `SpectrogramNumpy`, fractional bins evaluate
+    the DTFT of the segment in between.
+
+    Attributes:
+        window (Window): The window the segments are created with.
+        bins (NDArray[np.float64]): The (possibly fractional) bins.
+        method (str): The method used to compute the bins.
+
+    """
+
+    def __init__(
+        self,
+        window: Window,
+        bins: Sequence[float] | None = None,
+        band: Tuple[float, float] | None = None,
+        num_bins: int | None = None,
+        method: str = "auto",
+    ) -> None:
+        """
+        Initializes the PartialSpectrumNumpy instance.
+
+        Args:
+            window (Window): The window the segments are created with, its segment
+                size is the FFT size.
+            bins (Sequence[float] | None): The (possibly fractional) bins to
+                compute. Either `bins` or `band` must be provided.
+            band (Tuple[float, float] | None): The first and last (possibly
+                fractional) bin of a band to compute.
+            num_bins (int | None): The number of uniformly spaced bins in the band.
+                Defaults to the number of integer bins in the band.
+            method (str): One of ["auto", "dft", "czt", "rfft"]. Defaults to "auto",
+                which selects the fastest method.
+
+        """
+        self.window = window
+        segment_size = window.analysis_window.shape[-1]
+        self._bins = compute_bins(segment_size, bins, band, num_bins)
+        self.bins = np.asarray(self._bins)
+
+        if method not in METHODS:
+            raise ValueError(
+                f"The '{method}' method is not known, expected one of {METHODS}."
+            )
+        if method == "auto":
+            method = select_partial_spectrum_method(segment_size, self._bins)
+        if method == "rfft" and not all(b.is_integer() for b in self._bins):
+            raise ValueError("The 'rfft' method requires integer bins.")
+        if method == "czt" and compute_uniform_spacing(self._bins) is None:
+            raise ValueError("The 'czt' method requires uniformly spaced bins.")
+        self.method = method
+
+    def _transform(self, x: NDArray[Any]) -> NDArray[Any]:
+        segment_size = x.shape[-1]
+        num_bins = len(self._bins)
+        dtype = np.result_type(x.dtype, np.float32)
+
+        if self.method == "dft":
+            y = x @ compute_dft_matrix(segment_size, self._bins).astype(dtype)
+            return y[..., :num_bins] + 1j * y[..., num_bins:]
+
+        if self.method == "rfft":
+            indices = np.asarray(self._bins, dtype=np.int64)
+            return np.fft.rfft(x, axis=-1)[..., indices]
+
+        spacing = compute_uniform_spacing(self._bins)
+        assert spacing is not None
+        complex_dtype = np.result_type(dtype, np.complex64)
+        pre, kernel, post = (
+            kernel.astype(complex_dtype)
+            for kernel in compute_czt_kernels(
+                segment_size, self._bins[0], spacing, num_bins
+            )
+        )
+        y = np.fft.ifft(np.fft.fft(x * pre, n=kernel.shape[-1]) * kernel)
+        return y[..., :num_bins] * post
+
+    def forward(
+        self, x: NDArray[Any], mask: NDArray[np.bool_] | None = None
+    ) -> NDArray[Any]:
+        """
+        Converts segments into a partial spectrogram.
+
+        Args:
+            x (NDArray[Any]): Segments as generated by a Segmenter object.
+            mask (NDArray[np.bool_] | None): Optional boolean mask over the leading
+                dimensions of `x`, as returned by `segment_padded`. Only the valid
+                frames are transformed, the others are zero.
+
+        Returns:
+            NDArray[Any]: The partial spectrogram of shape (..., num_bins).
+
+        """
+        if x.shape[-1] != self.window.analysis_window.shape[-1]:
+            raise ValueError(
+                f"Expected segments of size ({self.window.analysis_window.shape[-1]}), "
+                + f"provided ({x.shape[-1]})."
+            )
+        if mask is None:
+            return self._transform(x)
+
+        valid = self._transform(x[mask])
+        y = np.zeros(mask.shape + valid.shape[-1:], dtype=valid.dtype)
+        y[mask] = valid
+        return y
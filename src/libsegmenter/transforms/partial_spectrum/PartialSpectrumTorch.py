@@ -0,0 +1,167 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import torch
+from typing import Dict, Sequence, Tuple, cast
+
+from libsegmenter.transforms.partial_spectrum.common import (
+    compute_czt_kernels,
+    compute_dft_matrix,
+    compute_uniform_spacing,
+    select_partial_spectrum_method,
+)
+from libsegmenter.transforms.partial_spectrum.PartialSpectrumNumpy import (
+    METHODS,
+    compute_bins,
+)
+from libsegmenter.Window import Window
+
+
+class PartialSpectrumTorch:
+    """
+    A class for computing a subset of the bins of a spectrogram using PyTorch.
+
+    The bins are computed with the fastest of three methods, see
+    `select_partial_spectrum_method`: a DFT as a matrix product for a few bins, a
+    chirp-Z transform for a uniformly spaced (zoomed) band and a full real FFT
+    otherwise. The bins match those of `SpectrogramTorch`, fractional bins evaluate
+    the DTFT of the segment in between.
+
+    Attributes:
+        window (Window): The window the segments are created with.
+        bins (torch.Tensor): The (possibly fractional) bins.
+        method (str): The method used to compute the bins.
+
+    """
+
+    def __init__(
+        self,
+        window: Window,
+        bins: Sequence[float] | None = None,
+        band: Tuple[float, float] | None = None,
+        num_bins: int | None = None,
+        method: str = "auto",
+    ) -> None:
+        """
+        Initializes the PartialSpectrumTorch instance.
+
+        Args:
+            window (Window): The window the segments are created with, its segment
+                size is the FFT size.
+            bins (Sequence[float] | None): The (possibly fractional) bins to
+                compute. Either `bins` or `band` must be provided.
+            band (Tuple[float, float] | None): The first and last (possibly
+                fractional) bin of a band to compute.
+            num_bins (int | None): The number of uniformly spaced bins in the band.
+                Defaults to the number of integer bins in the band.
+            method (str): One of ["auto", "dft", "czt", "rfft"]. Defaults to "auto",
+                which selects the fastest method.
+
+        """
+        self.window = window
+        segment_size = window.analysis_window.shape[-1]
+        self._bins = compute_bins(segment_size, bins, band, num_bins)
+        self.bins = torch.tensor(self._bins, dtype=torch.float64)
+
+        if method not in METHODS:
+            raise ValueError(
+                f"The '{method}' method is not known, expected one of {METHODS}."
+            )
+        if method == "auto":
+            method = select_partial_spectrum_method(segment_size, self._bins)
+        if method == "rfft" and not all(b.is_integer() for b in self._bins):
+            raise ValueError("The 'rfft' method requires integer bins.")
+        if method == "czt" and compute_uniform_spacing(self._bins) is None:
+            raise ValueError("The 'czt' method requires uniformly spaced bins.")
+        self.method = method
+
+        self._kernels: Dict[
+            Tuple[torch.dtype, torch.device], Tuple[torch.Tensor, ...]
+        ] = {}
+
+    def _kernel(
+        self, dtype: torch.dtype, device: torch.device
+    ) -> Tuple[torch.Tensor, ...]:
+        # the kernels of the method in the dtype and on the device of the input
+        key = (dtype, device)
+        if key not in self._kernels:
+            segment_size = self.window.analysis_window.shape[-1]
+            if self.method == "dft":
+                matrix = compute_dft_matrix(segment_size, self._bins)
+                self._kernels[key] = (torch.tensor(matrix, dtype=dtype, device=device),)
+            elif self.method == "rfft":
+                self._kernels[key] = (
+                    torch.tensor(self._bins, dtype=torch.int64, device=device),
+                )
+            else:
+                spacing = compute_uniform_spacing(self._bins)
+                assert spacing is not None
+                complex_dtype = torch.promote_types(dtype, torch.complex64)
+                self._kernels[key] = tuple(
+                    torch.tensor(kernel, dtype=complex_dtype, device=device)
+                    for kernel in compute_czt_kernels(
+                        segment_size, self._bins[0], spacing, len(self._bins)
+                    )
+                )
+        return self._kernels[key]
+
+    def _transform(self, x: torch.Tensor) -> torch.Tensor:
+        num_bins = len(self._bins)
+        kernels = self._kernel(x.dtype, x.device)
+
+        if self.method == "dft":
+            y = x @ kernels[0]
+            return torch.complex(y[..., :num_bins], y[..., num_bins:])
+
+        if self.method == "rfft":
+            return torch.fft.rfft(x, dim=-1)[..., kernels[0]]  # pyright: ignore
+
+        pre, kernel, post = kernels
+        y = cast(
+            torch.Tensor,
+            torch.fft.ifft(  # pyright: ignore
+                torch.fft.fft(x * pre, n=kernel.shape[-1], dim=-1)  # pyright: ignore
+                * kernel,
+                dim=-1,
+            ),
+        )
+        return y[..., :num_bins] * post
+
+    def forward(
+        self, x: torch.Tensor, mask: torch.Tensor | None = None
+    ) -> torch.Tensor:
+        """
+        Converts segments into a partial spectrogram.
+
+        Args:
+            x (torch.Tensor): Segments as generated by a Segmenter object.
+            mask (torch.Tensor | None): Optional boolean mask over the leading
+                dimensions of `x`, as returned by `segment_padded`. The bins of
+                invalid frames are zero.
+
+        Returns:
+            torch.Tensor: The partial spectrogram of shape (..., num_bins).
+
+        """
+        if x.shape[-1] != self.window.analysis_window.shape[-1]:
+            raise ValueError(
+                f"Expected segments of size ({self.window.analysis_window.shape[-1]}), "
+                + f"provided ({x.shape[-1]})."
+            )
+        y = self._transform(x)
+        return y if mask is None else torch.where(mask[..., None], y, 0.0)
@@ -0,0 +1,142 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import functools
+import numpy as np
+import scipy.fft
+from numpy.typing import NDArray
+from typing import Tuple, cast
+
+# relative costs of a real multiply-add in a matrix product and of a butterfly of a
+# complex FFT versus a butterfly of a real FFT, measured with numpy on a single core
+MATMUL_COST = 0.35
+COMPLEX_FFT_COST = 1.2
+
+
+def next_fast_len(size: int) -> int:
+    """Returns the smallest size of at least `size` with a fast FFT."""
+    # the stubs of scipy type the result as None
+    return cast(int, scipy.fft.next_fast_len(size))  # pyright: ignore
+
+
+def compute_uniform_spacing(bins: Tuple[float, ...]) -> float | None:
+    """Returns the spacing of uniformly spaced bins, or None if they are not."""
+    if len(bins) < 2:
+        return 1.0
+    spacing = np.diff(bins)
+    if spacing[0] == 0.0 or not np.allclose(spacing, spacing[0], rtol=0.0, atol=1e-9):
+        return None
+    return float(spacing[0])
+
+
+def select_partial_spectrum_method(segment_size: int, bins: Tuple[float, ...]) -> str:
+    """
+    Selects the fastest method to compute a subset of the bins of a segment.
+
+    The estimated cost of a DFT as a matrix product (a few bins) is compared to a
+    chirp-Z transform (a uniformly spaced band, requires two complex FFTs of the
+    segment and the band) and a full real FFT (requires integer bins).
+
+    Args:
+        segment_size (int): The segment size, i.e. the size of the full FFT.
+        bins (Tuple[float, ...]): The (possibly fractional) bins to compute.
+
+    Returns:
+        str: One of "dft", "czt" or "rfft".
+
+    """
+    costs = {"dft": MATMUL_COST * segment_size * len(bins)}
+    if all(float(b).is_integer() for b in bins):
+        costs["rfft"] = 0.5 * segment_size * np.log2(segment_size)
+    if compute_uniform_spacing(bins) is not None:
+        size = next_fast_len(segment_size + len(bins) - 1)
+        costs["czt"] = COMPLEX_FFT_COST * (2.0 * size * np.log2(size) + 4.0 * size)
+    return min(costs, key=lambda method: costs[method])
+
+
+@functools.lru_cache(maxsize=None)
+def compute_dft_matrix(
+    segment_size: int, bins: Tuple[float, ...]
+) -> NDArray[np.float64]:
+    """
+    Compute the real matrix of a DFT evaluated at the given bins.
+
+    Matrices are cached, the returned array is read-only.
+
+    Args:
+        segment_size (int): The segment size.
+        bins (Tuple[float, ...]): The (possibly fractional) bins to compute.
+
+    Returns:
+        NDArray[np.float64]: The matrix of shape (segment_size, 2 * len(bins)), the
+            real parts of the bins followed by the imaginary parts.
+
+    """
+    n = np.arange(segment_size)[:, np.newaxis]
+    angle = 2.0 * np.pi * np.mod(n * np.asarray(bins), segment_size) / segment_size
+    matrix = np.concatenate([np.cos(angle), -np.sin(angle)], axis=-1)
+
+    matrix.setflags(write=False)
+    return matrix
+
+
+@functools.lru_cache(maxsize=None)
+def compute_czt_kernels(
+    segment_size: int, start: float, spacing: float, num_bins: int
+) -> Tuple[NDArray[np.complex128], NDArray[np.complex128], NDArray[np.complex128]]:
+    """
+    Compute the kernels of a chirp-Z transform with Bluestein's algorithm.
+
+    The bins `start + k * spacing` for `k = 0, ..., num_bins - 1` of a segment `x`
+    are `post * ifft(fft(pre * x, n) * kernel)[:num_bins]`, with `n` the length of
+    the kernel. Kernels are cached, the returned arrays are read-only.
+
+    Args:
+        segment_size (int): The segment size.
+        start (float): The (possibly fractional) first bin.
+        spacing (float): The (possibly fractional) spacing of the bins.
+        num_bins (int): The number of bins.
+
+    Returns:
+        Tuple[NDArray[np.complex128], NDArray[np.complex128], NDArray[np.complex128]]:
+            The chirp the segment is multiplied with, of shape (segment_size,), the
+            FFT of the convolution kernel and the chirp the result is multiplied
+            with, of shape (num_bins,).
+
+    """
+    size = next_fast_len(segment_size + num_bins - 1)
+
+    def chirp(n: NDArray[np.int64]) -> NDArray[np.float64]:
+        # pi * spacing * n^2 / segment_size, reduced before scaling
+        return np.pi * np.mod(spacing * n * n, 2 * segment_size) / segment_size
+
+    n = np.arange(segment_size)
+    k = np.arange(num_bins)
+    pre = np.exp(-1j * (2.0 * np.pi * np.mod(start * n, segment_size) / segment_size))
+    pre *= np.exp(-1j * chirp(n))
+
+    kernel = np.zeros(size, dtype=np.complex128)
+    kernel[:num_bins] = np.exp(1j * chirp(k))
+    kernel[size - segment_size + 1 :] = np.exp(1j * chirp(n[1:][::-1]))
+    kernel = np.fft.fft(kernel)
+
+    post = np.exp(-1j * chirp(k))
+
+    for array in (pre, kernel, post):
+        array.setflags(write=False)
+    return pre, kernel, post
@@ -0,0 +1,108 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any
+
+from libsegmenter.transforms.spectrogram.SpectrogramNumpy import SpectrogramNumpy
+from libsegmenter.Window import Window
+
+
+class PolyphaseNumpy:
+    """
+    A class for computing a (weighted overlap-add) polyphase DFT filterbank.
+
+    The window may hold a long prototype filter of `num_folds * fft_size` samples.
+    Every windowed segment is time-aliased (folded) onto `fft_size` samples before
+    the real FFT, which equals the spectrum of the full segment at every
+    `num_folds`-th bin, at the cost of a short FFT. The inverse repeats (unfolds) the
+    `fft_size` samples over the segment, after which `unsegment` applies the long
+    synthesis window and overlap-adds.
+
+    Attributes:
+        window (Window): The window the segments are created with.
+        fft_size (int): The size of the FFT.
+        num_folds (int): The number of FFT sized blocks in a segment.
+
+    """
+
+    def __init__(self, window: Window, fft_size: int) -> None:
+        """
+        Initializes the PolyphaseNumpy instance.
+
+        Args:
+            window (Window): The window the segments are created with.
+            fft_size (int): The size of the FFT, which must divide the segment size.
+
+        """
+        segment_size = window.analysis_window.shape[-1]
+        if segment_size % fft_size != 0:
+            raise ValueError(
+                f"The segment size ({segment_size}) is expected to be a multiple of "
+                + f"the FFT size ({fft_size})."
+            )
+
+        self.window = window
+        self.fft_size = fft_size
+        self.num_folds = segment_size // fft_size
+        self._spectrogram = SpectrogramNumpy()
+
+    def forward(
+        self, x: NDArray[Any], mask: NDArray[np.bool_] | None = None
+    ) -> NDArray[np.complex128]:
+        """
+        Converts segments into sub-band samples.
+
+        Args:
+            x (NDArray[Any]): Segments as generated by a Segmenter object.
+            mask (NDArray[np.bool_] | None): Optional boolean mask over the leading
+                dimensions of `x`, as returned by `segment_padded`. Only the valid
+                frames are transformed, the others are zero.
+
+        Returns:
+            NDArray[np.complex128]: Sub-band samples of shape (...,
+                fft_size // 2 + 1).
+
+        """
+        if x.shape[-1] != self.num_folds * self.fft_size:
+            raise ValueError(
+                f"Expected segments of size ({self.num_folds * self.fft_size}), "
+                + f"provided ({x.shape[-1]})."
+            )
+
+        folded = x.reshape(x.shape[:-1] + (self.num_folds, self.fft_size)).sum(axis=-2)
+        return self._spectrogram.forward(folded, mask)
+
+    def inverse(
+        self, y: NDArray[np.complex128], mask: NDArray[np.bool_] | None = None
+    ) -> NDArray[Any]:
+        """
+        Converts sub-band samples into segments.
+
+        Args:
+            y (NDArray[np.complex128]): Sub-band samples from a `forward` pass.
+            mask (NDArray[np.bool_] | None): Optional boolean mask over the leading
+                dimensions of `y`. Only the valid frames are transformed, the others
+                are zero.
+
+        Returns:
+            NDArray[Any]: Segments of shape (..., num_folds * fft_size).
+
+        """
+        return np.tile(self._spectrogram.inverse(y, mask), self.num_folds)
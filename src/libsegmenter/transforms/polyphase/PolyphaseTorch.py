@@ -0,0 +1,103 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import torch
+
+from libsegmenter.transforms.spectrogram.SpectrogramTorch import SpectrogramTorch
+from libsegmenter.Window import Window
+
+
+class PolyphaseTorch:
+    """
+    A class for computing a polyphase DFT filterbank using PyTorch.
+
+    Every windowed segment of `num_folds * fft_size` samples is folded onto
+    `fft_size` samples before the real FFT, and the inverse unfolds the FFT sized
+    block over the segment, see `PolyphaseNumpy`.
+
+    Attributes:
+        window (Window): The window the segments are created with.
+        fft_size (int): The size of the FFT.
+        num_folds (int): The number of FFT sized blocks in a segment.
+
+    """
+
+    def __init__(self, window: Window, fft_size: int) -> None:
+        """
+        Initializes the PolyphaseTorch instance.
+
+        Args:
+            window (Window): The window the segments are created with.
+            fft_size (int): The size of the FFT, which must divide the segment size.
+
+        """
+        segment_size = window.analysis_window.shape[-1]
+        if segment_size % fft_size != 0:
+            raise ValueError(
+                f"The segment size ({segment_size}) is expected to be a multiple of "
+                + f"the FFT size ({fft_size})."
+            )
+
+        self.window = window
+        self.fft_size = fft_size
+        self.num_folds = segment_size // fft_size
+        self._spectrogram = SpectrogramTorch()
+
+    def forward(
+        self, x: torch.Tensor, mask: torch.Tensor | None = None
+    ) -> torch.Tensor:
+        """
+        Converts segments into sub-band samples.
+
+        Args:
+            x (torch.Tensor): Segments as generated by a Segmenter object.
+            mask (torch.Tensor | None): Optional boolean mask over the leading
+                dimensions of `x`, as returned by `segment_padded`. Only the valid
+                frames are transformed, the others are zero.
+
+        Returns:
+            torch.Tensor: Sub-band samples of shape (..., fft_size // 2 + 1).
+
+        """
+        if x.shape[-1] != self.num_folds * self.fft_size:
+            raise ValueError(
+                f"Expected segments of size ({self.num_folds * self.fft_size}), "
+                + f"provided ({x.shape[-1]})."
+            )
+
+        folded = x.reshape(*x.shape[:-1], self.num_folds, self.fft_size).sum(dim=-2)
+        return self._spectrogram.forward(folded, mask)
+
+    def inverse(
+        self, y: torch.Tensor, mask: torch.Tensor | None = None
+    ) -> torch.Tensor:
+        """
+        Converts sub-band samples into segments.
+
+        Args:
+            y (torch.Tensor): Sub-band samples from a `forward` pass.
+            mask (torch.Tensor | None): Optional boolean mask over the leading
+                dimensions of `y`. Only the valid frames are transformed, the others
+                are zero.
+
+        Returns:
+            torch.Tensor: Segments of shape (..., num_folds * fft_size).
+
+        """
+        x = self._spectrogram.inverse(y, mask)
+        return x.repeat(*([1] * (x.ndim - 1)), self.num_folds)
@@ -0,0 +1,290 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any, List, Sequence, Tuple
+
+from libsegmenter.backends.common import compute_num_segments
+from libsegmenter.transforms.partial_spectrum.PartialSpectrumNumpy import (
+    PartialSpectrumNumpy,
+)
+from libsegmenter.transforms.sliding_dft.common import compute_cosine_sum_coefficients
+from libsegmenter.Window import Window
+
+# the number of frames unrolled at once, bounds the size of the rotation tables
+SLIDE_BLOCK_SIZE = 256
+
+
+class SlidingDFTNumpy:
+    """
+    A class for computing spectrograms with a sliding DFT.
+
+    The spectrum of a frame is updated from the spectrum of the previous frame with
+    the samples that enter and leave it, at a cost of O(hop_size) per bin instead of
+    an FFT per frame, and without materializing the segments. To bound the
+    accumulation of rounding errors, the spectrum is re-anchored with an exact DFT
+    every `anchor_interval` frames. The analysis window must be a cosine sum (e.g.
+    rectangular, hann, hamming or blackman), it is applied in the frequency domain.
+
+    The frames equal those of a `Segmenter` with the given hop size, followed by a
+    `Spectrogram`. Signals are either transformed as a whole with `forward`, or in
+    chunks with `process`.
+
+    Attributes:
+        window (Window): The window whose analysis window is applied.
+        hop_size (int): The hop size between frames.
+        bins (NDArray[np.int64]): The bins of the spectrum.
+        anchor_interval (int): The number of frames between exact DFTs.
+
+    """
+
+    def __init__(
+        self,
+        window: Window,
+        hop_size: int | None = None,
+        bins: Sequence[int] | None = None,
+        anchor_interval: int = 1024,
+    ) -> None:
+        """
+        Initializes the SlidingDFTNumpy instance.
+
+        Args:
+            window (Window): The window object, its analysis window must be a cosine
+                sum, e.g. created with the "ola" or "analysis" scheme.
+            hop_size (int | None): The hop size between frames. Defaults to the hop
+                size of the window.
+            bins (Sequence[int] | None): The bins of the spectrum to compute.
+                Defaults to all segment_size // 2 + 1 bins.
+            anchor_interval (int): The number of frames between exact DFTs. Defaults
+                to 1024.
+
+        """
+        segment_size = window.analysis_window.shape[-1]
+        hop_size = window.hop_size if hop_size is None else hop_size
+        if not 0 < hop_size <= segment_size:
+            raise ValueError(
+                f"Expected a hop size between 1 and {segment_size}, provided "
+                + f"({hop_size})."
+            )
+        if anchor_interval < 1:
+            raise ValueError(
+                f"Expected a positive anchor interval, provided ({anchor_interval})."
+            )
+        coefficients = compute_cosine_sum_coefficients(window.analysis_window)
+        if coefficients is None:
+            raise ValueError(
+                "The analysis window is expected to be a cosine-sum window, e.g. a "
+                + "rectangular, hann, hamming or blackman window with the 'ola' or "
+                + "'analysis' scheme."
+            )
+
+        self.window = window
+        self.hop_size = hop_size
+        self.bins: NDArray[np.int64] = np.asarray(
+            np.arange(segment_size // 2 + 1) if bins is None else bins, dtype=np.int64
+        )
+        if np.any(self.bins < 0) or np.any(self.bins > segment_size // 2):
+            raise ValueError(
+                f"Expected bins within [0, {segment_size // 2}], provided "
+                + f"{self.bins.tolist()}."
+            )
+        self.anchor_interval = anchor_interval
+
+        # the windowed bins are a convolution of the unwindowed (raw) bins, bins
+        # beyond [0, segment_size // 2] are the conjugates of mirrored raw bins
+        order = int(coefficients.shape[-1]) - 1
+        offsets = np.arange(-order, order + 1)
+        self._taps = np.concatenate([coefficients[:0:-1], coefficients]) / 2.0
+        self._taps[order] *= 2.0
+        mirrored: NDArray[np.int64] = np.mod(
+            self.bins[:, np.newaxis] + offsets, segment_size
+        )
+        conjugate = mirrored > segment_size // 2
+        mirrored = np.where(conjugate, segment_size - mirrored, mirrored)
+        raw_bins, indices = np.unique(mirrored, return_inverse=True)
+        self._raw_bins: NDArray[np.int64] = raw_bins
+        self._indices = indices.reshape(mirrored.shape) + conjugate * len(
+            self._raw_bins
+        )
+        self._order = order if bins is None else None
+
+        # W^m = exp(-2j pi m / N), indexed exactly with integer exponents modulo N
+        angle = 2.0 * np.pi * np.arange(segment_size, dtype=np.float64) / segment_size
+        self._twiddles = np.exp(-1j * angle)
+        exponents: NDArray[np.int64] = np.outer(np.arange(hop_size), self._raw_bins)
+        self._step = self._twiddles[np.mod(exponents, segment_size)]
+        steps = np.arange(SLIDE_BLOCK_SIZE + 1)[:, np.newaxis] * self._raw_bins
+        self._rotation = self._twiddles[np.mod(steps * hop_size, segment_size)]
+        self._inverse_rotation = self._rotation.conj()
+        self._anchor = PartialSpectrumNumpy(window, bins=self._raw_bins.tolist())
+
+        self.reset()
+
+    def reset(self) -> None:
+        """Resets the state of `process`, the next chunk starts a new signal."""
+        self._buffer: NDArray[np.float64] | None = None
+        self._spectrum: NDArray[np.complex128] | None = None
+        self._age = 0
+
+    def _exact(self, x: NDArray[np.float64]) -> NDArray[np.complex128]:
+        # the raw bins of the frame at the start of x
+        segment_size = self.window.analysis_window.shape[-1]
+        return self._anchor.forward(x[..., :segment_size]).astype(np.complex128)
+
+    def _slide(
+        self, x: NDArray[np.float64], spectrum: NDArray[np.complex128], age: int
+    ) -> Tuple[List[NDArray[np.complex128]], int, NDArray[np.complex128], int]:
+        # raw bins of the frames after the frame at the start of x, whose raw bins
+        # are `spectrum` and which was anchored `age` frames ago
+        segment_size = self.window.analysis_window.shape[-1]
+        hop_size = self.hop_size
+        num_frames = (x.shape[-1] - segment_size) // hop_size
+
+        frames: List[NDArray[np.complex128]] = []
+        start = 0
+        while num_frames > 0:
+            count = min(num_frames, self.anchor_interval - age, SLIDE_BLOCK_SIZE)
+            stop = start + count * hop_size
+
+            # X[t + 1] = W^(-k h) (X[t] + sum_i (x[t + N + i] - x[t + i]) W^(k i))
+            delta = x[:, start + segment_size : stop + segment_size] - x[:, start:stop]
+            delta = delta.reshape(x.shape[0], count, hop_size) @ self._step
+
+            # unrolled: X[t + j] = W^(-k h j) (X[t] + sum_l<j W^(k h l) delta[l])
+            delta = np.cumsum(self._rotation[:count] * delta, axis=-2)
+            block = self._inverse_rotation[1 : count + 1] * (
+                spectrum[:, np.newaxis, :] + delta
+            )
+
+            start, age, num_frames = stop, age + count, num_frames - count
+            if age == self.anchor_interval:
+                block[:, -1] = self._exact(x[:, start:])
+                age = 0
+            spectrum = block[:, -1]
+            frames.append(block)
+
+        return frames, start, spectrum, age
+
+    def _window(self, raw: NDArray[np.complex128]) -> NDArray[np.complex128]:
+        # applies the analysis window as a convolution over the raw bins
+        if self._order is not None:
+            # all bins, the mirrored bins extend the raw bins on both sides
+            order = self._order
+            extended = np.concatenate(
+                [
+                    raw[..., order:0:-1].conj(),
+                    raw,
+                    raw[..., -2 : -2 - order : -1].conj(),
+                ],
+                axis=-1,
+            )
+            num_bins = raw.shape[-1]
+            y = self._taps[0] * extended[..., :num_bins]
+            for m, tap in enumerate(self._taps[1:], start=1):
+                y += tap * extended[..., m : m + num_bins]
+            return y
+
+        extended = np.concatenate([raw, raw.conj()], axis=-1)
+        y = self._taps[0] * extended[..., self._indices[:, 0]]
+        for tap, indices in zip(self._taps[1:], self._indices.T[1:], strict=True):
+            y += tap * extended[..., indices]
+        return y
+
+    def _process(
+        self,
+        x: NDArray[np.float64],
+        buffer: NDArray[np.float64] | None,
+        spectrum: NDArray[np.complex128] | None,
+        age: int,
+    ) -> Tuple[
+        NDArray[np.complex128], NDArray[np.float64], NDArray[np.complex128] | None, int
+    ]:
+        # buffer starts at the last emitted frame, or the first frame if none
+        segment_size = self.window.analysis_window.shape[-1]
+        x = x if buffer is None else np.concatenate([buffer, x], axis=-1)
+
+        empty = np.zeros((x.shape[0], 0, len(self.bins)), dtype=np.complex128)
+        frames: List[NDArray[np.complex128]] = []
+        if spectrum is None:
+            if x.shape[-1] < segment_size:
+                return empty, x, None, 0
+            spectrum, age = self._exact(x), 0
+            frames.append(spectrum[:, np.newaxis, :])
+
+        blocks, start, spectrum, age = self._slide(x, spectrum, age)
+        y = np.concatenate(
+            [empty] + [self._window(raw) for raw in frames + blocks], axis=-2
+        )
+        return y, x[:, start:], spectrum, age
+
+    def forward(self, x: NDArray[Any]) -> NDArray[np.complex128]:
+        """
+        Converts a signal into a spectrogram.
+
+        Args:
+            x (NDArray[Any]): Input signal, either 1D (sequence) or 2D (batch).
+
+        Returns:
+            NDArray[np.complex128]: The spectrogram of shape (batch_size, num_frames,
+                num_bins), equal to segmenting with the hop size followed by a
+                spectrogram.
+
+        """
+        if x.ndim not in {1, 2}:
+            raise ValueError(f"Only supports 1D or 2D inputs, provided {x.ndim}D.")
+        segment_size = self.window.analysis_window.shape[-1]
+        num_frames = compute_num_segments(x.shape[-1], self.hop_size, segment_size)
+        if num_frames <= 0:
+            raise ValueError(
+                "Input signal is too short for segmentation with the given num_samples "
+                + f"({x.shape[-1]}), hop size ({self.hop_size}) and segment size "
+                + f"({segment_size})."
+            )
+
+        y, _, _, _ = self._process(
+            np.asarray(x, dtype=np.float64).reshape(-1, x.shape[-1]), None, None, 0
+        )
+        y = y[:, :num_frames]
+        return y if x.ndim == 2 else y[0]
+
+    def process(self, x: NDArray[Any]) -> NDArray[np.complex128]:
+        """
+        Converts the next chunk of a signal into the frames it completes.
+
+        The state is kept between calls, such that the concatenated outputs equal
+        `forward` of the concatenated chunks (up to the frames that do not fit).
+
+        Args:
+            x (NDArray[Any]): The next chunk of the signal, either 1D (sequence) or
+                2D (batch), of any length.
+
+        Returns:
+            NDArray[np.complex128]: The spectrogram of the completed frames, of shape
+                (batch_size, num_frames, num_bins) where num_frames may be zero.
+
+        """
+        if x.ndim not in {1, 2}:
+            raise ValueError(f"Only supports 1D or 2D inputs, provided {x.ndim}D.")
+        y, self._buffer, self._spectrum, self._age = self._process(
+            np.asarray(x, dtype=np.float64).reshape(-1, x.shape[-1]),
+            self._buffer,
+            self._spectrum,
+            self._age,
+        )
+        return y if x.ndim == 2 else y[0]
@@ -0,0 +1,59 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any
+
+MAX_COSINE_SUM_ORDER = 4
+
+
+def compute_cosine_sum_coefficients(
+    window: NDArray[Any], atol: float = 1e-5
+) -> NDArray[np.float64] | None:
+    """
+    Compute the coefficients of a periodic cosine-sum window.
+
+    A cosine-sum window `w[n] = sum_m c[m] cos(2 pi m n / N)`, e.g. a rectangular,
+    hann, hamming or blackman window, is applied in the frequency domain as a
+    convolution with `2 * order + 1` taps.
+
+    Args:
+        window (NDArray[Any]): The window of size N.
+        atol (float): The absolute tolerance on the residual, relative to the peak
+            of the window. Defaults to 1e-5.
+
+    Returns:
+        NDArray[np.float64] | None: The coefficients c[0], ..., c[order], or None if
+            the window is not a cosine sum of at most `MAX_COSINE_SUM_ORDER` terms.
+
+    """
+    window = np.asarray(window, dtype=np.float64)
+    spectrum = np.fft.rfft(window) / window.shape[-1]
+    tolerance = atol * max(float(np.max(np.abs(window))), np.finfo(np.float64).tiny)
+
+    significant = np.flatnonzero(np.abs(spectrum) > tolerance)
+    order = int(significant[-1]) if significant.size > 0 else 0
+    if order > MAX_COSINE_SUM_ORDER or order >= window.shape[-1] // 2:
+        return None
+    if np.max(np.abs(spectrum.imag)) > tolerance:
+        return None
+
+    coefficients = spectrum.real[: order + 1].copy()
+    coefficients[1:] *= 2.0
+    return coefficients
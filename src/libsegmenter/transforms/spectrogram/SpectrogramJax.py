@@ -0,0 +1,75 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import jax
+import jax.numpy as jnp
+
+
+class SpectrogramJax:
+    """
+    A class for computing spectrograms using JAX.
+
+    The normalization for the Fourier transform is `backward` by default.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the SpectrogramJax instance."""
+        return
+
+    def forward(self, x: jax.Array, mask: jax.Array | None = None) -> jax.Array:
+        """
+        Converts segments into a spectrogram.
+
+        Args:
+            x (jax.Array): Input segments.
+            mask (jax.Array | None): Optional boolean mask over the leading
+                dimensions of `x`, as returned by `segment_padded`. Frames outside
+                the mask are zero. To keep shapes static, all frames are transformed.
+
+        Returns:
+            jax.Array: Spectrogram representation.
+
+        """
+        if x.shape[-1] % 2 != 0:
+            raise ValueError(
+                "Input segment size is expected to be even for a consistent definition "
+                + "of the inverse real-valued FFT."
+            )
+        y = jnp.fft.rfft(x, axis=-1, norm="backward")
+        if mask is None:
+            return y
+        return jnp.where(mask[..., None], y, 0)
+
+    def inverse(self, y: jax.Array, mask: jax.Array | None = None) -> jax.Array:
+        """
+        Converts spectrogram into segments.
+
+        Args:
+            y (jax.Array): Spectrogram from a `forward` pass.
+            mask (jax.Array | None): Optional boolean mask over the leading
+                dimensions of `y`. Frames outside the mask are zero.
+
+        Returns:
+            jax.Array: Reconstructed segments.
+
+        """
+        x = jnp.fft.irfft(y, axis=-1, norm="backward")
+        if mask is None:
+            return x
+        return jnp.where(mask[..., None], x, 0)
@@ -37,12 +37,17 @@ class SpectrogramNumpy:
         """Initializes the SpectrogramNumpy instance."""
         return
 
-    def forward(self, x: NDArray[T]) -> NDArray[np.complex128]:
+    def forward(
+        self, x: NDArray[T], mask: NDArray[np.bool_] | None = None
+    ) -> NDArray[np.complex128]:
         """
         Converts segments into a spectrogram.
 
         Args:
             x (NDArray[T]): Segments as generated by a Segmenter object.
+            mask (NDArray[np.bool_] | None): Optional boolean mask over the leading
+                dimensions of `x`, as returned by `segment_padded`. Only the valid
+                frames are transformed, the others are zero.
 
         """
         if x.shape[-1] % 2 != 0:
@@ -50,14 +55,31 @@ class SpectrogramNumpy:
                 "Input segment size is expected to be even for a consistent definition "
                 + "of the inverse real-valued FFT."
             )
-        return np.fft.rfft(x, axis=-1, norm="backward")
+        if mask is None:
+            return np.fft.rfft(x, axis=-1, norm="backward")
 
-    def inverse(self, y: NDArray[np.complex128]) -> NDArray[np.float64]:
+        valid = np.fft.rfft(x[mask], axis=-1, norm="backward")
+        y = np.zeros(mask.shape + valid.shape[-1:], dtype=valid.dtype)
+        y[mask] = valid
+        return y
+
+    def inverse(
+        self, y: NDArray[np.complex128], mask: NDArray[np.bool_] | None = None
+    ) -> NDArray[np.float64]:
         """
         Converts spectrogram into segments.
 
         Args:
             y (NDArray[np.complex128]): Spectrogram resulting from a `forward` pass.
+            mask (NDArray[np.bool_] | None): Optional boolean mask over the leading
+                dimensions of `y`. Only the valid frames are transformed, the others
+                are zero.
 
         """
-        return np.fft.irfft(y, axis=-1, norm="backward")
+        if mask is None:
+            return np.fft.irfft(y, axis=-1, norm="backward")
+
+        valid = np.fft.irfft(y[mask], axis=-1, norm="backward")
+        x = np.zeros(mask.shape + valid.shape[-1:], dtype=valid.dtype)
+        x[mask] = valid
+        return x
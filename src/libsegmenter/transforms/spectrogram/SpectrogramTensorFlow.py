@@ -18,6 +18,16 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import tensorflow as tf
+import numpy as np
+from typing import Dict, Tuple, cast
+
+
+def _scatter_valid(valid: tf.Tensor, mask: tf.Tensor) -> tf.Tensor:
+    shape = tf.concat(
+        [tf.shape(mask, out_type=tf.int64), tf.shape(valid, out_type=tf.int64)[-1:]],
+        axis=0,
+    )
+    return tf.scatter_nd(tf.where(mask), valid, shape)  # pyright: ignore
 
 
 class SpectrogramTensorFlow:
@@ -25,40 +35,114 @@ class SpectrogramTensorFlow:
     A class for computing spectrograms using TensorFlow.
 
     The normalization for the Fourier transform is `backward` by default.
+
+    In export mode, the real-valued DFT is computed as a matrix product and complex
+    values are represented by a trailing dimension of size 2 holding the real and
+    imaginary parts, since TFLite has no builtin complex-valued FFT operators.
+
+    Attributes:
+        export_mode (bool): Whether the export-friendly formulation is used.
+
     """
 
-    def __init__(self) -> None:
-        """Initializes the SpectrogramTensorFlow instance."""
-        return
+    def __init__(self, export_mode: bool = False) -> None:
+        """
+        Initializes the SpectrogramTensorFlow instance.
+
+        Args:
+            export_mode (bool): Whether to use the export-friendly formulation.
+                Defaults to False.
 
-    def forward(self, x: tf.Tensor) -> tf.Tensor:
+        """
+        self.export_mode = export_mode
+        self._dft_matrices: Dict[Tuple[int, tf.DType], Tuple[tf.Tensor, tf.Tensor]] = {}
+
+    def _dft(self, segment_size: int, dtype: tf.DType) -> Tuple[tf.Tensor, tf.Tensor]:
+        # forward (segment_size, 2 * bins) and inverse (2 * bins, segment_size)
+        # matrices, with the real and imaginary parts of every bin interleaved
+        key = (segment_size, dtype)
+        if key not in self._dft_matrices:
+            num_bins = segment_size // 2 + 1
+            angle = (
+                2.0
+                * np.pi
+                * np.outer(np.arange(segment_size), np.arange(num_bins))
+                / segment_size
+            )
+            forward = np.stack([np.cos(angle), -np.sin(angle)], axis=-1)
+
+            # bins other than dc and nyquist stand in for their conjugate as well
+            scale = np.full(num_bins, 2.0 / segment_size)
+            scale[0] = scale[-1] = 1.0 / segment_size
+            inverse = np.stack(
+                [scale * np.cos(angle), -scale * np.sin(angle)], axis=-1
+            ).transpose(1, 2, 0)
+
+            self._dft_matrices[key] = (
+                tf.constant(forward.reshape(segment_size, -1), dtype=dtype),
+                tf.constant(inverse.reshape(-1, segment_size), dtype=dtype),
+            )
+        return self._dft_matrices[key]
+
+    def forward(self, x: tf.Tensor, mask: tf.Tensor | None = None) -> tf.Tensor:
         """
         Converts segments into a spectrogram.
 
         Args:
             x (tf.Tensor): Input segments.
+            mask (tf.Tensor | None): Optional boolean mask over the leading dimensions
+                of `x`, as returned by `segment_padded`. Only the valid frames are
+                transformed, the others are zero.
 
         Returns:
             tf.Tensor: Spectrogram representation.
 
         """
-        s = tf.shape(x).numpy()  # pyright: ignore
-        if s[-1] % 2 != 0:  # pyright: ignore
+        if x.shape[-1] % 2 != 0:  # pyright: ignore
             raise ValueError(
                 "Input segment size is expected to be even for a consistent definition "
                 + "of the inverse real-valued FFT."
             )
-        return tf.signal.rfft(x)  # pyright: ignore
+        if self.export_mode:
+            forward, _ = self._dft(x.shape[-1], x.dtype)  # pyright: ignore
+            y = cast(tf.Tensor, tf.tensordot(x, forward, axes=1))  # pyright: ignore
+            y = tf.reshape(y, tf.concat([tf.shape(y)[:-1], [-1, 2]], axis=0))
+            if mask is None:
+                return y
+            mask = tf.reshape(mask, tf.concat([tf.shape(mask), [1, 1]], axis=0))
+            return tf.where(mask, y, tf.zeros_like(y))
 
-    def inverse(self, y: tf.Tensor) -> tf.Tensor:
+        if mask is None:
+            return tf.signal.rfft(x)  # pyright: ignore
+
+        valid = tf.signal.rfft(tf.boolean_mask(x, mask))  # pyright: ignore
+        return _scatter_valid(valid, mask)  # pyright: ignore
+
+    def inverse(self, y: tf.Tensor, mask: tf.Tensor | None = None) -> tf.Tensor:
         """
         Converts spectrogram into segments.
 
         Args:
             y (tf.Tensor): Spectrogram from a `forward` pass.
+            mask (tf.Tensor | None): Optional boolean mask over the leading dimensions
+                of `y`. Only the valid frames are transformed, the others are zero.
 
         Returns:
             tf.Tensor: Reconstructed segments.
 
         """
-        return tf.signal.irfft(y)  # pyright: ignore
+        if self.export_mode:
+            segment_size = 2 * (y.shape[-2] - 1)  # pyright: ignore
+            _, inverse = self._dft(segment_size, y.dtype)  # pyright: ignore
+            y = tf.reshape(y, tf.concat([tf.shape(y)[:-2], [-1]], axis=0))
+            x = cast(tf.Tensor, tf.tensordot(y, inverse, axes=1))  # pyright: ignore
+            if mask is None:
+                return x
+            mask = tf.expand_dims(mask, axis=-1)
+            return tf.where(mask, x, tf.zeros_like(x))
+
+        if mask is None:
+            return tf.signal.irfft(y)  # pyright: ignore
+
+        valid = tf.signal.irfft(tf.boolean_mask(y, mask))  # pyright: ignore
+        return _scatter_valid(valid, mask)  # pyright: ignore
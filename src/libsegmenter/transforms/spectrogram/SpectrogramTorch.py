@@ -18,6 +18,8 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import torch
+import numpy as np
+from typing import Dict, Tuple, cast
 
 
 class SpectrogramTorch:
@@ -25,18 +27,74 @@ class SpectrogramTorch:
     A class for computing spectrograms using PyTorch.
 
     The normalization for the Fourier transform is `backward` by default.
+
+    In export mode, the real-valued DFT is computed as a matrix product and complex
+    values are represented by a trailing dimension of size 2 holding the real and
+    imaginary parts (as `torch.view_as_real`), since ONNX has no complex tensors.
+
+    Attributes:
+        export_mode (bool): Whether the export-friendly formulation is used.
+
     """
 
-    def __init__(self) -> None:
-        """Initializes the SpectrogramTorch instance."""
-        return
+    def __init__(self, export_mode: bool = False) -> None:
+        """
+        Initializes the SpectrogramTorch instance.
+
+        Args:
+            export_mode (bool): Whether to use the export-friendly formulation.
+                Defaults to False.
 
-    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """
+        self.export_mode = export_mode
+        self._dft_matrices: Dict[
+            Tuple[int, torch.dtype, torch.device], Tuple[torch.Tensor, torch.Tensor]
+        ] = {}
+
+    def _dft(
+        self, segment_size: int, dtype: torch.dtype, device: torch.device
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        # forward (segment_size, 2 * bins) and inverse (2 * bins, segment_size)
+        # matrices, with the real and imaginary parts of every bin interleaved
+        key = (segment_size, dtype, device)
+        if key not in self._dft_matrices:
+            num_bins = segment_size // 2 + 1
+            angle = (
+                2.0
+                * np.pi
+                * np.outer(np.arange(segment_size), np.arange(num_bins))
+                / segment_size
+            )
+            forward = np.stack([np.cos(angle), -np.sin(angle)], axis=-1)
+
+            # bins other than dc and nyquist stand in for their conjugate as well
+            scale = np.full(num_bins, 2.0 / segment_size)
+            scale[0] = scale[-1] = 1.0 / segment_size
+            inverse = np.stack(
+                [scale * np.cos(angle), -scale * np.sin(angle)], axis=-1
+            ).transpose(1, 2, 0)
+
+            self._dft_matrices[key] = (
+                torch.tensor(
+                    forward.reshape(segment_size, -1), dtype=dtype, device=device
+                ),
+                torch.tensor(
+                    inverse.reshape(-1, segment_size), dtype=dtype, device=device
+                ),
+            )
+        return self._dft_matrices[key]
+
+    def forward(
+        self, x: torch.Tensor, mask: torch.Tensor | None = None
+    ) -> torch.Tensor:
         """
         Converts segments into a spectrogram.
 
         Args:
             x (torch.Tensor): Input segments.
+            mask (torch.Tensor | None): Optional boolean mask over the leading
+                dimensions of `x`, as returned by `segment_padded`. Only the valid
+                frames are transformed, the others are zero.
 
         Returns:
             torch.Tensor: Spectrogram representation.
@@ -47,17 +105,52 @@ class SpectrogramTorch:
                 "Input segment size is expected to be even for a consistent definition "
                 + "of the inverse real-valued FFT."
             )
-        return torch.fft.rfft(x, dim=-1, norm="backward")  # pyright: ignore
+        if self.export_mode:
+            # the segment size is static, while tracing `x.shape[-1]` is a tensor
+            forward, _ = self._dft(int(x.shape[-1]), x.dtype, x.device)
+            y = cast(torch.Tensor, torch.matmul(x, forward).unflatten(-1, (-1, 2)))
+            return y if mask is None else torch.where(mask[..., None, None], y, 0.0)
 
-    def inverse(self, y: torch.Tensor) -> torch.Tensor:
+        if mask is None:
+            return torch.fft.rfft(x, dim=-1, norm="backward")  # pyright: ignore
+
+        valid = cast(
+            torch.Tensor,
+            torch.fft.rfft(x[mask], dim=-1, norm="backward"),  # pyright: ignore
+        )
+        y = valid.new_zeros((*mask.shape, valid.shape[-1]))
+        y[mask] = valid
+        return y
+
+    def inverse(
+        self, y: torch.Tensor, mask: torch.Tensor | None = None
+    ) -> torch.Tensor:
         """
         Converts spectrogram into segments.
 
         Args:
             y (torch.Tensor): Spectrogram from a `forward` pass.
+            mask (torch.Tensor | None): Optional boolean mask over the leading
+                dimensions of `y`. Only the valid frames are transformed, the others
+                are zero.
 
         Returns:
             torch.Tensor: Reconstructed segments.
 
         """
-        return torch.fft.irfft(y, dim=-1, norm="backward")  # pyright: ignore
+        if self.export_mode:
+            segment_size = 2 * (int(y.shape[-2]) - 1)
+            _, inverse = self._dft(segment_size, y.dtype, y.device)
+            x = torch.matmul(y.flatten(-2), inverse)
+            return x if mask is None else torch.where(mask[..., None], x, 0.0)
+
+        if mask is None:
+            return torch.fft.irfft(y, dim=-1, norm="backward")  # pyright: ignore
+
+        valid = cast(
+            torch.Tensor,
+            torch.fft.irfft(y[mask], dim=-1, norm="backward"),  # pyright: ignore
+        )
+        x = valid.new_zeros((*mask.shape, valid.shape[-1]))
+        x[mask] = valid
+        return x
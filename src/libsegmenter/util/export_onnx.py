@@ -0,0 +1,120 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any, Dict, List, Sequence, cast
+
+
+def export_onnx(
+    module: Any,
+    example_inputs: Sequence[Any],
+    path: str,
+    input_names: List[str] | None = None,
+    output_names: List[str] | None = None,
+    dynamic_axes: Dict[str, Dict[int, str]] | None = None,
+    opset_version: int = 17,
+    validate: bool = True,
+    rtol: float = 1e-4,
+    atol: float = 1e-4,
+) -> None:
+    """
+    Exports a PyTorch module to ONNX and validates it against the eager module.
+
+    The module would typically chain a `SegmenterTorch`, a transform and the inverse
+    operations, all constructed with `export_mode=True`, so the complete chain runs
+    inside a single ONNX graph.
+
+    The graph is traced with the example inputs, so the number of samples, and
+    hence the number of segments, is fixed at export. Only the batch axis can be
+    declared dynamic in `dynamic_axes`.
+
+    Args:
+        module (torch.nn.Module): The module to export.
+        example_inputs (Sequence[torch.Tensor]): Example inputs of the module, used
+            for tracing and validation.
+        path (str): Path of the ONNX file to write.
+        input_names (List[str] | None): Names of the graph inputs. Defaults to
+            `input_0`, `input_1`, ...
+        output_names (List[str] | None): Names of the graph outputs. Defaults to
+            `output_0`, `output_1`, ...
+        dynamic_axes (Dict[str, Dict[int, str]] | None): Dynamic (batch) axes of the
+            inputs and outputs, see `torch.onnx.export`. Defaults to None.
+        opset_version (int): The ONNX opset version. Defaults to 17.
+        validate (bool): Whether to run the exported graph with onnxruntime and
+            compare its outputs to the eager module. Defaults to True.
+        rtol (float): Relative tolerance of the validation. Defaults to 1e-4.
+        atol (float): Absolute tolerance of the validation. Defaults to 1e-4.
+
+    Raises:
+        ValueError: If the exported graph does not reproduce the eager outputs.
+
+    """
+    import torch
+
+    example_inputs = tuple(example_inputs)
+    if input_names is None:
+        input_names = [f"input_{k}" for k in range(len(example_inputs))]
+
+    module.eval()
+    with torch.no_grad():
+        result = module(*example_inputs)
+    expected: List[torch.Tensor] = (
+        list(cast(Sequence[torch.Tensor], result))
+        if isinstance(result, (tuple, list))
+        else [cast(torch.Tensor, result)]
+    )
+    if output_names is None:
+        output_names = [f"output_{k}" for k in range(len(expected))]
+
+    torch.onnx.export(  # pyright: ignore
+        module,
+        example_inputs,
+        path,
+        input_names=input_names,
+        output_names=output_names,
+        dynamic_axes=dynamic_axes,
+        opset_version=opset_version,
+        dynamo=False,
+    )
+
+    if not validate:
+        return
+
+    import onnxruntime
+
+    session = onnxruntime.InferenceSession(path, providers=["CPUExecutionProvider"])
+    outputs = cast(
+        List[NDArray[Any]],
+        session.run(  # pyright: ignore
+            output_names,
+            {
+                name: x.detach().cpu().numpy()
+                for name, x in zip(input_names, example_inputs, strict=True)
+            },
+        ),
+    )
+    for name, a, b in zip(output_names, outputs, expected, strict=True):
+        b = b.detach().cpu().numpy()
+        if a.shape != b.shape or not np.allclose(a, b, rtol=rtol, atol=atol):
+            error = np.max(np.abs(a - b)) if a.shape == b.shape else np.inf
+            raise ValueError(
+                f"The exported output '{name}' deviates from the eager module, "
+                + f"shapes {a.shape} and {b.shape}, maximum error {error}."
+            )
@@ -0,0 +1,125 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any, Callable, Dict, Sequence, cast
+
+
+def export_tflite(
+    function: Callable[..., Any],
+    example_inputs: Sequence[Any],
+    path: str | None = None,
+    builtin_ops_only: bool = True,
+    validate: bool = True,
+    rtol: float = 1e-4,
+    atol: float = 1e-4,
+) -> bytes:
+    """
+    Converts a TensorFlow function to TFLite and validates it against eager mode.
+
+    The function would typically chain a `SegmenterTensorFlow`, a transform and the
+    inverse operations, all constructed with `export_mode=True`. The model is
+    converted for the (fixed) shapes and dtypes of the example inputs.
+
+    Args:
+        function (Callable): The function (or Keras layer) to convert.
+        example_inputs (Sequence[tf.Tensor]): Example inputs of the function, used
+            for tracing and validation.
+        path (str | None): Optional path of the TFLite file to write.
+        builtin_ops_only (bool): Whether to restrict the model to TFLite builtin
+            operators, such that it runs on the plain TFLite runtime. Conversion
+            fails if the function requires select TensorFlow operators. Defaults to
+            True.
+        validate (bool): Whether to run the converted model with the TFLite
+            interpreter and compare its outputs to eager mode. Defaults to True.
+        rtol (float): Relative tolerance of the validation. Defaults to 1e-4.
+        atol (float): Absolute tolerance of the validation. Defaults to 1e-4.
+
+    Returns:
+        bytes: The serialized TFLite model.
+
+    Raises:
+        ValueError: If the converted model does not reproduce the eager outputs.
+
+    """
+    import tensorflow as tf
+
+    example_inputs = [tf.convert_to_tensor(x) for x in example_inputs]
+    input_names = [f"input_{k}" for k in range(len(example_inputs))]
+
+    def wrapper(*inputs: tf.Tensor) -> Dict[str, Any]:
+        outputs = function(*inputs)
+        if isinstance(outputs, (tuple, list)):
+            outputs = cast(Sequence[Any], outputs)
+            return {f"output_{k}": y for k, y in enumerate(outputs)}
+        return {"output_0": outputs}
+
+    # the converter only emits a signature for functions of a trackable object, it
+    # also tracks the variables of the function if it is a module (or Keras layer)
+    module = cast(Any, tf.Module())
+    module.function = function
+    module.serve = cast(
+        Any,
+        tf.function(  # pyright: ignore
+            wrapper,
+            input_signature=[
+                tf.TensorSpec(x.shape, x.dtype, name=name)
+                for name, x in zip(input_names, example_inputs, strict=True)
+            ],
+        ),
+    )
+    concrete_function = module.serve.get_concrete_function()
+
+    converter = cast(
+        Any,
+        tf.lite.TFLiteConverter.from_concrete_functions(  # pyright: ignore
+            [concrete_function], module
+        ),
+    )
+    if builtin_ops_only:
+        converter.target_spec.supported_ops = [
+            tf.lite.OpsSet.TFLITE_BUILTINS  # pyright: ignore
+        ]
+    model = cast(bytes, converter.convert())
+
+    if path is not None:
+        with open(path, "wb") as f:
+            f.write(model)
+
+    if not validate:
+        return model
+
+    expected = wrapper(*example_inputs)
+    interpreter = cast(
+        Any,
+        tf.lite.Interpreter(model_content=model),  # pyright: ignore
+    )
+    outputs: Dict[str, NDArray[Any]] = interpreter.get_signature_runner()(
+        **{name: x.numpy() for name, x in zip(input_names, example_inputs, strict=True)}
+    )
+    for name, b in expected.items():
+        a, b = outputs[name], b.numpy()
+        if a.shape != b.shape or not np.allclose(a, b, rtol=rtol, atol=atol):
+            error = np.max(np.abs(a - b)) if a.shape == b.shape else np.inf
+            raise ValueError(
+                f"The converted output '{name}' deviates from eager mode, "
+                + f"shapes {a.shape} and {b.shape}, maximum error {error}."
+            )
+
+    return model
@@ -0,0 +1,75 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import numpy as np
+import scipy.io.wavfile
+from numpy.typing import NDArray, DTypeLike
+from typing import Tuple, Any, cast
+
+
+def read_wav(path: str, mmap: bool = True) -> Tuple[int, NDArray[Any]]:
+    """
+    Opens a WAV file as a channel-first array without decoding it into memory.
+
+    Args:
+        path (str): Path to the WAV file.
+        mmap (bool): Whether to memory-map the sample data. Defaults to True.
+
+    Returns:
+        Tuple[int, NDArray[Any]]:
+            A 2-tuple containing:
+            (sample_rate, samples), where `samples` has shape
+            (num_channels, num_samples) and the raw PCM dtype of the file.
+
+    """
+    sample_rate, data = cast(
+        Tuple[int, NDArray[Any]],
+        scipy.io.wavfile.read(path, mmap=mmap),  # pyright: ignore
+    )
+    if data.ndim == 1:
+        data = data.reshape(1, -1)
+    else:
+        data = data.T
+
+    return sample_rate, data
+
+
+def pcm_to_float(x: NDArray[Any], dtype: DTypeLike = np.float32) -> NDArray[Any]:
+    """
+    Converts PCM samples to floating point samples in the range [-1, 1).
+
+    Args:
+        x (NDArray[Any]): PCM samples as returned by `read_wav`.
+        dtype (DTypeLike): The desired floating point datatype. Defaults to float32.
+
+    Returns:
+        The converted samples.
+
+    """
+    if np.issubdtype(x.dtype, np.floating):
+        return np.asarray(x, dtype=dtype)
+
+    if x.dtype == np.uint8:
+        return np.subtract(x, 128, dtype=dtype) / 128.0
+
+    if np.issubdtype(x.dtype, np.signedinteger):
+        scale = float(2 ** (8 * x.dtype.itemsize - 1))
+        return np.divide(x, scale, dtype=dtype)
+
+    raise ValueError(f"Unsupported PCM datatype '{x.dtype}'.")
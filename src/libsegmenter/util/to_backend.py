@@ -0,0 +1,132 @@
+# Copyright (c) 2025 Niels de Koeijer, Martin Bo Møller
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import numpy as np
+from typing import Any, cast
+
+BACKENDS = ["numpy", "torch", "tensorflow", "jax"]
+
+
+def backend_of(x: Any) -> str:
+    """
+    Determines the backend an array belongs to, without importing any framework.
+
+    Args:
+        x (Any): A NumPy array, PyTorch tensor, TensorFlow tensor or JAX array.
+
+    Returns:
+        str: The backend, one of ["numpy", "torch", "tensorflow", "jax"].
+
+    Raises:
+        TypeError: If the array type is not supported.
+
+    """
+    if isinstance(x, np.ndarray):
+        return "numpy"
+
+    module = type(x).__module__.split(".")[0]
+    if module == "torch":
+        return "torch"
+    if module == "tensorflow":
+        return "tensorflow"
+    if module in {"jax", "jaxlib"}:
+        return "jax"
+
+    raise TypeError(f"Unsupported array type '{type(x).__name__}'.")
+
+
+def to_backend(x: Any, backend: str) -> Any:
+    """
+    Converts an array to another backend, without copying where possible.
+
+    CPU arrays are shared through DLPack or the `__array__` protocol. Converting a
+    torch GPU tensor to NumPy copies it to the host.
+
+    Args:
+        x (Any): A NumPy array, PyTorch tensor, TensorFlow tensor or JAX array.
+        backend (str): The target backend. Supported options:
+            ["numpy", "torch", "tensorflow", "jax"].
+
+    Returns:
+        The array of the target backend.
+
+    Raises:
+        ValueError: If an unsupported backend is specified.
+
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unsupported backend {backend}, availible: {BACKENDS}")
+
+    source = backend_of(x)
+    if source == backend:
+        return x
+
+    if backend == "numpy":
+        if source == "torch":
+            return x.detach().cpu().numpy()
+        return np.asarray(x)
+
+    if backend == "torch":
+        import torch
+
+        if source == "numpy":
+            return torch.from_numpy(x)  # pyright: ignore
+        if source == "jax":
+            return torch.from_dlpack(x)
+        import tensorflow as tf
+
+        return torch.from_dlpack(
+            tf.experimental.dlpack.to_dlpack(x)  # pyright: ignore
+        )
+
+    if backend == "jax":
+        import jax
+        import jax.numpy as jnp
+
+        if source == "torch":
+            return cast(
+                Any,
+                jax.dlpack.from_dlpack(x.detach().contiguous()),  # pyright: ignore
+            )
+        return jnp.asarray(np.asarray(x))  # pyright: ignore
+
+    import tensorflow as tf
+
+    if source == "jax":
+        return cast(
+            Any,
+            tf.experimental.dlpack.from_dlpack(x.__dlpack__()),  # pyright: ignore
+        )
+    if source == "torch":
+        return cast(
+            Any,
+            tf.experimental.dlpack.from_dlpack(  # pyright: ignore
+                x.detach().contiguous().__dlpack__()
+            ),
+        )
+    try:
+        return cast(
+            Any,
+            tf.experimental.dlpack.from_dlpack(  # pyright: ignore
+                np.ascontiguousarray(x).__dlpack__()
+            ),
+        )
+    except Exception:
+        # tensorflow refuses unaligned or read-only buffers, fall back to a copy
+        return tf.convert_to_tensor(x)
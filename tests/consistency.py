@@ -19,18 +19,22 @@
 
 import pytest
 import subprocess
+import sys
 import tempfile
 from hypothesis import given, settings, Phase
 from hypothesis import strategies as st
 
 import scipy
 import os
+import json
 import torch
 import tensorflow as tf
+import jax
+import jax.numpy as jnp
 import itertools
 import numpy as np
 from numpy.typing import NDArray
-from typing import TypeVar, Literal
+from typing import TypeVar, Literal, Tuple
 
 from libsegmenter.Segmenter import Segmenter
 from libsegmenter.Window import Window
@@ -42,6 +46,7 @@ BackendType = Literal[
     "numpy",
     "torch",
     "tensorflow",
+    "jax",
 ]
 BACKENDS: list[BackendType] = [
     "numpy",
@@ -49,6 +54,12 @@ BACKENDS: list[BackendType] = [
     "tensorflow",
 ]
 
+# backends implementing the core segment / unsegment / transform api
+CORE_BACKENDS: list[BackendType] = [
+    *BACKENDS,
+    "jax",
+]
+
 TransformType = Literal[
     "magnitude_phase",
     "spectrogram",
@@ -96,22 +107,26 @@ NUM_EXAMPLES = 2
 
 
 def as_numpy(
-    x: NDArray[T] | torch.Tensor | tf.Tensor, backend: BackendType
+    x: NDArray[T] | torch.Tensor | tf.Tensor | jax.Array, backend: BackendType
 ) -> NDArray[T]:
     if backend == "torch":
         return x.numpy() if isinstance(x, torch.Tensor) else np.array(x)  # pyright: ignore
     if backend == "tensorflow":
         return x.numpy() if isinstance(x, tf.Tensor) else np.array(x)  # pyright: ignore
+    if backend == "jax":
+        return np.asarray(x)
     return x  # pyright: ignore
 
 
 def as_backend(
     x: NDArray[T], backend: BackendType
-) -> NDArray[T] | torch.Tensor | tf.Tensor:
+) -> NDArray[T] | torch.Tensor | tf.Tensor | jax.Array:
     if backend == "torch":
         return torch.tensor(x, dtype=torch.float32)
     elif backend == "tensorflow":
         return tf.convert_to_tensor(x, dtype=tf.float32)  # pyright: ignore
+    elif backend == "jax":
+        return jnp.asarray(x, dtype=jnp.float32)
     return x
 
 
@@ -137,7 +152,7 @@ def run_octave(code: str) -> bool:
 
 
 @pytest.mark.parametrize("batched", [True, False])
-@pytest.mark.parametrize("backendA, backendB", itertools.permutations(BACKENDS, 2))
+@pytest.mark.parametrize("backendA, backendB", itertools.permutations(CORE_BACKENDS, 2))
 @settings(max_examples=NUM_EXAMPLES, phases=[Phase.generate], deadline=None)
 @given(
     segment_size=st.integers(min_value=32, max_value=64),
@@ -193,7 +208,7 @@ def test_segmenter_consistency(
 @pytest.mark.parametrize("window_name", WINDOWS)
 @pytest.mark.parametrize("scheme", ["ola", "wola"])
 @pytest.mark.parametrize("batched", [True, False])
-@pytest.mark.parametrize("backendA", BACKENDS)
+@pytest.mark.parametrize("backendA", CORE_BACKENDS)
 @settings(max_examples=NUM_EXAMPLES, phases=[Phase.generate], deadline=None)
 @given(
     num_hops=st.integers(min_value=1, max_value=32),
@@ -247,8 +262,8 @@ def test_segmenter_reconstruction(
 
 @pytest.mark.parametrize("batched", [True, False])
 @pytest.mark.parametrize("transform", TRANSFORMS)
-@pytest.mark.parametrize("backendA, backendB", itertools.permutations(BACKENDS, 2))
-@settings(max_examples=NUM_EXAMPLES, phases=[Phase.generate])
+@pytest.mark.parametrize("backendA, backendB", itertools.permutations(CORE_BACKENDS, 2))
+@settings(max_examples=NUM_EXAMPLES, phases=[Phase.generate], deadline=None)
 @given(
     segment_size=st.integers(min_value=16, max_value=32),
     hop_size=st.integers(min_value=1, max_value=32),
@@ -310,6 +325,1153 @@ def test_transform_roundtrip_consistency(
     assert np.allclose(sB, iB, atol=1e-4)  # pyright: ignore
 
 
+@pytest.mark.parametrize("batched", [True, False])
+@pytest.mark.parametrize("backendA", CORE_BACKENDS)
+@settings(max_examples=NUM_EXAMPLES, phases=[Phase.generate], deadline=None)
+@given(
+    segment_size=st.integers(min_value=16, max_value=64),
+    hop_size=st.integers(min_value=1, max_value=16),
+    num_hops=st.integers(min_value=4, max_value=32),
+    seed=st.integers(min_value=0, max_value=2**32 - 1),
+)
+def test_segmenter_sparse_frames(
+    batched: bool,
+    backendA: BackendType,
+    segment_size: int,
+    hop_size: int,
+    num_hops: int,
+    seed: int,
+) -> None:
+    np.random.seed(seed)
+
+    analysis_window: NDArray[np.float64] = np.random.randn(segment_size)
+    synthesis_window: NDArray[np.float64] = np.random.randn(segment_size)
+    window = Window(hop_size, analysis_window, synthesis_window)
+
+    if batched:
+        x: NDArray[np.float64] = np.random.randn(2, segment_size + num_hops * hop_size)
+    else:
+        x: NDArray[np.float64] = np.random.randn(segment_size + num_hops * hop_size)
+
+    segA = Segmenter(window, backend=backendA)
+    xA = as_backend(x, backendA)
+
+    s = as_numpy(segA.segment(xA), backendA)
+    num_segments = s.shape[-2]
+    frames = np.sort(np.random.choice(np.arange(1, num_segments), size=3))
+
+    sA = as_numpy(segA.segment(xA, frames=frames), backendA)
+    assert np.allclose(sA, s[..., frames, :], atol=1e-5)
+    assert np.allclose(
+        as_numpy(segA.segment(xA, frames=slice(1, None, 2)), backendA),
+        s[..., 1::2, :],
+        atol=1e-5,
+    )
+
+    # overlap-adding a sparse set equals overlap-adding all frames with the
+    # unselected frames zeroed, cropped to the span of the selection
+    dense = np.zeros_like(s)
+    for frame in frames:
+        dense[..., frame, :] += s[..., frame, :]
+    expected = as_numpy(segA.unsegment(as_backend(dense, backendA)), backendA)
+    start = frames[0] * hop_size
+    stop = frames[-1] * hop_size + segment_size
+    rA = as_numpy(segA.unsegment(as_backend(sA, backendA), frames=frames), backendA)
+    assert np.allclose(rA, expected[..., start:stop], atol=1e-5)
+
+
+@pytest.mark.parametrize("batched", [True, False])
+@pytest.mark.parametrize("backendA", CORE_BACKENDS)
+@settings(max_examples=NUM_EXAMPLES, phases=[Phase.generate], deadline=None)
+@given(
+    num_hops=st.integers(min_value=4, max_value=32),
+    seed=st.integers(min_value=0, max_value=2**32 - 1),
+)
+def test_segmenter_lazy(
+    batched: bool,
+    backendA: BackendType,
+    num_hops: int,
+    seed: int,
+) -> None:
+    np.random.seed(seed)
+
+    window = WindowSelector("hann75", "wola", 32)
+    if batched:
+        x: NDArray[np.float64] = np.random.randn(2, 32 + num_hops * window.hop_size)
+    else:
+        x: NDArray[np.float64] = np.random.randn(32 + num_hops * window.hop_size)
+
+    segA = Segmenter(window, backend=backendA)
+    xA = as_backend(x, backendA)
+
+    s = as_numpy(segA.segment(xA), backendA)
+    lazy = segA.segment_lazy(xA)
+    assert lazy.shape == s.shape
+    assert len(lazy) == s.shape[0]
+    assert np.allclose(np.asarray(lazy), s, atol=1e-5)
+
+    if batched:
+        assert np.allclose(as_numpy(lazy[1], backendA), s[1], atol=1e-5)
+        assert np.allclose(as_numpy(lazy[:, 2], backendA), s[:, 2], atol=1e-5)
+        assert np.allclose(as_numpy(lazy[0, 1:4, 3], backendA), s[0, 1:4, 3])
+    else:
+        assert np.allclose(as_numpy(lazy[-1], backendA), s[-1], atol=1e-5)
+        assert np.allclose(as_numpy(lazy[[3, 1]], backendA), s[[3, 1]], atol=1e-5)
+        assert np.allclose(as_numpy(lazy[1:4, 3], backendA), s[1:4, 3], atol=1e-5)
+
+    blocks = [as_numpy(block, backendA) for block in lazy.blocks(3)]
+    assert np.allclose(np.concatenate(blocks, axis=-2), s, atol=1e-5)
+
+
+@pytest.mark.parametrize("window_name", ["hann75", "rectangular50"])
+@pytest.mark.parametrize("batched", [True, False])
+@pytest.mark.parametrize("backendA", BACKENDS)
+@settings(max_examples=NUM_EXAMPLES, phases=[Phase.generate], deadline=None)
+@given(
+    num_samples=st.integers(min_value=64, max_value=512),
+    seed=st.integers(min_value=0, max_value=2**32 - 1),
+)
+def test_segmenter_frame_statistics(
+    window_name: WindowType,
+    batched: bool,
+    backendA: BackendType,
+    num_samples: int,
+    seed: int,
+) -> None:
+    np.random.seed(seed)
+
+    window = WindowSelector(window_name, "analysis", 64)
+    if batched:
+        x: NDArray[np.float64] = np.random.randn(2, num_samples)
+    else:
+        x: NDArray[np.float64] = np.random.randn(num_samples)
+
+    segA = Segmenter(window, backend=backendA)
+    xA = as_backend(x, backendA)
+
+    s = as_numpy(segA.segment(xA), backendA)
+    raw = Segmenter(Window(window.hop_size, np.ones(64), None)).segment(x)
+    stats = {k: as_numpy(v, backendA) for k, v in segA.frame_statistics(xA).items()}
+
+    assert np.allclose(stats["energy"], np.sum(s**2, axis=-1), atol=1e-4)
+    assert np.allclose(stats["rms"], np.sqrt(np.mean(s**2, axis=-1)), atol=1e-4)
+    assert np.allclose(stats["mean"], np.mean(s, axis=-1), atol=1e-5)
+    assert np.allclose(stats["max_abs"], np.max(np.abs(raw), axis=-1), atol=1e-5)
+
+
+@pytest.mark.parametrize("window_name", ["hann75", "rectangular50"])
+def test_segmenter_frame_statistics_integer(window_name: WindowType) -> None:
+    np.random.seed(0)
+    window = WindowSelector(window_name, "analysis", 64)
+    x = np.random.randint(-32768, 32768, size=(2, 1000)).astype(np.int16)
+    x[:, 100] = -32768
+
+    seg = Segmenter(window, backend="numpy")
+    stats = seg.frame_statistics(x)
+    expected = seg.frame_statistics(x.astype(np.float64))
+    for key, value in stats.items():
+        assert value.dtype == np.float64
+        assert np.allclose(value, expected[key])
+    assert stats["max_abs"].max() == 32768.0
+
+
+@pytest.mark.parametrize("inactive", ["passthrough", "zero"])
+@pytest.mark.parametrize("transform", TRANSFORMS)
+@pytest.mark.parametrize("backendA", BACKENDS)
+def test_gated_processor(
+    inactive: str, transform: TransformType, backendA: BackendType
+) -> None:
+    from libsegmenter.pipelines.GatedProcessor import GatedProcessor
+
+    np.random.seed(0)
+    window = WindowSelector("hann75", "wola", 64)
+    x: NDArray[np.float64] = 0.1 * np.random.randn(2, 2000)
+    x[0, 300:900] = 0.0
+    x[1, 1000:] = 1e-5 * x[1, 1000:]
+
+    gated = GatedProcessor(window, transform, backend=backendA, inactive=inactive)
+    y = as_numpy(gated.process(as_backend(x, backendA), lambda f: f), backendA)
+    assert gated.frames_skipped > 0
+    assert gated.frames_skipped < gated.frames_total
+
+    seg = Segmenter(window, backend="numpy")
+    expected = seg.unsegment(seg.segment(x))
+    if inactive == "passthrough":
+        assert np.allclose(y, expected, atol=1e-5)
+    else:
+        assert np.allclose(y[0], expected[0], atol=1e-5)
+        assert np.allclose(y[1, :900], expected[1, :900], atol=1e-5)
+        assert np.allclose(y[1, 1100:], 0.0)
+
+
+@pytest.mark.parametrize("transform", TRANSFORMS)
+@pytest.mark.parametrize("backendA", BACKENDS)
+def test_segmenter_ragged(transform: TransformType, backendA: BackendType) -> None:
+    np.random.seed(0)
+    window = WindowSelector("hann75", "wola", 64)
+    lengths = [500, 30, 1000, 64]
+    x: NDArray[np.float64] = np.random.randn(len(lengths), max(lengths))
+
+    segA = Segmenter(window, backend=backendA)
+    xA = as_backend(x, backendA)
+    expected = [
+        Segmenter(window, backend="numpy").segment(x[k, :n])
+        if n >= 64
+        else np.zeros((0, 64))
+        for k, n in enumerate(lengths)
+    ]
+
+    packedA, offsets = segA.segment_packed(xA, lengths)
+    packed = as_numpy(packedA, backendA)
+    assert np.array_equal(np.diff(offsets), [e.shape[0] for e in expected])
+    assert np.allclose(packed, np.concatenate(expected), atol=1e-5)
+
+    padded, mask = segA.segment_padded(xA, lengths)
+    mask_np = as_numpy(mask, backendA)
+    assert np.allclose(as_numpy(padded, backendA)[mask_np], packed, atol=1e-5)
+    assert np.allclose(as_numpy(padded, backendA)[~mask_np], 0.0)
+
+    # every item reconstructs as its own signal would, zero-padded to its length
+    reconstructed = []
+    for k, n in enumerate(lengths):
+        item = np.zeros(n)
+        if n >= 64:
+            segN = Segmenter(window, backend="numpy")
+            y = segN.unsegment(segN.segment(x[k, :n]))[:n]
+            item[: y.shape[-1]] = y
+        reconstructed.append(item)
+
+    for items in [
+        segA.unsegment_padded(padded, mask, lengths),
+        segA.unsegment_packed(packedA, offsets, lengths),
+    ]:
+        assert [item.shape[-1] for item in items] == lengths
+        for item, ref in zip(items, reconstructed, strict=True):
+            assert np.allclose(as_numpy(item, backendA), ref, atol=1e-5)
+
+    # masked transforms equal the full transform on the valid frames only
+    tfmA = TransformSelector(transform, backend=backendA)
+    full = tfmA.forward(padded)
+    masked = tfmA.forward(padded, mask)
+    if transform == "magnitude_phase":
+        full, masked = full[0], masked[0]
+    assert np.allclose(
+        as_numpy(masked, backendA)[mask_np],
+        as_numpy(full, backendA)[mask_np],
+        atol=1e-4,
+    )
+    assert np.allclose(as_numpy(masked, backendA)[~mask_np], 0.0)
+
+
+@pytest.mark.parametrize("window_name", ["hann50", "hann75", "blackman67"])
+@pytest.mark.parametrize("backendA", BACKENDS)
+def test_bucketing_collator(window_name: WindowType, backendA: BackendType) -> None:
+    from libsegmenter.pipelines.BucketingCollator import BucketingCollator
+
+    np.random.seed(0)
+    window = WindowSelector(window_name, "wola", 48)
+    lengths = list(np.random.randint(10, 2000, size=40))
+    signals = [np.random.randn(n) for n in lengths]
+
+    collator = BucketingCollator(window, bucket_edges=[8, 16, 32], backend=backendA)
+    segA = Segmenter(window, backend=backendA)
+    seen: list[int] = []
+    for batch in collator.batches(lengths, batch_size=6, shuffle=True, seed=0):
+        seen += batch
+        buckets = {collator.bucket(lengths[k]) for k in batch}
+        assert len(buckets) == 1
+
+        xA, nA = collator([signals[k] for k in batch])
+        x, n = as_numpy(xA, backendA), as_numpy(nA, backendA)
+        bucket = buckets.pop()
+        assert x.shape[-1] % window.hop_size == 0
+        assert x.shape[-1] >= max(lengths[k] for k in batch)
+        assert np.array_equal(n, [lengths[k] for k in batch])
+
+        s = as_numpy(segA.segment(xA), backendA)
+        assert s.shape[-2] == bucket
+        idx = as_numpy(collator.frame_indices(bucket), backendA)
+        assert np.allclose(x[:, idx] * window.analysis_window, s, atol=1e-5)
+    assert sorted(seen) == list(range(len(lengths)))
+
+    stats = collator.statistics()
+    assert stats["items"] == len(lengths)
+    assert stats["samples"] == sum(lengths)
+    assert 0.0 < stats["padding_ratio"] < 1.0
+    assert sum(b["padding"] for b in stats["buckets"].values()) == stats["padding"]
+
+
+@pytest.mark.parametrize("num_workers", [0, 2])
+@pytest.mark.parametrize("crop_frames", [None, 5])
+@pytest.mark.parametrize("seed", [0, None])
+def test_frame_dataset_torch(
+    num_workers: int, crop_frames: int | None, seed: int | None
+) -> None:
+    from libsegmenter.backends.FrameDatasetTorch import FrameDatasetTorch
+
+    np.random.seed(0)
+    window = WindowSelector("hann75", "analysis", 64)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        signals = [
+            np.random.randn(1000).astype(np.float32),
+            np.random.randn(300, 2).astype(np.float32),
+            np.random.randn(10).astype(np.float32),
+            np.random.randn(777).astype(np.float32),
+        ]
+        paths: list[str] = []
+        for k, signal in enumerate(signals):
+            paths.append(os.path.join(tmp_dir, f"{k}.wav"))
+            scipy.io.wavfile.write(paths[-1], 16000, signal)
+
+        dataset = FrameDatasetTorch(
+            paths,
+            window,
+            block_frames=7,
+            crop_frames=crop_frames,
+            crops_per_file=3,
+            shuffle_buffer=16,
+            shuffle_files=True,
+            seed=seed,
+        )
+        # forked workers hang at exit once jax or tensorflow are loaded
+        loader = torch.utils.data.DataLoader(
+            dataset,
+            batch_size=None,
+            num_workers=num_workers,
+            multiprocessing_context="spawn" if num_workers > 0 else None,
+        )
+        epochs: list[list[NDArray[np.float32]]] = []
+        for epoch in range(3):
+            dataset.set_epoch(epoch)
+            epochs.append([item.numpy() for item in loader])
+        items = epochs[0]
+
+    seg = Segmenter(window, backend="numpy")
+    frames = [seg.segment(s.reshape(s.shape[0], -1).T) for s in signals if len(s) >= 64]
+    if crop_frames is None:
+        expected = np.concatenate([f.reshape(-1, 64) for f in frames])
+        # the workers shard one shared file order, every file is read once per epoch
+        for got in epochs:
+            assert len(got) == expected.shape[0]
+            assert np.allclose(
+                np.sort(np.stack(got), axis=0), np.sort(expected, axis=0), atol=1e-5
+            )
+    else:
+        assert len(items) == 3 * 4
+        for item in items:
+            assert item.shape == (crop_frames, 64)
+            assert any(
+                np.allclose(f[c, k : k + crop_frames], item, atol=1e-5)
+                for f in frames
+                for c in range(f.shape[0])
+                for k in range(f.shape[1] - crop_frames + 1)
+            )
+
+
+@pytest.mark.parametrize("unbatch", [True, False])
+@pytest.mark.parametrize("transform", [None, *TRANSFORMS])
+@pytest.mark.parametrize("window_name", ["hann75", "blackman67"])
+def test_tf_frames(
+    unbatch: bool, transform: TransformType | None, window_name: WindowType
+) -> None:
+    from libsegmenter import tf_frames
+
+    np.random.seed(0)
+    window = WindowSelector(window_name, "analysis", 48)
+    x: NDArray[np.float32] = np.random.randn(2, 1000).astype(np.float32)
+
+    seg = Segmenter(window, backend="numpy")
+    expected = seg.segment(x)
+    if transform is not None:
+        expected = TransformSelector(transform, backend="numpy").forward(expected)
+    expected = expected[0] if transform == "magnitude_phase" else expected
+    labels = np.arange(expected.shape[0] * expected.shape[1]).reshape(
+        expected.shape[:2]
+    )
+
+    dataset = tf.data.Dataset.from_tensor_slices((x, labels))
+    dataset = dataset.apply(tf_frames(window, transform, unbatch=unbatch))
+    for k, (features, label) in enumerate(dataset):
+        features = features[0] if transform == "magnitude_phase" else features
+        if unbatch:
+            b, f = divmod(k, expected.shape[1])
+            assert np.allclose(features.numpy(), expected[b, f], atol=1e-4)
+            assert label.numpy() == labels[b, f]
+        else:
+            assert np.allclose(features.numpy(), expected[k], atol=1e-4)
+            assert np.array_equal(label.numpy(), labels[k])
+
+
+@pytest.mark.parametrize("backendA", BACKENDS)
+@pytest.mark.parametrize("backendB", BACKENDS)
+def test_segmenter_dispatch(backendA: BackendType, backendB: BackendType) -> None:
+    from libsegmenter.util.to_backend import backend_of, to_backend
+
+    np.random.seed(0)
+    window = WindowSelector("hann75", "wola", 64)
+    x: NDArray[np.float64] = np.random.randn(2, 1000)
+
+    seg = Segmenter(window, backend="auto")
+    expected = Segmenter(window, backend="numpy").segment(x)
+    for backend in [backendA, backendB]:
+        y = seg.segment(as_backend(x, backend))
+        assert backend_of(y) == backend
+        assert np.allclose(as_numpy(y, backend), expected, atol=1e-5)
+        assert backend_of(seg.unsegment(y)) == backend
+    assert seg.backend(backendA) is seg.dispatch(as_backend(x, backendA))
+
+    # conversions preserve the values and share memory on the cpu
+    frames = as_backend(expected.astype(np.float32), backendA)
+    converted = to_backend(frames, backendB)
+    assert backend_of(converted) == backendB
+    assert np.allclose(as_numpy(converted, backendB), expected, atol=1e-5)
+    if {backendA, backendB} == {"numpy", "torch"}:
+        a, b = as_numpy(frames, backendA), as_numpy(converted, backendB)
+        assert np.shares_memory(a, b)
+
+
+@pytest.mark.parametrize("transform", TRANSFORMS)
+def test_segmenter_jax_transformations(transform: TransformType) -> None:
+    np.random.seed(0)
+    window = WindowSelector("hann75", "wola", 64)
+    x: NDArray[np.float64] = np.random.randn(3, 1000)
+
+    seg = Segmenter(window, backend="jax")
+    tra = TransformSelector(transform, backend="jax")
+    expected = Segmenter(window, backend="numpy").segment(x)
+
+    # jit and vmap over the batch match the eager batched computation
+    xA = as_backend(x, "jax")
+    assert np.allclose(jax.jit(seg.segment)(xA), expected, atol=1e-5)
+    assert np.allclose(jax.vmap(seg.segment)(xA), expected, atol=1e-5)
+
+    def roundtrip(x: jax.Array) -> jax.Array:
+        features = tra.forward(seg.segment(x))
+        if transform == "magnitude_phase":
+            return seg.unsegment(tra.inverse(*features))
+        return seg.unsegment(tra.inverse(features))
+
+    r = jax.jit(jax.vmap(roundtrip))(xA)
+    assert np.allclose(r[:, 64:-64], x[:, 64 : r.shape[-1] - 64], atol=1e-4)
+
+    # the gradient of the (linear) roundtrip is the overlap-added window product,
+    # which is constant for a wola window
+    g = jax.grad(lambda x: jnp.sum(seg.unsegment(seg.segment(x))))(xA[0])
+    assert np.allclose(g[64:-64], 1.0, atol=1e-4)
+
+
+@pytest.mark.parametrize("use_numba", [False, True])
+@pytest.mark.parametrize("window_name", ["hann75", "blackman67", "rectangular50"])
+@settings(max_examples=NUM_EXAMPLES, phases=[Phase.generate], deadline=None)
+@given(
+    block_frames=st.integers(min_value=1, max_value=64),
+    seed=st.integers(min_value=0, max_value=2**32 - 1),
+)
+def test_segmenter_numpy_kernels(
+    use_numba: bool, window_name: WindowType, block_frames: int, seed: int
+) -> None:
+    from libsegmenter.backends.SegmenterNumpy import SegmenterNumpy
+
+    if use_numba:
+        pytest.importorskip("numba")
+
+    np.random.seed(seed)
+    segment_size = 66 if window_name == "blackman67" else 64
+    window = WindowSelector(window_name, "wola", segment_size)
+    x: NDArray[np.float64] = np.random.randn(2, 3000)
+
+    seg = SegmenterNumpy(window, use_numba=use_numba)
+    s = seg.segment(x)
+    expected = np.stack(
+        [
+            x[:, k * window.hop_size : k * window.hop_size + segment_size]
+            * window.analysis_window
+            for k in range(s.shape[-2])
+        ],
+        axis=-2,
+    )
+    assert np.allclose(s, expected)
+
+    r = seg.unsegment(s)
+    assert np.allclose(r, SegmenterNumpy(window, use_numba=False).unsegment(s))
+
+    # fused processing equals processing all frames at once
+    p = seg.process(x, lambda f: 0.5 * f, block_frames=block_frames)
+    assert np.allclose(p, 0.5 * r)
+
+
+@pytest.mark.parametrize("dtype", [np.float16, np.float32, np.float64, np.longdouble])
+def test_segmenter_numpy_kernels_dtypes(dtype: type) -> None:
+    from libsegmenter.backends.SegmenterNumpy import SegmenterNumpy
+
+    pytest.importorskip("numba")
+
+    # numba is only imported once its kernels are used; the child process
+    # imports the same libsegmenter as this one, installed or not
+    package_root = os.path.dirname(
+        os.path.dirname(os.path.abspath(sys.modules["libsegmenter"].__file__ or ""))
+    )
+    pythonpath = os.pathsep.join(
+        [package_root] + [p for p in [os.environ.get("PYTHONPATH")] if p]
+    )
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; import libsegmenter.backends.SegmenterNumpy; "
+            + "assert 'numba' not in sys.modules",
+        ],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": pythonpath},
+    )
+    assert result.returncode == 0, result.stderr
+
+    np.random.seed(0)
+    window = WindowSelector("hann75", "wola", 64)
+    x = np.random.randn(2, 1000).astype(dtype)
+
+    seg = SegmenterNumpy(window, use_numba=True)
+    reference = SegmenterNumpy(window, use_numba=False)
+    y = seg.segment(x)
+    assert y.dtype == dtype
+    assert np.array_equal(y, reference.segment(x))
+    assert np.array_equal(seg.unsegment(y), reference.unsegment(y))
+
+
+@pytest.mark.parametrize("window_name", ["hann75", "blackman67"])
+@pytest.mark.parametrize("transform", TRANSFORMS)
+def test_export_onnx(window_name: WindowType, transform: TransformType) -> None:
+    pytest.importorskip("onnxruntime")
+    from libsegmenter.util.export_onnx import export_onnx
+
+    np.random.seed(0)
+    segment_size = 66 if window_name == "blackman67" else 64
+    window = WindowSelector(window_name, "wola", segment_size)
+    x: NDArray[np.float64] = np.random.randn(2, 2000)
+
+    # the export mode reproduces the eager computations
+    seg = Segmenter(window, backend="torch")
+    seg_export = Segmenter(window, backend="torch", export_mode=True)
+    tra = TransformSelector(transform, backend="torch")
+    tra_export = TransformSelector(transform, backend="torch", export_mode=True)
+
+    xA = as_backend(x, "torch")
+    s = seg.segment(xA)
+    assert np.allclose(seg_export.segment(xA).numpy(), s.numpy(), atol=1e-5)
+    assert np.allclose(seg_export.unsegment(s).numpy(), seg.unsegment(s), atol=1e-5)
+    if transform == "spectrogram":
+        y = tra_export.forward(s)
+        assert np.allclose(torch.view_as_complex(y), tra.forward(s), atol=1e-4)
+        assert np.allclose(tra_export.inverse(y), s, atol=1e-4)
+    else:
+        magnitude, phase = tra_export.forward(s)
+        assert np.allclose(magnitude, tra.forward(s)[0], atol=1e-4)
+        assert np.allclose(tra_export.inverse(magnitude, phase), s, atol=1e-4)
+
+    class Chain(torch.nn.Module):
+        def __init__(self) -> None:
+            super().__init__()
+            self.segmenter = seg_export
+
+        def forward(self, x: torch.Tensor) -> torch.Tensor:
+            features = tra_export.forward(self.segmenter.segment(x))
+            if transform == "magnitude_phase":
+                y = tra_export.inverse(0.5 * features[0], features[1])
+            else:
+                y = tra_export.inverse(0.5 * features)
+            return self.segmenter.unsegment(y)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        export_onnx(
+            Chain(),
+            [xA],
+            os.path.join(tmp_dir, "chain.onnx"),
+            input_names=["x"],
+            dynamic_axes={"x": {0: "batch"}},
+        )
+
+
+@pytest.mark.parametrize("window_name", ["hann75", "blackman67"])
+@pytest.mark.parametrize("transform", TRANSFORMS)
+def test_export_tflite(window_name: WindowType, transform: TransformType) -> None:
+    from libsegmenter.util.export_tflite import export_tflite
+
+    np.random.seed(0)
+    segment_size = 66 if window_name == "blackman67" else 64
+    window = WindowSelector(window_name, "wola", segment_size)
+    x: NDArray[np.float64] = np.random.randn(2, 2000)
+
+    # the export mode reproduces the eager computations
+    seg = Segmenter(window, backend="tensorflow")
+    seg_export = Segmenter(window, backend="tensorflow", export_mode=True)
+    tra = TransformSelector(transform, backend="tensorflow")
+    tra_export = TransformSelector(transform, backend="tensorflow", export_mode=True)
+
+    xA = as_backend(x, "tensorflow")
+    s = seg.segment(xA)
+    assert np.allclose(seg_export.segment(xA), s, atol=1e-5)
+    assert np.allclose(seg_export.unsegment(s), seg.unsegment(s), atol=1e-5)
+    if transform == "spectrogram":
+        y = tra_export.forward(s)
+        reference = tra.forward(s)
+        assert np.allclose(y[..., 0], tf.math.real(reference), atol=1e-4)
+        assert np.allclose(y[..., 1], tf.math.imag(reference), atol=1e-4)
+        assert np.allclose(tra_export.inverse(y), s, atol=1e-4)
+    else:
+        magnitude, phase = tra_export.forward(s)
+        assert np.allclose(magnitude, tra.forward(s)[0], atol=1e-4)
+        assert np.allclose(tra_export.inverse(magnitude, phase), s, atol=1e-4)
+
+    def chain(x: tf.Tensor) -> tf.Tensor:
+        features = tra_export.forward(seg_export.segment(x))
+        if transform == "magnitude_phase":
+            y = tra_export.inverse(0.5 * features[0], features[1])
+        else:
+            y = tra_export.inverse(0.5 * features)
+        return seg_export.unsegment(y)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "chain.tflite")
+        model = export_tflite(chain, [xA], path)
+        assert os.path.getsize(path) == len(model)
+
+
+@pytest.mark.parametrize("window_name", ["hann75", "blackman67"])
+@pytest.mark.parametrize("transform", TRANSFORMS)
+def test_segmenter_torch_compile(
+    window_name: WindowType, transform: TransformType
+) -> None:
+    np.random.seed(0)
+    segment_size = 66 if window_name == "blackman67" else 64
+    window = WindowSelector(window_name, "wola", segment_size)
+    seg = Segmenter(window, backend="torch")
+    tra = TransformSelector(transform, backend="torch")
+
+    def chain(x: torch.Tensor) -> torch.Tensor:
+        features = tra.forward(seg.segment(x))
+        if transform == "magnitude_phase":
+            return seg.unsegment(tra.inverse(0.5 * features[0], features[1]))
+        return seg.unsegment(tra.inverse(0.5 * features))
+
+    x = as_backend(np.random.randn(2, 2000), "torch")
+    explanation = torch._dynamo.explain(chain)(x)  # pyright: ignore
+    assert explanation.graph_break_count == 0
+    assert explanation.graph_count == 1
+
+    # a single dynamic graph serves all signal lengths
+    torch._dynamo.reset()  # pyright: ignore
+    compiled = torch.compile(chain, fullgraph=True, dynamic=True)
+    for num_samples in [2000, 2345, 4096]:
+        x = as_backend(np.random.randn(2, num_samples), "torch")
+        with torch._dynamo.config.patch(  # pyright: ignore
+            error_on_recompile=num_samples != 2000
+        ):
+            y = compiled(x)
+        assert np.allclose(y.numpy(), chain(x).numpy(), atol=1e-4)
+
+    # the windows keep their native dtype, so double inputs keep full precision
+    x = np.random.randn(2, 2000)
+    expected = Segmenter(window, backend="numpy").segment(x)
+    y = seg.segment(torch.from_numpy(x)).numpy()
+    assert np.allclose(y, expected, rtol=0.0, atol=1e-12)
+
+
+@pytest.mark.parametrize("batched", [True, False])
+@pytest.mark.parametrize("backendA", ["numpy", "torch"])
+def test_multi_resolution_stft(batched: bool, backendA: BackendType) -> None:
+    from libsegmenter.transforms.MultiResolutionSTFT import MultiResolutionSTFT
+
+    np.random.seed(0)
+    windows = [
+        WindowSelector("hann75", "wola", 64),
+        WindowSelector("hann75", "wola", 128),
+        WindowSelector("hann75", "wola", 256),
+        WindowSelector("hann50", "wola", 64),
+        WindowSelector("blackman67", "wola", 66),
+    ]
+    x = np.random.randn(3, 3001) if batched else np.random.randn(3001)
+    stft = MultiResolutionSTFT(windows=windows, backend=backendA)
+    tra = TransformSelector("spectrogram", backend=backendA)
+
+    xA = as_backend(x, backendA)
+    ys = stft.forward(xA)
+    assert len(ys) == len(windows)
+    for window, y in zip(windows, ys, strict=True):
+        reference = tra.forward(Segmenter(window, backend=backendA).segment(xA))
+        assert y.shape == reference.shape
+        assert np.allclose(
+            as_numpy(y, backendA), as_numpy(reference, backendA), atol=1e-4
+        )
+
+    if backendA == "torch":
+        # gradients of all resolutions accumulate into the signal
+        xA.requires_grad_(True)
+        sum(y.abs().sum() for y in stft.forward(xA)).backward()
+        xB = as_backend(x, backendA).requires_grad_(True)
+        sum(
+            tra.forward(Segmenter(window, backend=backendA).segment(xB)).abs().sum()
+            for window in windows
+        ).backward()
+        assert np.allclose(xA.grad, xB.grad, atol=1e-3)
+
+
+@pytest.mark.parametrize("power", [1.0, 2.0])
+@pytest.mark.parametrize("backendA", BACKENDS)
+def test_mel(power: float, backendA: BackendType) -> None:
+    from libsegmenter.transforms.mel.common import compute_mel_filterbank
+
+    np.random.seed(0)
+    window = WindowSelector("hann75", "wola", 256)
+    x = np.random.randn(2, 4000)
+    segments = Segmenter(window).segment(x)
+    spectrum = np.fft.rfft(segments)
+
+    # the banded filterbank equals the dense product
+    tra = TransformSelector(
+        "mel",
+        backend=backendA,
+        window=window,
+        sample_rate=16000,
+        n_mels=40,
+        power=power,
+    )
+    y = as_numpy(tra.forward(as_backend(segments, backendA)), backendA)
+    filterbank = compute_mel_filterbank(16000, 256, 40, 0.0, None)
+    assert y.shape == (2, segments.shape[1], 40)
+    assert np.allclose(
+        y, np.abs(spectrum) ** power @ filterbank.T, rtol=1e-3, atol=1e-3
+    )
+
+    # the pseudo-inverse estimates the magnitude, the phase completes the segments
+    magnitude = as_numpy(tra.inverse(as_backend(y, backendA)), backendA)
+    assert magnitude.shape == spectrum.shape
+    assert np.all(magnitude >= 0.0)
+    z = as_numpy(
+        tra.inverse(as_backend(y, backendA), as_backend(np.angle(spectrum), backendA)),
+        backendA,
+    )
+    assert np.allclose(
+        z, np.fft.irfft(magnitude * np.exp(1j * np.angle(spectrum))), atol=1e-3
+    )
+
+
+@pytest.mark.parametrize("batched", [True, False])
+@pytest.mark.parametrize("window_name", ["hann50", "bartlett50"])
+@pytest.mark.parametrize("backendA", BACKENDS)
+def test_mdct(batched: bool, window_name: WindowType, backendA: BackendType) -> None:
+    np.random.seed(0)
+    segment_size = 64
+    window = WindowSelector(window_name, "wola", segment_size)
+    x = np.random.randn(2, 3000) if batched else np.random.randn(3000)
+
+    seg = Segmenter(window, backend=backendA)
+    tra = TransformSelector("mdct", backend=backendA)
+    xA = as_backend(x, backendA)
+    s = seg.segment(xA)
+    y = tra.forward(s)
+
+    # critically sampled, and equal to the definition of the transform
+    n = np.arange(segment_size)
+    k = np.arange(segment_size // 2)
+    kernel = np.cos(
+        2.0 * np.pi / segment_size * np.outer(k + 0.5, n + segment_size // 4)
+    )
+    assert y.shape[-1] == segment_size // 2
+    assert np.allclose(
+        as_numpy(y, backendA), as_numpy(s, backendA) @ kernel.T, atol=1e-4
+    )
+
+    # the time-domain aliasing cancels in the overlap-add
+    r = as_numpy(seg.unsegment(tra.inverse(y)), backendA)
+    assert np.allclose(
+        x[..., segment_size : r.shape[-1] - segment_size],
+        r[..., segment_size:-segment_size],
+        atol=1e-4,
+    )
+
+
+@pytest.mark.parametrize("num_folds", [1, 4])
+@pytest.mark.parametrize("backendA", BACKENDS)
+def test_polyphase(num_folds: int, backendA: BackendType) -> None:
+    np.random.seed(0)
+    fft_size = 32
+    segment_size = num_folds * fft_size
+    n = np.arange(segment_size)
+    prototype = np.sinc((n - segment_size / 2) / fft_size) * np.kaiser(segment_size, 8)
+    window = Window(fft_size // 4, prototype, prototype)
+    x = np.random.randn(2, 3000)
+
+    seg = Segmenter(window, backend=backendA)
+    tra = TransformSelector("polyphase", backend=backendA, window=window, fft_size=32)
+    s = seg.segment(as_backend(x, backendA))
+    y = tra.forward(s)
+
+    # the folded FFT samples the spectrum of the long segment
+    spectrum = np.fft.rfft(as_numpy(s, backendA))
+    assert y.shape[-1] == fft_size // 2 + 1
+    assert np.allclose(as_numpy(y, backendA), spectrum[..., ::num_folds], atol=1e-3)
+
+    # the inverse repeats the FFT sized block over the segment
+    z = as_numpy(tra.inverse(y), backendA)
+    folded = as_numpy(s, backendA).reshape(2, -1, num_folds, fft_size).sum(axis=-2)
+    assert z.shape[-1] == segment_size
+    assert np.allclose(z, np.tile(folded, num_folds), atol=1e-4)
+
+    with pytest.raises(ValueError):
+        TransformSelector("polyphase", backend=backendA, window=window, fft_size=48)
+
+
+@pytest.mark.parametrize("method", ["auto", "dft", "czt", "rfft"])
+@pytest.mark.parametrize("backendA", ["numpy", "torch"])
+def test_partial_spectrum(method: str, backendA: BackendType) -> None:
+    from libsegmenter.transforms.PartialSpectrum import PartialSpectrum
+
+    np.random.seed(0)
+    window = WindowSelector("hann75", "wola", 256)
+    x = np.random.randn(2, 3000)
+    segA = Segmenter(window, backend=backendA)
+    s = segA.segment(as_backend(x, backendA))
+    spectrum = np.fft.rfft(as_numpy(s, backendA))
+
+    # integer bins match the spectrogram
+    bins = [[3, 17, 128], list(range(10, 41))]
+    if method == "czt":
+        bins = bins[1:]
+    for b in bins:
+        tra = PartialSpectrum(backendA, window, bins=b, method=method)
+        y = as_numpy(tra.forward(s), backendA)
+        assert np.allclose(y, spectrum[..., b], atol=1e-3)
+
+    # a band with fractional bins evaluates the DTFT of the segment
+    if method != "rfft":
+        tra = PartialSpectrum(
+            backendA, window, band=(10.0, 12.0), num_bins=9, method=method
+        )
+        n = np.arange(256)[:, np.newaxis]
+        dtft = np.exp(-2j * np.pi * n * np.linspace(10.0, 12.0, 9) / 256)
+        y = as_numpy(tra.forward(s), backendA)
+        assert np.allclose(y, as_numpy(s, backendA) @ dtft, atol=1e-3)
+
+    # masked frames are zero
+    tra = PartialSpectrum(backendA, window, band=(10.0, 40.0), method=method)
+    padded, mask = segA.segment_padded(as_backend(x, backendA), [3000, 1000])
+    mask_np = as_numpy(mask, backendA)
+    y = as_numpy(tra.forward(padded, mask), backendA)
+    assert np.allclose(y[mask_np], spectrum[..., 10:41][mask_np], atol=1e-3)
+    assert np.allclose(y[~mask_np], 0.0)
+
+    with pytest.raises(ValueError):
+        PartialSpectrum(backendA, window, band=(10.0, 11.0), num_bins=3, method="rfft")
+    with pytest.raises(ValueError):
+        PartialSpectrum(backendA, window, bins=[3, 5, 11], method="czt")
+    with pytest.raises(ValueError, match="range from -1 to 200"):
+        PartialSpectrum(backendA, window, bins=[3, -1, 200, 5])
+
+
+@pytest.mark.parametrize("hop_size", [1, 5, 16])
+@pytest.mark.parametrize(
+    "window_type",
+    [("hann75", "analysis"), ("hamming50", "ola"), ("blackman67", "analysis")],
+)
+def test_sliding_dft(window_type: Tuple[str, str], hop_size: int) -> None:
+    from libsegmenter.transforms.SlidingDFT import SlidingDFT
+
+    np.random.seed(0)
+    window = WindowSelector(*window_type, 96)
+    x = np.random.randn(2, 3000)
+    segments = Segmenter(Window(hop_size, window.analysis_window, None)).segment(x)
+    reference = np.fft.rfft(segments)
+
+    # re-anchored every 50 frames
+    sdft = SlidingDFT("numpy", window, hop_size=hop_size, anchor_interval=50)
+    assert np.allclose(sdft.forward(x), reference, atol=1e-4)
+    assert np.allclose(sdft.forward(x[0]), reference[0], atol=1e-4)
+
+    # streaming in chunks of varying size, including chunks smaller than the hop
+    for splits in [[1, 7, 200, 201, 1500], list(range(100, 3000))]:
+        sdft.reset()
+        chunks = np.split(x, splits, axis=-1)
+        y = np.concatenate([sdft.process(chunk) for chunk in chunks], axis=-2)
+        assert np.allclose(y[:, : reference.shape[-2]], reference, atol=1e-4)
+
+    bins = [0, 3, 47, 48]
+    sdft = SlidingDFT("numpy", window, hop_size=hop_size, bins=bins)
+    assert np.allclose(sdft.forward(x), reference[..., bins], atol=1e-4)
+
+    with pytest.raises(ValueError):
+        SlidingDFT("numpy", WindowSelector("hann75", "wola", 96))
+
+
+@pytest.mark.parametrize("momentum", [0.0, 0.99])
+@pytest.mark.parametrize("backendA", ["numpy", "torch"])
+def test_griffin_lim(momentum: float, backendA: BackendType) -> None:
+    from libsegmenter.pipelines.GriffinLim import GriffinLim
+
+    np.random.seed(0)
+    window = WindowSelector("hann75", "wola", 256)
+    t = np.arange(8000) / 8000
+    x = np.stack([np.sin(2 * np.pi * 300 * t * (1 + t)), np.random.randn(8000)])
+
+    segA = Segmenter(window, backend=backendA)
+    magnitude, phase = TransformSelector("magnitude_phase", backend=backendA).forward(
+        segA.segment(as_backend(x, backendA))
+    )
+
+    # a consistent spectrogram is a fixed point, away from the (inconsistent) edges
+    gl = GriffinLim(backendA, window, num_iterations=2, momentum=momentum)
+    interior = slice(1024, -1024)
+    y = as_numpy(gl.forward(magnitude, phase), backendA)
+    assert np.allclose(y[:, interior], x[:, interior], atol=1e-3)
+    y = as_numpy(gl.forward(magnitude[0], phase[0]), backendA)
+    assert np.allclose(y[interior], x[0, interior], atol=1e-3)
+
+    # from random phases the spectral convergence decreases
+    gl = GriffinLim(backendA, window, num_iterations=64, momentum=momentum)
+    gl.forward(magnitude)
+    assert gl.iterations == 64
+    assert np.all(as_numpy(gl.spectral_convergence, backendA) < 0.3)
+
+    gl = GriffinLim(backendA, window, num_iterations=64, momentum=momentum, tol=0.1)
+    gl.forward(magnitude)
+    assert gl.iterations < 64
+
+    with pytest.raises(ValueError):
+        GriffinLim(backendA, WindowSelector("hann75", "analysis", 256))
+
+
+@pytest.mark.parametrize("method", ["overlap_save", "overlap_add"])
+@pytest.mark.parametrize("backendA", ["numpy", "torch"])
+def test_fft_convolution(method: str, backendA: BackendType) -> None:
+    from libsegmenter.pipelines.FFTConvolution import FFTConvolution
+    from libsegmenter.pipelines.fft_convolution.common import compute_fft_size
+
+    np.random.seed(0)
+    for num_samples, num_taps in [(3000, 1), (3000, 100), (500, 2000)]:
+        x = np.random.randn(3, num_samples)
+        filters = np.random.randn(3, num_taps)
+
+        # a shared filter, and a filter per batch item
+        for h in [filters[0], filters]:
+            reference = np.stack(
+                [np.convolve(x[k], h if h.ndim == 1 else h[k]) for k in range(3)]
+            )
+            for fft_size in [None, 2 * num_taps + 2]:
+                conv = FFTConvolution(
+                    backendA, as_backend(h, backendA), method=method, fft_size=fft_size
+                )
+                y = as_numpy(conv.forward(as_backend(x, backendA)), backendA)
+                assert y.shape == reference.shape
+                assert np.allclose(y, reference, atol=1e-3)
+
+                if h.ndim == 1:
+                    y = conv.forward(as_backend(x[0], backendA))
+                    assert np.allclose(as_numpy(y, backendA), reference[0], atol=1e-3)
+
+    # a single block for short signals, blocks of a few filter lengths otherwise
+    assert compute_fft_size(100, 100) == 256
+    assert 2048 < compute_fft_size(10**6, 1000) < 10**6
+
+    with pytest.raises(ValueError):
+        FFTConvolution(backendA, as_backend(filters, backendA)).forward(
+            as_backend(x[:2], backendA)
+        )
+
+
+@pytest.mark.parametrize("num_workers", [0, 2])
+@pytest.mark.parametrize("transform", TRANSFORMS)
+def test_batch_extract(num_workers: int, transform: TransformType) -> None:
+    from libsegmenter.pipelines.batch_extract import batch_extract, load_features
+
+    np.random.seed(0)
+    segment_size = 64
+    window = WindowSelector("hann75", "analysis", segment_size)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        signals = [
+            np.random.randn(1000).astype(np.float32),
+            np.random.randn(300, 2).astype(np.float32),
+            np.random.randn(10).astype(np.float32),
+        ]
+        paths: list[str] = []
+        for k, signal in enumerate(signals):
+            paths.append(os.path.join(tmp_dir, f"{k}.wav"))
+            scipy.io.wavfile.write(paths[-1], 16000, signal)
+
+        progress: list[int] = []
+        output_dir = os.path.join(tmp_dir, "features")
+        manifest = batch_extract(
+            paths,
+            output_dir,
+            "hann75",
+            "analysis",
+            segment_size,
+            transform=transform,
+            num_workers=num_workers,
+            progress=lambda done, _: progress.append(done),
+        )
+        assert manifest["completed"] == [0, 1, 2]
+        assert progress[-1] == len(paths)
+
+        seg = Segmenter(window, backend="numpy")
+        tra = TransformSelector(transform=transform, backend="numpy")
+        for k, signal in enumerate(signals[:2]):
+            expected = tra.forward(seg.segment(signal.reshape(signal.shape[0], -1).T))
+            if transform == "spectrogram":
+                expected = (expected,)
+            for a, b in zip(load_features(output_dir, k), expected, strict=True):
+                assert np.allclose(a, b, atol=1e-4)
+
+        # resuming a finished extraction is a no-op
+        progress.clear()
+        batch_extract(
+            paths,
+            output_dir,
+            "hann75",
+            "analysis",
+            segment_size,
+            transform=transform,
+            num_workers=num_workers,
+            progress=lambda done, _: progress.append(done),
+        )
+        assert progress == []
+
+        # an interrupted extraction keeps the finished files and resumes the others
+        def interrupt(done: int, total: int) -> None:
+            raise RuntimeError("interrupted")
+
+        resumed_dir = os.path.join(tmp_dir, "resumed")
+        with pytest.raises(RuntimeError, match="interrupted"):
+            batch_extract(
+                paths,
+                resumed_dir,
+                "hann75",
+                "analysis",
+                segment_size,
+                transform=transform,
+                num_workers=num_workers,
+                progress=interrupt,
+            )
+        with open(os.path.join(resumed_dir, "manifest.json")) as f:
+            interrupted = json.load(f)["completed"]
+        assert 2 in interrupted and len(interrupted) == 2
+
+        manifest = batch_extract(
+            paths,
+            resumed_dir,
+            "hann75",
+            "analysis",
+            segment_size,
+            transform=transform,
+            num_workers=num_workers,
+            progress=lambda done, _: progress.append(done),
+        )
+        assert manifest["completed"] == [0, 1, 2]
+        assert progress == [len(paths)]
+        for k in range(2):
+            for a, b in zip(
+                load_features(resumed_dir, k), load_features(output_dir, k), strict=True
+            ):
+                assert np.array_equal(a, b)
+
+
+@pytest.mark.parametrize("transform", TRANSFORMS)
+def test_feature_cache(transform: TransformType) -> None:
+    from libsegmenter.storage.FeatureCache import FeatureCache
+
+    np.random.seed(0)
+    window = WindowSelector("hann75", "analysis", 64)
+    seg = Segmenter(window, backend="numpy")
+    tra = TransformSelector(transform=transform, backend="numpy")
+
+    x = np.random.randn(2, 1000)
+    expected = tra.forward(seg.segment(x))
+    if transform == "spectrogram":
+        expected = (expected,)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = FeatureCache(tmp_dir, window, transform=transform)
+        cache(x)
+        y = cache(x)
+        assert cache.hits == 1 and cache.misses == 1
+        if transform == "spectrogram":
+            y = (y,)
+        for a, b in zip(y, expected, strict=True):
+            assert isinstance(a, np.memmap) and not a.flags.writeable
+            assert np.allclose(a, b)
+
+        # a different window is a different entry
+        FeatureCache(tmp_dir, WindowSelector("hann50", "analysis", 64), transform)(x)
+        assert len(os.listdir(tmp_dir)) == 2
+
+        # least recently used entries are evicted
+        small = FeatureCache(tmp_dir, window, transform=transform, max_bytes=1)
+        small(x[:1])
+        assert len(os.listdir(tmp_dir)) == 1
+        small(x[:1])
+        assert small.hits == 1
+
+
+@pytest.mark.parametrize("dtype", ["uint8", "uint16", "float16"])
+def test_quantized_spectrogram(dtype: str) -> None:
+    from libsegmenter.storage.QuantizedSpectrogram import (
+        write_quantized_spectrogram,
+        QuantizedSpectrogramReader,
+    )
+
+    np.random.seed(0)
+    window = WindowSelector("hann50", "wola", 64)
+    seg = Segmenter(window, backend="numpy")
+    tra = TransformSelector(transform="magnitude_phase", backend="numpy")
+    magnitude, phase = tra.forward(seg.segment(np.random.randn(4096)))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "features.bin")
+        write_quantized_spectrogram(path, magnitude, phase, dtype=dtype, chunk_size=16)
+        reader = QuantizedSpectrogramReader(path)
+        assert len(reader) == magnitude.shape[0]
+
+        # decoding a range matches decoding everything
+        full_magnitude, full_phase = reader.read()
+        part_magnitude, part_phase = reader.read(21, 70)
+        assert full_phase is not None and part_phase is not None
+        assert np.array_equal(full_magnitude[21:70], part_magnitude)
+        assert np.array_equal(full_phase[21:70], part_phase)
+
+        tolerance = {"uint8": 0.1, "uint16": 1e-3, "float16": 1e-2}[dtype]
+        assert np.allclose(np.log(full_magnitude), np.log(magnitude), atol=tolerance)
+        assert np.allclose(
+            np.exp(1j * full_phase),
+            np.exp(1j * phase),
+            atol=4.0 * tolerance,
+        )
+
+        # the decoded layout feeds straight into the inverse transform
+        reconstructed = seg.unsegment(tra.inverse(full_magnitude, full_phase))
+        assert reconstructed.shape == seg.unsegment(tra.inverse(magnitude, phase)).shape
+
+        # batched spectrograms are stored item after item, with their shape
+        batched_magnitude, batched_phase = tra.forward(
+            seg.segment(np.random.randn(3, 4096))
+        )
+        write_quantized_spectrogram(
+            path, batched_magnitude, batched_phase, dtype=dtype, chunk_size=16
+        )
+        reader = QuantizedSpectrogramReader(path)
+        assert reader.shape == batched_magnitude.shape
+        assert len(reader) == 3 * batched_magnitude.shape[1]
+        full_magnitude, full_phase = reader.read()
+        assert full_phase is not None
+        assert np.allclose(
+            np.log(full_magnitude.reshape(reader.shape)),
+            np.log(batched_magnitude),
+            atol=tolerance,
+        )
+        item_magnitude, _ = reader.read(reader.shape[1], 2 * reader.shape[1])
+        assert np.array_equal(item_magnitude, full_magnitude.reshape(reader.shape)[1])
+
+
 # we have a special case for octave
 @pytest.mark.parametrize("batched", [True, False])
 @settings(max_examples=NUM_EXAMPLES, phases=[Phase.generate], deadline=None)